@@ -0,0 +1,39 @@
+"""Benchmarks for nc-time-axis, run with airspeed velocity (asv)."""
+
+import tracemalloc
+
+import cftime
+import numpy as np
+
+import nc_time_axis
+
+#: The units of the numeric values of the benchmark dates.
+UNITS = "hours since 1850-01-01"
+
+#: The calendars of the date types in nc_time_axis.CFTIME_TYPES.
+CALENDARS = sorted(
+    {date_type(2000, 1, 1).calendar for date_type in nc_time_axis.CFTIME_TYPES}
+)
+
+
+def dates(size, calendar):
+    """Return an array of *size* hourly dates in *calendar*."""
+    return cftime.num2date(np.arange(size), UNITS, calendar=calendar)
+
+
+def peak_allocated(func, *args):
+    """Return the peak number of bytes allocated while calling *func*.
+
+    Only the allocations made during the call are traced by
+    :py:mod:`tracemalloc`, which includes the buffers of numpy arrays, so the
+    inputs built by ``setup`` are not counted, unlike with asv's ``peakmem_``
+    benchmarks, which measure the peak memory of the whole process.
+
+    """
+    tracemalloc.start()
+    try:
+        func(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
@@ -0,0 +1,36 @@
+"""Benchmarks of the conversion of dates by NetCDFTimeConverter."""
+
+from nc_time_axis import NetCDFTimeConverter
+
+from . import CALENDARS, dates, peak_allocated
+
+SIZES = [100, 10_000, 1_000_000, 10_000_000]
+
+
+class Convert:
+    params = [SIZES, CALENDARS]
+    param_names = ["size", "calendar"]
+    timeout = 600
+
+    def setup(self, size, calendar):
+        self.dates = dates(size, calendar)
+
+    def time_convert(self, size, calendar):
+        NetCDFTimeConverter.convert(self.dates, None, None)
+
+    def track_convert_allocated(self, size, calendar):
+        return peak_allocated(NetCDFTimeConverter.convert, self.dates, None, None)
+
+    track_convert_allocated.unit = "bytes"
+
+
+class DefaultUnits:
+    params = [SIZES, CALENDARS]
+    param_names = ["size", "calendar"]
+    timeout = 600
+
+    def setup(self, size, calendar):
+        self.dates = dates(size, calendar)
+
+    def time_default_units(self, size, calendar):
+        NetCDFTimeConverter.default_units(self.dates, None)
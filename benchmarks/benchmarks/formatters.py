@@ -0,0 +1,44 @@
+"""Benchmarks of the tick labels of the cftime formatters."""
+
+import numpy as np
+
+from nc_time_axis import AutoCFTimeFormatter, CFTimeFormatter, NetCDFTimeDateLocator
+
+from . import CALENDARS
+from .locator import SPANS
+
+TICKS = 100
+
+
+class AutoFormatter:
+    params = [list(SPANS), CALENDARS]
+    param_names = ["resolution", "calendar"]
+
+    def setup(self, resolution, calendar):
+        locator = NetCDFTimeDateLocator(5, calendar)
+        locator.resolution = resolution
+        self.formatter = AutoCFTimeFormatter(locator, calendar)
+        self.ticks = np.linspace(0, SPANS[resolution], TICKS)
+
+    def time_format_ticks(self, resolution, calendar):
+        self.formatter.format_ticks(self.ticks)
+
+    def time_call(self, resolution, calendar):
+        for tick in self.ticks:
+            self.formatter(tick)
+
+
+class Formatter:
+    params = [["%Y", "%Y-%m-%d %H:%M:%S", "%H:%M:%S.%f", "%b %Y"], CALENDARS]
+    param_names = ["format", "calendar"]
+
+    def setup(self, fmt, calendar):
+        self.formatter = CFTimeFormatter(fmt, calendar)
+        self.ticks = np.linspace(0, 36_500, TICKS)
+
+    def time_format_ticks(self, fmt, calendar):
+        self.formatter.format_ticks(self.ticks)
+
+    def time_call(self, fmt, calendar):
+        for tick in self.ticks:
+            self.formatter(tick)
@@ -0,0 +1,35 @@
+"""Benchmarks of the tick locations of NetCDFTimeDateLocator."""
+
+from nc_time_axis import NetCDFTimeDateLocator
+
+from . import CALENDARS
+
+# The view intervals, in days, for which the locator picks each resolution.
+SPANS = {
+    "SECONDLY": 0.002,
+    "MINUTELY": 0.1,
+    "HOURLY": 1,
+    "DAILY": 30,
+    "MONTHLY": 365,
+    "YEARLY": 36_500,
+}
+
+
+class TickValues:
+    params = [list(SPANS), CALENDARS]
+    param_names = ["resolution", "calendar"]
+
+    def setup(self, resolution, calendar):
+        self.locator = NetCDFTimeDateLocator(5, calendar)
+        self.vmin = 1000.25
+        self.vmax = self.vmin + SPANS[resolution]
+        self.locator.tick_values(self.vmin, self.vmax)
+        if self.locator.resolution != resolution:
+            raise NotImplementedError(resolution)
+
+    def time_tick_values(self, resolution, calendar):
+        self.locator.tick_cache_clear()
+        self.locator.tick_values(self.vmin, self.vmax)
+
+    def time_tick_values_cached(self, resolution, calendar):
+        self.locator.tick_values(self.vmin, self.vmax)
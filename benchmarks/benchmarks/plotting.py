@@ -0,0 +1,52 @@
+"""End-to-end benchmarks of rendering figures with cftime axes."""
+
+import io
+
+import matplotlib
+
+matplotlib.use("agg")
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+from . import dates, peak_allocated
+
+# The calendar and number of hourly dates of each panel, spanning resolutions
+# from hourly to yearly ticks.
+PANELS = [
+    ("360_day", 48),
+    ("noleap", 24 * 60),
+    ("standard", 24 * 365 * 5),
+    ("julian", 24 * 365 * 50),
+]
+
+
+class SaveFig:
+    params = [1_000, 100_000]
+    param_names = ["points"]
+    timeout = 300
+
+    def setup(self, points):
+        self.panels = []
+        for calendar, hours in PANELS:
+            times = dates(hours, calendar)
+            index = np.linspace(0, hours - 1, min(points, hours)).astype(int)
+            self.panels.append((times[index], np.sin(index / 24)))
+
+    def teardown(self, points):
+        plt.close("all")
+
+    def _savefig(self):
+        fig, axes = plt.subplots(2, 2, figsize=(12, 8))
+        for ax, (times, values) in zip(axes.flat, self.panels, strict=True):
+            ax.plot(times, values)
+        fig.savefig(io.BytesIO(), format="png")
+        plt.close(fig)
+
+    def time_savefig(self, points):
+        self._savefig()
+
+    def track_savefig_allocated(self, points):
+        return peak_allocated(self._savefig)
+
+    track_savefig_allocated.unit = "bytes"
@@ -0,0 +1,104 @@
+"""Bounded least-recently-used caches with hit and miss statistics."""
+
+from collections import OrderedDict
+import threading
+from typing import NamedTuple
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a :py:class:`LRUCache`, as for :py:func:`functools.lru_cache`."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class LRUCache:
+    """A mapping of bounded size which discards the least recently used item.
+
+    Parameters
+    ----------
+    maxsize : int
+        The maximum number of items held.  A size of zero disables caching.
+
+    Notes
+    -----
+    The cache may be used from several threads at once, e.g. by figures
+    rendered on a thread pool.  A pickled cache, e.g. of a pickled figure,
+    keeps only its size, and is empty when unpickled.
+
+    """
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        return {"maxsize": self.maxsize}
+
+    def __setstate__(self, state):
+        self.__init__(state["maxsize"])
+
+    def __len__(self):
+        return len(self._items)
+
+    def get(self, key, default=None, valid=None):
+        """Return the item for *key*, marking it as recently used.
+
+        An item for which the optional *valid* function returns false is
+        treated as missing.
+        """
+        with self._lock:
+            try:
+                value = self._items[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            if valid is not None and not valid(value):
+                self.misses += 1
+                return default
+            self._items.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def peek(self, key, default=None):
+        """Return the item for *key* without marking it as used."""
+        with self._lock:
+            return self._items.get(key, default)
+
+    def pop(self, key, default=None):
+        """Remove and return the item for *key*."""
+        with self._lock:
+            return self._items.pop(key, default)
+
+    def put(self, key, value):
+        """Add or replace the item for *key*, discarding old items if full."""
+        with self._lock:
+            if self.maxsize <= 0:
+                return
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+    def resize(self, maxsize):
+        """Change the maximum number of items, discarding old items if full."""
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._items) > max(maxsize, 0):
+                self._items.popitem(last=False)
+
+    def clear(self):
+        """Discard all items and reset the statistics."""
+        with self._lock:
+            self._items.clear()
+            self.hits = self.misses = 0
+
+    def info(self):
+        """Return the :py:class:`CacheInfo` statistics of the cache."""
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._items))
@@ -0,0 +1,705 @@
+"""Vectorised calendar arithmetic for :py:class:`cftime.datetime` data.
+
+The functions in this module convert between :py:class:`cftime.datetime`
+objects, their date fields and the numeric ``"days since 2000-01-01"`` values
+used on a cftime axis, with array arithmetic instead of a Python-level walk
+over each object.  :py:func:`date2num` and :py:func:`num2date` are drop-in
+replacements for their :py:mod:`cftime` namesakes, falling back to
+:py:mod:`cftime` whenever the input cannot be handled exactly (other units,
+an unsupported calendar, an invalid date or an unusual object), in which case
+:py:mod:`cftime` will either do the conversion or raise the appropriate
+error.
+
+"""
+
+import functools
+from operator import attrgetter
+import re
+from typing import NamedTuple
+
+import cftime
+import numpy as np
+
+#: The units of the numeric values on a cftime axis.
+TIME_UNITS = "days since 2000-01-01"
+
+#: The names of the date fields, in :py:class:`cftime.datetime` argument order.
+FIELDS = ("year", "month", "day", "hour", "minute", "second", "microsecond")
+
+
+class DateFields(NamedTuple):
+    """The fields of a date, in :py:class:`cftime.datetime` argument order."""
+
+    year: int
+    month: int
+    day: int
+    hour: int
+    minute: int
+    second: int
+    microsecond: int
+
+
+_MONTHS_PER_YEAR = 12
+# Exclusive upper bounds of the hour, minute, second and microsecond fields.
+_TIME_FIELD_LIMITS = (24, 60, 60, 1_000_000)
+_US_PER_SECOND = 1_000_000
+_US_PER_DAY = 86_400_000_000
+# Largest magnitude integer that is exactly representable as a float64.
+_MAX_EXACT_FLOAT = 2**53
+# Keep the microsecond arithmetic well inside the int64 range.
+_MAX_YEAR_OFFSET = 200_000
+
+_COMMON_MONTHS = np.array([31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31])
+_LEAP_MONTHS = np.array([31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31])
+
+#: Month lengths of the calendars where every year has the same length.
+FIXED_MONTH_LENGTHS = {
+    "360_day": np.full(12, 30),
+    "365_day": _COMMON_MONTHS,
+    "noleap": _COMMON_MONTHS,
+    "366_day": _LEAP_MONTHS,
+    "all_leap": _LEAP_MONTHS,
+}
+
+_FIXED_MONTH_STARTS = {
+    calendar: np.concatenate([[0], np.cumsum(lengths)[:-1]])
+    for calendar, lengths in FIXED_MONTH_LENGTHS.items()
+}
+
+#: Calendars following the Julian and/or Gregorian leap year rules.
+REAL_WORLD_CALENDARS = ("gregorian", "julian", "proleptic_gregorian", "standard")
+
+# The calendar-specific subclasses of cftime.datetime, as made by
+# cftime.num2date, by calendar.
+_DATE_TYPES = {
+    "360_day": "Datetime360Day",
+    "365_day": "DatetimeNoLeap",
+    "noleap": "DatetimeNoLeap",
+    "366_day": "DatetimeAllLeap",
+    "all_leap": "DatetimeAllLeap",
+    "gregorian": "DatetimeGregorian",
+    "julian": "DatetimeJulian",
+    "proleptic_gregorian": "DatetimeProlepticGregorian",
+    "standard": "DatetimeGregorian",
+}
+
+# Real-world calendars that, by default, have no year zero, i.e. year -1 is
+# immediately followed by year 1.
+_NO_YEAR_ZERO_CALENDARS = ("gregorian", "julian", "standard")
+
+# Julian day numbers of 2000-01-01 in the Gregorian and Julian calendars.
+_GREGORIAN_JDN_REFERENCE = 2451545
+_JULIAN_JDN_REFERENCE = 2451558
+# The first day of the Gregorian calendar in the mixed Julian/Gregorian
+# calendar, after the ten days dropped in October 1582.
+_GREGORIAN_START = (1582, 10, 15)
+
+
+def date_fields(dates):
+    """Extract the date fields of a sequence of datetime objects.
+
+    Parameters
+    ----------
+    dates : sequence of :py:class:`cftime.datetime`
+        The one-dimensional sequence of dates.
+
+    Returns
+    -------
+    tuple of :py:class:`numpy.ndarray`
+        One int64 array per name in :py:data:`FIELDS`.
+
+    """
+    count = len(dates)
+    return tuple(
+        np.fromiter(map(attrgetter(name), dates), dtype=np.int64, count=count)
+        for name in FIELDS
+    )
+
+
+def _supported(calendar):
+    return calendar in FIXED_MONTH_LENGTHS or calendar in REAL_WORLD_CALENDARS
+
+
+def _is_gregorian_leap(year):
+    return (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+
+
+def _julian_day_number(year, month, day, gregorian):
+    # Julian day number of an astronomical year/month/day, see
+    # https://en.wikipedia.org/wiki/Julian_day#Converting_Gregorian_calendar_date_to_Julian_Day_Number
+    a = (14 - month) // 12
+    y = year + 4800 - a
+    m = month + 12 * a - 3
+    jdn = day + (153 * m + 2) // 5 + 365 * y + y // 4 - 32083
+    return np.where(gregorian, jdn - y // 100 + y // 400 + 38, jdn)
+
+
+def _fixed_days(calendar, year, month, day):
+    lengths = FIXED_MONTH_LENGTHS[calendar]
+    if np.any(day > lengths[month - 1]):
+        return None
+    starts = _FIXED_MONTH_STARTS[calendar]
+    return (year - 2000) * lengths.sum() + starts[month - 1] + day - 1
+
+
+def _fixed_fields(calendar, days):
+    year, day_of_year = np.divmod(days, FIXED_MONTH_LENGTHS[calendar].sum())
+    starts = _FIXED_MONTH_STARTS[calendar]
+    month = np.searchsorted(starts, day_of_year, side="right")
+    return year + 2000, month, day_of_year - starts[month - 1] + 1
+
+
+class CalendarTable:
+    """Cumulative day counts of a real-world calendar over a range of years.
+
+    The irregular leap years of the Julian and Gregorian calendars, and the
+    switch between them in the mixed ``"standard"`` calendar, make a closed
+    form awkward.  Instead, the table holds the day number of the first of
+    every month in the range of years, so that dates and day numbers can be
+    mapped between with a lookup and :py:func:`numpy.searchsorted`.
+
+    Parameters
+    ----------
+    calendar : str
+        One of the :py:data:`REAL_WORLD_CALENDARS`.
+    years : tuple of int
+        The ``(start, stop)`` range of astronomical years to cover, where
+        ``start`` is included and ``stop`` is not.
+
+    """
+
+    def __init__(self, calendar, years):
+        self.calendar = calendar
+        self.years = years
+        self.has_year_zero = calendar not in _NO_YEAR_ZERO_CALENDARS
+        year = np.arange(*years)
+        reference = _GREGORIAN_JDN_REFERENCE
+        if calendar == "julian":
+            gregorian = np.zeros(year.shape, dtype=bool)
+            leap = year % 4 == 0
+            reference = _JULIAN_JDN_REFERENCE
+        elif calendar == "proleptic_gregorian":
+            gregorian = np.ones(year.shape, dtype=bool)
+            leap = _is_gregorian_leap(year)
+        else:
+            gregorian = year > _GREGORIAN_START[0]
+            leap = np.where(gregorian, _is_gregorian_leap(year), year % 4 == 0)
+        lengths = np.where(leap[:, np.newaxis], _LEAP_MONTHS, _COMMON_MONTHS)
+        self._gap = calendar not in ("julian", "proleptic_gregorian")
+        if self._gap and years[0] <= _GREGORIAN_START[0] < years[1]:
+            # October 1582 is ten days short in the mixed calendar.
+            lengths[_GREGORIAN_START[0] - years[0], _GREGORIAN_START[1] - 1] -= 10
+        year_starts = _julian_day_number(year, 1, 1, gregorian) - reference
+        month_offsets = np.cumsum(lengths, axis=1) - lengths
+        #: Day number of the first of each month, flattened so that it is
+        #: sorted and month ``m`` of year ``y`` is at ``12 * (y - start) + m - 1``.
+        self.month_starts = (year_starts[:, np.newaxis] + month_offsets).ravel()
+        self.month_lengths = lengths.ravel()
+        #: The day number just past the end of the table.
+        self.stop_day = year_starts[-1] + lengths[-1].sum()
+
+    def _gap_days(self, year, month, day):
+        # The number of dropped days before each date in October 1582.
+        if not self._gap:
+            return 0
+        start_year, start_month, start_day = _GREGORIAN_START
+        in_month = (year == start_year) & (month == start_month)
+        return np.where(in_month & (day >= start_day), 10, 0)
+
+    def to_days(self, year, month, day):
+        """Compute whole days since 2000-01-01 from date fields.
+
+        Parameters
+        ----------
+        year, month, day : :py:class:`numpy.ndarray`
+            Integer arrays of date fields, with valid months.
+
+        Returns
+        -------
+        :py:class:`numpy.ndarray` or None
+            The int64 day numbers, or ``None`` if any of the dates is outside
+            the table or invalid in the calendar.
+
+        """
+        if not self.has_year_zero:
+            if np.any(year == 0):
+                return None
+            # Use astronomical year numbering, where 1 BC is year 0.
+            year = np.where(year < 0, year + 1, year)
+        if np.any((year < self.years[0]) | (year >= self.years[1])):
+            return None
+        index = _MONTHS_PER_YEAR * (year - self.years[0]) + month - 1
+        gap = self._gap_days(year, month, day)
+        if self._gap:
+            start_year, start_month, start_day = _GREGORIAN_START
+            dropped = (day > start_day - 11) & (day < start_day)
+            if np.any((year == start_year) & (month == start_month) & dropped):
+                return None
+        if np.any(day - gap > self.month_lengths[index]):
+            return None
+        return self.month_starts[index] + day - 1 - gap
+
+    def to_fields(self, days):
+        """Compute the year, month and day of whole days since 2000-01-01.
+
+        Parameters
+        ----------
+        days : :py:class:`numpy.ndarray`
+            Integer array of day numbers.
+
+        Returns
+        -------
+        tuple of :py:class:`numpy.ndarray` or None
+            The year, month and day arrays, or ``None`` if any of the days is
+            outside the table.
+
+        """
+        if np.any((days < self.month_starts[0]) | (days >= self.stop_day)):
+            return None
+        index = np.searchsorted(self.month_starts, days, side="right") - 1
+        year, month = np.divmod(index, _MONTHS_PER_YEAR)
+        year += self.years[0]
+        month += 1
+        day = days - self.month_starts[index] + 1
+        if self._gap:
+            start_year, start_month, start_day = _GREGORIAN_START
+            in_month = (year == start_year) & (month == start_month)
+            day = np.where(in_month & (day > start_day - 11), day + 10, day)
+        if not self.has_year_zero:
+            year = np.where(year <= 0, year - 1, year)
+        return year, month, day
+
+
+#: The ``(start, stop)`` range of astronomical years covered by the tables of
+#: the real-world calendars.  Dates outside this range are converted by
+#: :py:mod:`cftime`.  Call :py:func:`clear_tables` after changing it.
+TABLE_YEARS = (-10_000, 10_000)
+
+# The calendar tables built so far, by calendar and range of years.
+_TABLES: dict[tuple[str, tuple[int, int]], CalendarTable] = {}
+
+
+def calendar_table(calendar):
+    """Return the table for a real-world calendar, building it if needed.
+
+    Parameters
+    ----------
+    calendar : str
+        One of the :py:data:`REAL_WORLD_CALENDARS`.
+
+    Returns
+    -------
+    :py:class:`CalendarTable`
+        The table covering :py:data:`TABLE_YEARS`.
+
+    """
+    if calendar == "gregorian":
+        calendar = "standard"
+    key = (calendar, TABLE_YEARS)
+    table = _TABLES.get(key)
+    if table is None:
+        table = _TABLES[key] = CalendarTable(calendar, TABLE_YEARS)
+    return table
+
+
+def clear_tables():
+    """Discard all of the calendar tables built so far."""
+    _TABLES.clear()
+
+
+def fields_to_days(calendar, year, month, day):
+    """Compute whole days since 2000-01-01 from date fields.
+
+    Parameters
+    ----------
+    calendar : str
+        The calendar of the dates.
+    year, month, day : :py:class:`numpy.ndarray`
+        Integer arrays of date fields.
+
+    Returns
+    -------
+    :py:class:`numpy.ndarray` or None
+        The int64 day numbers, or ``None`` if the calendar is not supported,
+        any of the dates is invalid in that calendar or outside its table.
+
+    """
+    if np.any((month < 1) | (month > _MONTHS_PER_YEAR) | (day < 1)):
+        return None
+    if np.any(np.abs(year - 2000) > _MAX_YEAR_OFFSET):
+        return None
+    if calendar in FIXED_MONTH_LENGTHS:
+        return _fixed_days(calendar, year, month, day)
+    if calendar in REAL_WORLD_CALENDARS:
+        return calendar_table(calendar).to_days(year, month, day)
+    return None
+
+
+def days_to_fields(calendar, days):
+    """Compute the year, month and day of whole days since 2000-01-01.
+
+    Parameters
+    ----------
+    calendar : str
+        The calendar of the dates.
+    days : :py:class:`numpy.ndarray`
+        Integer array of day numbers.
+
+    Returns
+    -------
+    tuple of :py:class:`numpy.ndarray` or None
+        The year, month and day arrays, or ``None`` if the calendar is not
+        supported or any of the days is outside its table.
+
+    """
+    if calendar in FIXED_MONTH_LENGTHS:
+        return _fixed_fields(calendar, days)
+    if calendar in REAL_WORLD_CALENDARS:
+        return calendar_table(calendar).to_fields(days)
+    return None
+
+
+def month_numbers(year, month):
+    """Count the months since January of the year zero.
+
+    The months are counted in the years of the calendar, as the major ticks
+    are located, so that in calendars without a year zero the months of 1
+    BCE and 1 CE are twelve apart.
+
+    Parameters
+    ----------
+    year, month : :py:class:`numpy.ndarray`
+        Integer arrays of date fields.
+
+    Returns
+    -------
+    :py:class:`numpy.ndarray`
+        The int64 month numbers.
+
+    """
+    return _MONTHS_PER_YEAR * year + month - 1
+
+
+def month_number_days(calendar, months):
+    """Compute whole days since 2000-01-01 of the first day of month numbers.
+
+    Parameters
+    ----------
+    calendar : str
+        The calendar of the dates.
+    months : :py:class:`numpy.ndarray`
+        Integer array of month numbers, as given by :py:func:`month_numbers`.
+
+    Returns
+    -------
+    :py:class:`numpy.ndarray` or None
+        The int64 day numbers, without those of the months of the year zero
+        in calendars which have none, or ``None`` as for
+        :py:func:`fields_to_days`.
+
+    """
+    year, month = np.divmod(months, _MONTHS_PER_YEAR)
+    if calendar in _NO_YEAR_ZERO_CALENDARS:
+        month = month[year != 0]
+        year = year[year != 0]
+    return fields_to_days(calendar, year, month + 1, np.ones_like(year))
+
+
+def to_microseconds(nums, unit_us=_US_PER_DAY):
+    """Convert numeric time values to whole microseconds.
+
+    The values are rounded in the same way as by :py:func:`cftime.num2date`,
+    so that the dates decoded from the microseconds are identical.
+
+    Parameters
+    ----------
+    nums : :py:class:`numpy.ndarray`
+        The numeric time values.
+    unit_us : int, default=86_400_000_000
+        The length of the units of *nums*, in microseconds, by default days.
+
+    Returns
+    -------
+    :py:class:`numpy.ndarray`
+        The int64 microseconds of each value.
+
+    """
+    if nums.dtype.kind in "iu":
+        return nums.astype(np.int64) * unit_us
+    scaled = nums.astype(np.longdouble) * unit_us
+    result = np.rint(scaled).astype(np.int64)
+    result = np.where(
+        result % _US_PER_SECOND == 1, np.floor(scaled).astype(np.int64), result
+    )
+    return np.where(
+        result % _US_PER_SECOND == _US_PER_SECOND - 1,
+        np.ceil(scaled).astype(np.int64),
+        result,
+    )
+
+
+def num2fields(nums, calendar):
+    """Compute the date fields of days since 2000-01-01.
+
+    This decodes the values to exactly the same dates as
+    :py:func:`cftime.num2date` with units of ``"days since 2000-01-01"``.
+
+    Parameters
+    ----------
+    nums : array-like
+        The numeric time values.
+    calendar : str
+        The calendar of the dates.
+
+    Returns
+    -------
+    tuple of :py:class:`numpy.ndarray` or None
+        One int64 array per name in :py:data:`FIELDS`, each with the shape of
+        *nums*, or ``None`` if the values must be decoded by :py:mod:`cftime`
+        instead.
+
+    """
+    nums = np.asanyarray(nums)
+    if (
+        not _supported(calendar)
+        or nums.dtype.kind not in "iuf"
+        or np.ma.is_masked(nums)
+        or not np.all(np.abs(nums) < _MAX_YEAR_OFFSET * 360)
+    ):
+        return None
+    days, day_us = np.divmod(to_microseconds(np.asarray(nums)), _US_PER_DAY)
+    fields = days_to_fields(calendar, days)
+    if fields is None:
+        return None
+    seconds, microsecond = np.divmod(day_us, _US_PER_SECOND)
+    minutes, second = np.divmod(seconds, 60)
+    hour, minute = np.divmod(minutes, 60)
+    return (*fields, hour, minute, second, microsecond)
+
+
+def decode_microseconds(times, unit_us, calendar):
+    """Decode numeric times in units since 2000-01-01 to whole microseconds.
+
+    The times are rounded in exactly the same way as by
+    :py:func:`cftime.num2date`, with units of seconds, minutes, hours or days
+    since 2000-01-01.
+
+    Parameters
+    ----------
+    times : :py:class:`numpy.ndarray`
+        The numeric time values.
+    unit_us : int
+        The length of the units of *times*, in microseconds.
+    calendar : str
+        The calendar of the dates.
+
+    Returns
+    -------
+    tuple of :py:class:`numpy.ndarray` or None
+        The int64 microseconds since 2000-01-01 and the year of each time, or
+        ``None`` if the times must be decoded by :py:mod:`cftime` instead.
+
+    """
+    times = np.asarray(times)
+    if (
+        not _supported(calendar)
+        or times.dtype.kind not in "iuf"
+        or not np.all(np.abs(times) * (unit_us / _US_PER_DAY) < _MAX_YEAR_OFFSET * 360)
+    ):
+        return None
+    total_us = to_microseconds(times, unit_us)
+    fields = days_to_fields(calendar, total_us // _US_PER_DAY)
+    if fields is None:
+        return None
+    return total_us, fields[0]
+
+
+def microseconds_to_num(total_us):
+    """Convert whole microseconds since 2000-01-01 to days since 2000-01-01.
+
+    This gives exactly the same result as :py:func:`cftime.date2num` of the
+    corresponding dates, with units of ``"days since 2000-01-01"``.
+
+    Parameters
+    ----------
+    total_us : :py:class:`numpy.ndarray`
+        The int64 microseconds since 2000-01-01.
+
+    Returns
+    -------
+    :py:class:`numpy.ndarray`
+        The int64 days if all the times fall on whole days, otherwise the
+        float64 days.
+
+    """
+    days, day_us = np.divmod(total_us, _US_PER_DAY)
+    if not np.any(day_us):
+        return days
+    result = total_us / _US_PER_DAY
+    # Match the correctly rounded integer division used by cftime for values
+    # that a float64 cannot hold exactly.
+    inexact = np.flatnonzero(np.abs(total_us) > _MAX_EXACT_FLOAT)
+    for index in inexact:
+        result[index] = int(total_us[index]) / _US_PER_DAY
+    return result
+
+
+def num2date(times, units, calendar):
+    """Convert numeric time values to :py:class:`cftime.datetime` objects.
+
+    A replacement for :py:func:`cftime.num2date` which, for units of
+    ``"days since 2000-01-01"`` in the supported calendars, builds the dates
+    directly from their computed fields.  The dates are of the same
+    calendar-specific subclass of :py:class:`cftime.datetime`, e.g.
+    :py:class:`cftime.DatetimeNoLeap`, as those of :py:func:`cftime.num2date`.
+
+    Parameters
+    ----------
+    times : number or array-like
+        The numeric time values.
+    units : str
+        The time units of the values.
+    calendar : str
+        The calendar of the dates.
+
+    Returns
+    -------
+    :py:class:`cftime.datetime` or :py:class:`numpy.ndarray`
+        A single date for a scalar *times*, otherwise an object array of
+        dates with the shape of *times*.
+
+    """
+    fields = num2fields(times, calendar) if units == TIME_UNITS else None
+    if fields is None:
+        return cftime.num2date(times, units, calendar=calendar)
+    date_type = getattr(cftime, _DATE_TYPES[calendar])
+    dates = [
+        date_type(*date)
+        for date in zip(*(field.ravel().tolist() for field in fields), strict=True)
+    ]
+    if np.ndim(times) == 0:
+        return dates[0]
+    result = np.empty(len(dates), dtype=object)
+    result[:] = dates
+    return result.reshape(np.shape(times))
+
+
+def _dates_to_num(dates, calendar):
+    if (
+        not _supported(calendar)
+        or not isinstance(dates, (np.ndarray, list, tuple))
+        or len(dates) == 0
+        or np.ma.is_masked(dates)
+    ):
+        return None
+    try:
+        year, month, day, *times = date_fields(dates)
+    except (AttributeError, TypeError, ValueError, OverflowError):
+        return None
+    days = None
+    if not any(
+        np.any((field < 0) | (field >= limit))
+        for field, limit in zip(times, _TIME_FIELD_LIMITS, strict=True)
+    ):
+        days = fields_to_days(calendar, year, month, day)
+    if days is None:
+        return None
+    hour, minute, second, microsecond = times
+    day_us = ((hour * 60 + minute) * 60 + second) * _US_PER_SECOND + microsecond
+    if not np.any(day_us):
+        return days
+    return microseconds_to_num(days * _US_PER_DAY + day_us)
+
+
+def date2num(dates, units, calendar):
+    """Convert datetime objects to numeric time values.
+
+    A replacement for :py:func:`cftime.date2num` which, for units of
+    ``"days since 2000-01-01"`` and a one-dimensional sequence of dates,
+    computes the values from the date fields with array arithmetic.  This
+    gives exactly the same result as :py:func:`cftime.date2num`, including
+    returning an integer array when all dates fall on whole days.
+
+    Parameters
+    ----------
+    dates : :py:class:`cftime.datetime` or sequence of :py:class:`cftime.datetime`
+        The dates to convert.
+    units : str
+        The time units of the result.
+    calendar : str
+        The calendar used to interpret the date fields.
+
+    Returns
+    -------
+    number or :py:class:`numpy.ndarray`
+        The numeric time values.
+
+    """
+    result = _dates_to_num(dates, calendar) if units == TIME_UNITS else None
+    if result is None:
+        result = cftime.date2num(dates, units, calendar=calendar)
+    return result
+
+
+_SINCE = re.compile(r"\s+since\s+", re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=64)
+def _affine_coefficients(units, calendar):
+    # A whole number of units per day is divided out exactly, otherwise the
+    # values are multiplied by the length of a unit in days.
+    unit = _SINCE.split(units.strip(), maxsplit=1)[0]
+    unit_units = f"{unit} since 2000-01-01"
+    per_day = cftime.date2num(
+        cftime.num2date(1, TIME_UNITS, calendar=calendar), unit_units, calendar=calendar
+    )
+    if float(per_day).is_integer() and per_day >= 1:
+        divisor, scale = float(per_day), None
+    else:
+        divisor, scale = (
+            None,
+            float(
+                cftime.date2num(
+                    cftime.num2date(1, unit_units, calendar=calendar),
+                    TIME_UNITS,
+                    calendar=calendar,
+                )
+            ),
+        )
+    offset = float(
+        cftime.date2num(
+            cftime.num2date(0, units, calendar=calendar), TIME_UNITS, calendar=calendar
+        )
+    )
+    return divisor, scale, offset
+
+
+def rebase(times, units, calendar):
+    """Re-express numeric time values in :py:data:`TIME_UNITS`.
+
+    CF time units are a linear time scale, so the values are rebased with a
+    single affine transform rather than by decoding them to dates.  Values
+    already in :py:data:`TIME_UNITS` are returned unchanged, without a copy.
+
+    Parameters
+    ----------
+    times : :py:class:`numpy.ndarray`
+        The numeric time values.
+    units : str
+        The CF time units of the values, e.g. ``"hours since 1850-01-01"``.
+    calendar : str
+        The calendar of the values.
+
+    Returns
+    -------
+    :py:class:`numpy.ndarray`
+        The time values in :py:data:`TIME_UNITS`.
+
+    """
+    if units == TIME_UNITS:
+        return times
+    divisor, scale, offset = _affine_coefficients(units, calendar)
+    times = times / divisor if scale is None else times * scale
+    if offset:
+        times = times + offset
+    return times
@@ -0,0 +1,1855 @@
+"""Implementation of the cftime axis, imported by nc-time-axis on first use."""
+
+# nc-time-axis provides datetime locator and formatter objects which are
+# analogous to matplotlib's, but are compatible with cftime.datetime objects
+# rather than standard library datetimes or np.datetime64 values. Because of
+# this correspondence, some code contained in nc-time-axis is adapted from or
+# directly copied from matplotlib.  For reference, we include a copy of
+# matplotlib's license here.
+
+# License agreement for matplotlib versions 1.3.0 and later
+# =========================================================
+
+# 1. This LICENSE AGREEMENT is between the Matplotlib Development Team
+# ("MDT"), and the Individual or Organization ("Licensee") accessing and
+# otherwise using matplotlib software in source or binary form and its
+# associated documentation.
+
+# 2. Subject to the terms and conditions of this License Agreement, MDT
+# hereby grants Licensee a nonexclusive, royalty-free, world-wide license
+# to reproduce, analyze, test, perform and/or display publicly, prepare
+# derivative works, distribute, and otherwise use matplotlib
+# alone or in any derivative version, provided, however, that MDT's
+# License Agreement and MDT's notice of copyright, i.e., "Copyright (c)
+# 2012- Matplotlib Development Team; All Rights Reserved" are retained in
+# matplotlib  alone or in any derivative version prepared by
+# Licensee.
+
+# 3. In the event Licensee prepares a derivative work that is based on or
+# incorporates matplotlib or any part thereof, and wants to
+# make the derivative work available to others as provided herein, then
+# Licensee hereby agrees to include in any such work a brief summary of
+# the changes made to matplotlib .
+
+# 4. MDT is making matplotlib available to Licensee on an "AS
+# IS" basis.  MDT MAKES NO REPRESENTATIONS OR WARRANTIES, EXPRESS OR
+# IMPLIED.  BY WAY OF EXAMPLE, BUT NOT LIMITATION, MDT MAKES NO AND
+# DISCLAIMS ANY REPRESENTATION OR WARRANTY OF MERCHANTABILITY OR FITNESS
+# FOR ANY PARTICULAR PURPOSE OR THAT THE USE OF MATPLOTLIB
+# WILL NOT INFRINGE ANY THIRD PARTY RIGHTS.
+
+# 5. MDT SHALL NOT BE LIABLE TO LICENSEE OR ANY OTHER USERS OF MATPLOTLIB
+#  FOR ANY INCIDENTAL, SPECIAL, OR CONSEQUENTIAL DAMAGES OR
+# LOSS AS A RESULT OF MODIFYING, DISTRIBUTING, OR OTHERWISE USING
+# MATPLOTLIB , OR ANY DERIVATIVE THEREOF, EVEN IF ADVISED OF
+# THE POSSIBILITY THEREOF.
+
+# 6. This License Agreement will automatically terminate upon a material
+# breach of its terms and conditions.
+
+# 7. Nothing in this License Agreement shall be deemed to create any
+# relationship of agency, partnership, or joint venture between MDT and
+# Licensee.  This License Agreement does not grant permission to use MDT
+# trademarks or trade name in a trademark sense to endorse or promote
+# products or services of Licensee, or any third party.
+
+# 8. By copying, installing or otherwise using matplotlib ,
+# Licensee agrees to be bound by the terms and conditions of this License
+# Agreement.
+
+# License agreement for matplotlib versions prior to 1.3.0
+# ========================================================
+
+# 1. This LICENSE AGREEMENT is between John D. Hunter ("JDH"), and the
+# Individual or Organization ("Licensee") accessing and otherwise using
+# matplotlib software in source or binary form and its associated
+# documentation.
+
+# 2. Subject to the terms and conditions of this License Agreement, JDH
+# hereby grants Licensee a nonexclusive, royalty-free, world-wide license
+# to reproduce, analyze, test, perform and/or display publicly, prepare
+# derivative works, distribute, and otherwise use matplotlib
+# alone or in any derivative version, provided, however, that JDH's
+# License Agreement and JDH's notice of copyright, i.e., "Copyright (c)
+# 2002-2011 John D. Hunter; All Rights Reserved" are retained in
+# matplotlib  alone or in any derivative version prepared by
+# Licensee.
+
+# 3. In the event Licensee prepares a derivative work that is based on or
+# incorporates matplotlib  or any part thereof, and wants to
+# make the derivative work available to others as provided herein, then
+# Licensee hereby agrees to include in any such work a brief summary of
+# the changes made to matplotlib.
+
+# 4. JDH is making matplotlib  available to Licensee on an "AS
+# IS" basis.  JDH MAKES NO REPRESENTATIONS OR WARRANTIES, EXPRESS OR
+# IMPLIED.  BY WAY OF EXAMPLE, BUT NOT LIMITATION, JDH MAKES NO AND
+# DISCLAIMS ANY REPRESENTATION OR WARRANTY OF MERCHANTABILITY OR FITNESS
+# FOR ANY PARTICULAR PURPOSE OR THAT THE USE OF MATPLOTLIB
+# WILL NOT INFRINGE ANY THIRD PARTY RIGHTS.
+
+# 5. JDH SHALL NOT BE LIABLE TO LICENSEE OR ANY OTHER USERS OF MATPLOTLIB
+#  FOR ANY INCIDENTAL, SPECIAL, OR CONSEQUENTIAL DAMAGES OR
+# LOSS AS A RESULT OF MODIFYING, DISTRIBUTING, OR OTHERWISE USING
+# MATPLOTLIB , OR ANY DERIVATIVE THEREOF, EVEN IF ADVISED OF
+# THE POSSIBILITY THEREOF.
+
+# 6. This License Agreement will automatically terminate upon a material
+# breach of its terms and conditions.
+
+# 7. Nothing in this License Agreement shall be deemed to create any
+# relationship of agency, partnership, or joint venture between JDH and
+# Licensee.  This License Agreement does not grant permission to use JDH
+# trademarks or trade name in a trademark sense to endorse or promote
+# products or services of Licensee, or any third party.
+
+# 8. By copying, installing or otherwise using matplotlib,
+# Licensee agrees to be bound by the terms and conditions of this License
+# Agreement.
+
+import contextlib
+import copy
+import functools
+from operator import attrgetter
+from typing import NamedTuple
+import warnings
+import weakref
+
+import cftime
+import matplotlib.dates as mdates
+import matplotlib.lines as mlines
+import matplotlib.ticker as mticker
+import matplotlib.transforms as mtransforms
+import matplotlib.units as munits
+import numpy as np
+
+from . import (
+    _calendar,
+    _decimate,
+    _instrument,
+    _lazy,
+    _parallel,
+    _pyramid,
+    _stream,
+    _strftime,
+    _window,
+)
+from ._cache import LRUCache
+from ._instrument import instrument, reset_stats, stats  # noqa: F401
+from ._strftime import (  # noqa: F401
+    label_cache_clear,
+    label_cache_info,
+    set_label_cache_size,
+)
+
+_DEFAULT_RESOLUTION = "DAILY"
+_TIME_UNITS = _calendar.TIME_UNITS
+
+
+class CalendarDateTime:
+    """Container for a :py:class:`cftime.datetime` object and calendar.
+
+    Parameters
+    ----------
+    datetime : :py:class:`cftime.datetime`
+        The datetime instance associated with this
+        :py:class:`CalendarDateTime` object.
+    calendar : str
+        The calendar type of the datetime object, e.g. ``"noleap"``.  See
+        :py:class:`cftime.datetime` documentation for a full list of valid
+        calendar strings.
+
+    Notes
+    -----
+    This class is no longer needed and will be deprecated in nc-time-axis
+    version 1.5.
+    """
+
+    def __init__(self, datetime, calendar):
+        warnings.warn(
+            "CalendarDateTime is obsolete and will be deprecated in nc_time_axis "
+            "version 1.5.  Please consider switching to plotting instances or "
+            "subclasses of cftime.datetime directly.",
+            DeprecationWarning,
+        )
+        self.datetime = datetime
+        self.calendar = calendar
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, self.__class__)
+            and self.datetime == other.datetime
+            and self.calendar == other.calendar
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.datetime, self.calendar))
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __repr__(self):
+        return (
+            f"<{type(self).__name__}: datetime={self.datetime}, "
+            "calendar={self.calendar}>"
+        )
+
+
+class CFTimeArray:
+    """Numeric time values annotated with their CF units and calendar.
+
+    Plotting a :py:class:`CFTimeArray` places the values on a cftime axis
+    without decoding them to :py:class:`cftime.datetime` objects.  The values
+    are rebased to the units of the axis with a single affine transform, or
+    used as they are if already in those units.
+
+    Parameters
+    ----------
+    data : array-like
+        The numeric time values, e.g. a netCDF time coordinate.
+    units : str
+        The CF time units of the values, e.g. ``"hours since 1850-01-01"``.
+    calendar : str
+        The calendar of the values, e.g. ``"noleap"``.
+
+    Notes
+    -----
+    The values are held as :py:attr:`data`, rather than as ``values`` or
+    through ``to_numpy``, which matplotlib would unpack to bare numbers.
+
+    """
+
+    def __init__(self, data, units, calendar):
+        data = np.asanyarray(data)
+        if data.dtype.kind not in "iuf":
+            msg = f"The time values must be numeric, got dtype {data.dtype!s}."
+            raise ValueError(msg)
+        self.data = data
+        self.units = units
+        self.calendar = calendar
+
+    @property
+    def shape(self):
+        return self.data.shape
+
+    @property
+    def ndim(self):
+        return self.data.ndim
+
+    @property
+    def size(self):
+        return self.data.size
+
+    def __len__(self):
+        return len(self.data)
+
+    def __getitem__(self, key):
+        # Always return a CFTimeArray, even for a single value, so that the
+        # units and calendar are never separated from the data.
+        return type(self)(self.data[key], self.units, self.calendar)
+
+    def __repr__(self):
+        return (
+            f"<{type(self).__name__}: shape={self.shape}, "
+            f"units={self.units!r}, calendar={self.calendar!r}>"
+        )
+
+    def to_axis_units(self):
+        """Return the values in the units of a cftime axis.
+
+        Returns
+        -------
+        :py:class:`numpy.ndarray`
+            The values in ``"days since 2000-01-01"``.
+
+        """
+        return _calendar.rebase(self.data, self.units, self.calendar)
+
+
+# The length of the units in which the ticks of each sub-monthly resolution
+# are located, in microseconds.
+_RESOLUTION_MICROSECONDS = {
+    "DAILY": 86_400_000_000,
+    "HOURLY": 3_600_000_000,
+    "MINUTELY": 60_000_000,
+    "SECONDLY": 1_000_000,
+}
+
+_RESOLUTION_TO_FORMAT = {
+    "SECONDLY": "%H:%M:%S",
+    "MINUTELY": "%H:%M",
+    "HOURLY": "%Y-%m-%d %H:%M",
+    "DAILY": "%Y-%m-%d",
+    "MONTHLY": "%Y-%m",
+    "YEARLY": "%Y",
+}
+
+
+class TickChanges(NamedTuple):
+    """The ticks which entered and left the view between two views."""
+
+    entered: np.ndarray
+    left: np.ndarray
+
+
+class _TickConversion(NamedTuple):
+    # The conversions of the ticks of the last view located by a locator, by
+    # their values in the units of the kind of resolution.
+    kind: str
+    values: dict[float, tuple[int, ...]]
+
+
+class AutoCFTimeFormatter(mticker.Formatter):
+    """Automatic formatter for :py:class:`cftime.datetime` data.
+
+    Automatically chooses a date format based on the resolution set by the
+    :py:class:`NetCDFDateTimeLocator`.  If no resolution is set, a default
+    format of ``"%Y-%m-%d"`` is used.
+
+    Parameters
+    ----------
+    locator : NetCDFDateTimeLocator
+        The locator to be associated with this formatter.
+    calendar : str
+        The calendar type of the axis, e.g. ``"noleap"``.  See the
+        :py:class:`cftime.datetime` documentation for a full list of valid
+        calendar strings.
+    time_units : str, optional
+        The time units the numeric tick values represent.  Note this will
+        be deprecated in nc-time-axis version 1.5.
+    """
+
+    def __init__(self, locator, calendar, time_units=None):
+        #: The locator associated with this formatter. This is used to get hold
+        #: of the scaling information.
+        self.locator = locator
+        self.calendar = calendar
+        if time_units is not None:
+            warnings.warn(
+                "The time_units argument will be removed in nc_time_axis version 1.5",
+                DeprecationWarning,
+            )
+            self.time_units = time_units
+        else:
+            self.time_units = _TIME_UNITS
+        # The format and labels of the ticks last formatted, by value.
+        self._previous_labels: tuple[str | None, dict[float, str]] = (None, {})
+
+    def pick_format(self, resolution):
+        return _RESOLUTION_TO_FORMAT[resolution]
+
+    @_instrument.instrumented("AutoCFTimeFormatter.__call__")
+    def __call__(self, x, pos=0):
+        format_string = self.pick_format(self.locator.resolution)
+        return _strftime.cached_strftime(
+            x, self.time_units, self.calendar, format_string
+        )
+
+    @_instrument.instrumented("AutoCFTimeFormatter.format_ticks", "value")
+    def format_ticks(self, values):
+        """Return the tick labels for all the tick *values* at once.
+
+        The labels are the same as those given by calling the formatter for
+        each value, but are rendered from the date fields of all the values
+        in a single batch.
+
+        """
+        self.set_locs(values)
+        format_string = self.pick_format(self.locator.resolution)
+        if not (
+            isinstance(self.locator, NetCDFTimeDateLocator) and self.locator.incremental
+        ):
+            return _strftime.cached_strftime(
+                values, self.time_units, self.calendar, format_string
+            )
+        # Reuse the labels of the ticks which stayed in view, and only format
+        # those which entered it.
+        values = np.asarray(values).reshape(-1).tolist()
+        previous_format, labels = self._previous_labels
+        if previous_format != format_string:
+            labels = {}
+        entered = [value for value in values if value not in labels]
+        if entered:
+            labels.update(
+                zip(
+                    entered,
+                    _strftime.cached_strftime(
+                        np.array(entered), self.time_units, self.calendar, format_string
+                    ),
+                    strict=True,
+                )
+            )
+        self._previous_labels = (
+            format_string,
+            {value: labels[value] for value in values},
+        )
+        return [labels[value] for value in values]
+
+
+class NetCDFTimeDateFormatter(AutoCFTimeFormatter):
+    def __init__(self, *args, **kwargs):
+        warnings.warn(
+            "NetCDFTimeDateFormatter will be named AutoCFTimeFormatter "
+            "in nc_time_axis version 1.5",
+            FutureWarning,
+        )
+        super(NetCDFTimeDateFormatter, self).__init__(*args, **kwargs)
+
+
+class CFTimeFormatter(mticker.Formatter):
+    """A formatter for explicitly setting the format of a
+    :py:class:`cftime.datetime` axis.
+
+    Parameters
+    ----------
+    format : str Format string that can be passed to cftime.datetime.strftime,
+        e.g. ``"%Y-%m-%d"``.  See `the Python documentation
+        <https://docs.python.org/3/library/datetime.html#strftime-and-strptime-format-codes>`_
+        for acceptable format codes.
+    calendar : str
+        The calendar type of the axis, e.g. ``"noleap"``.  See the
+        :py:class:`cftime.datetime` documentation for a full list of valid
+        calendar strings.
+    """
+
+    def __init__(self, format, calendar):  #  noqa: A002
+        self.format = format
+        self.calendar = calendar
+
+    @_instrument.instrumented("CFTimeFormatter.__call__")
+    def __call__(self, x, pos=0):
+        return _strftime.cached_strftime(x, _TIME_UNITS, self.calendar, self.format)
+
+    @_instrument.instrumented("CFTimeFormatter.format_ticks", "value")
+    def format_ticks(self, values):
+        """Return the tick labels for all the tick *values* at once.
+
+        The labels are the same as those given by calling the formatter for
+        each value, but are rendered from the date fields of all the values
+        in a single batch.
+
+        """
+        self.set_locs(values)
+        return _strftime.cached_strftime(
+            values, _TIME_UNITS, self.calendar, self.format
+        )
+
+
+class NetCDFTimeDateLocator(mticker.Locator):
+    """Determines tick locations when plotting :py:class:`cftime.datetime` data.
+
+    Parameters
+    ----------
+    max_n_ticks : int
+        The maximum number of ticks along the axis.  This is passed internally
+        to a :py:class:`matplotlib.ticker.MaxNLocator` class.
+    calendar : str
+        The calendar type of the axis, e.g. ``"noleap"``.  See the
+        :py:class:`cftime.datetime` documentation for a full list of valid
+        calendar strings.
+    date_unit : str
+        The time units the numeric tick values represent.  Note this will
+        be deprecated in nc-time-axis version 1.5.
+    min_n_ticks : int, default 3
+        The minimum number of ticks along the axis. Note this is currently
+        not used.
+    tick_cache : optional
+        The cache of ticks, which may be shared by locators of the same
+        calendar.  By default, the locator has a cache of its own of
+        :py:attr:`tick_cache_size` view intervals.
+
+    Notes
+    -----
+    The ticks and resolution of recently seen view intervals are cached, so
+    redrawing an unchanged axis does not recompute them.  See
+    :py:attr:`tick_cache_size` and :py:meth:`tick_cache_info`.  The locators
+    given by :py:meth:`NetCDFTimeConverter.axisinfo` share one cache for each
+    calendar and date type.
+    """
+
+    real_world_calendars = (
+        "gregorian",
+        "julian",
+        "proleptic_gregorian",
+        "standard",
+    )
+
+    #: The maximum number of view intervals whose ticks are cached by each
+    #: locator.  Set to zero to disable the cache.
+    tick_cache_size = 128
+
+    #: Whether ticks are located incrementally, for views which scroll by a
+    #: little at a time, e.g. in an animation.  The ticks which stay in view
+    #: are reused from the previous view rather than located again, the
+    #: entering and leaving ticks are recorded in :py:attr:`tick_changes`,
+    #: and an :py:class:`AutoCFTimeFormatter` of the locator reuses the labels
+    #: of the ticks which stay.  The ticks themselves are unchanged.
+    incremental = False
+
+    def __init__(
+        self, max_n_ticks, calendar, date_unit=None, min_n_ticks=3, *, tick_cache=None
+    ):
+        # The date unit must be in the form of days since ...
+
+        self.max_n_ticks = max_n_ticks
+        self.min_n_ticks = min_n_ticks
+        self._max_n_locator = mticker.MaxNLocator(max_n_ticks, integer=True)
+        self._max_n_locator_days = mticker.MaxNLocator(
+            max_n_ticks, integer=True, steps=[1, 2, 4, 7, 10]
+        )
+        self.calendar = calendar
+        if date_unit is not None:
+            warnings.warn(
+                "The date_unit argument will be removed in nc_time_axis version 1.5",
+                DeprecationWarning,
+            )
+            self.date_unit = date_unit
+        else:
+            self.date_unit = _TIME_UNITS
+        if not self.date_unit.lower().startswith("days since"):
+            emsg = "The date unit must be days since for a NetCDF time locator."
+            raise ValueError(emsg)
+        self.resolution = _DEFAULT_RESOLUTION
+        # The resolution and ticks of recent view intervals.
+        if tick_cache is None:
+            tick_cache = LRUCache(self.tick_cache_size)
+        self._cached_resolution = tick_cache
+        #: The :py:meth:`precomputed tick positions <build_tick_pyramid>`, if
+        #: any.
+        self.tick_pyramid = None
+        #: In :py:attr:`incremental` mode, the ticks which entered and left
+        #: the view since the previous call of :py:meth:`tick_values`.
+        self.tick_changes: TickChanges | None = None
+        self._located: np.ndarray | None = None
+        self._previous_conversion: _TickConversion | None = None
+
+    @_instrument.instrumented("NetCDFTimeDateLocator.compute_resolution")
+    def compute_resolution(self, num1, num2, date1, date2):
+        """Returns the resolution of the dates (hourly, minutely, yearly), and
+        an **approximate** number of those units.
+
+        Only the ``year`` of the dates *date1* and *date2* of the values
+        *num1* and *num2* is used, so they may be given as their
+        :py:class:`cftime.datetime` or just their date fields.
+
+        """
+        num_days = float(np.abs(num1 - num2))
+        resolution = "SECONDLY"
+        n = mdates.SEC_PER_DAY
+        if num_days * mdates.MINUTES_PER_DAY > self.max_n_ticks:
+            resolution = "MINUTELY"
+            n = int(num_days / mdates.MINUTES_PER_DAY)
+        if num_days * mdates.HOURS_PER_DAY > self.max_n_ticks:
+            resolution = "HOURLY"
+            n = int(num_days / mdates.HOURS_PER_DAY)
+        if num_days > self.max_n_ticks:
+            resolution = "DAILY"
+            n = int(num_days)
+        if num_days > 30 * self.max_n_ticks:
+            resolution = "MONTHLY"
+            n = num_days // 30
+        if num_days > 365 * self.max_n_ticks:
+            resolution = "YEARLY"
+            n = abs(date1.year - date2.year)
+        self.resolution = resolution
+        return resolution, n
+
+    def __call__(self):
+        vmin, vmax = self.axis.get_view_interval()
+        return self.tick_values(vmin, vmax)
+
+    @_instrument.instrumented("NetCDFTimeDateLocator.tick_values", "result")
+    def tick_values(self, vmin, vmax):
+        key = (vmin, vmax, self.calendar, self.date_unit, self.max_n_ticks)
+        cached = self._cached_resolution.get(key)
+        if cached is None:
+            ticks = self._compute_tick_values(vmin, vmax)
+            self._cached_resolution.put(key, (self.resolution, ticks))
+        else:
+            self.resolution, ticks = cached
+        if self.incremental:
+            self._record_changes(ticks)
+        return ticks.copy()
+
+    def _tick_values_unchanged(self, vmin, vmax):
+        # The resolution and ticks of tick_values, looked up in and added to
+        # the same tick cache, but leaving the resolution and incremental
+        # state of the locator unchanged, for CFTimeMinorLocator.
+        locator = copy.copy(self)
+        locator.incremental = False
+        ticks = locator.tick_values(vmin, vmax)
+        return locator.resolution, ticks
+
+    def _record_changes(self, ticks):
+        if ticks is self._located:
+            self.tick_changes = TickChanges(ticks[:0], ticks[:0])
+            return
+        previous = set() if self._located is None else set(self._located.tolist())
+        current = set(ticks.tolist())
+        self.tick_changes = TickChanges(
+            np.array(sorted(current - previous), dtype=ticks.dtype),
+            np.array(sorted(previous - current), dtype=ticks.dtype),
+        )
+        self._located = ticks
+
+    def tick_cache_info(self):
+        """Return the hit and miss statistics of the tick cache.
+
+        Returns
+        -------
+        :py:class:`collections.namedtuple`
+            The ``hits``, ``misses``, ``maxsize`` and ``currsize`` of the
+            cache, as for :py:func:`functools.lru_cache`.
+
+        """
+        return self._cached_resolution.info()
+
+    def tick_cache_clear(self):
+        """Discard the cached ticks and reset their statistics."""
+        self._cached_resolution.clear()
+
+    def build_tick_pyramid(
+        self, vmin=None, vmax=None, max_positions=_pyramid.MAX_POSITIONS
+    ):
+        """Precompute the tick positions over the data range of the axis.
+
+        Ticks of views within the range of the pyramid are then found by
+        lookup, rather than calendar arithmetic, which most benefits axes of
+        many millennia.  The ticks themselves are unchanged.
+
+        Parameters
+        ----------
+        vmin, vmax : float, optional
+            The range to cover, in days since 2000-01-01, by default the data
+            interval of the axis of the locator.
+        max_positions : int, optional
+            The greatest number of tick positions to hold, which bounds the
+            memory and build time of the pyramid.
+
+        Returns
+        -------
+        :py:class:`collections.namedtuple`
+            The ``years``, the number of positions of each of the
+            ``levels``, the total ``positions`` and ``nbytes``, and the
+            build time in ``seconds`` of the pyramid.
+
+        Raises
+        ------
+        ValueError
+            If the pyramid cannot be built for the calendar or date unit of
+            the locator, the range is not given for a locator without an
+            axis, or the range would need more than *max_positions*.
+
+        """
+        if self.date_unit != _TIME_UNITS:
+            emsg = f"A tick pyramid needs the date unit {_TIME_UNITS!r}."
+            raise ValueError(emsg)
+        if vmin is None or vmax is None:
+            if self.axis is None:
+                emsg = "A range is needed to build a tick pyramid without an axis."
+                raise ValueError(emsg)
+            data_min, data_max = self.axis.get_data_interval()
+            vmin = data_min if vmin is None else vmin
+            vmax = data_max if vmax is None else vmax
+        self.tick_pyramid = _pyramid.TickPyramid(
+            self.calendar, vmin, vmax, max_positions
+        )
+        return self.tick_pyramid.info()
+
+    def tick_pyramid_info(self):
+        """Return the size and build time of the tick pyramid, if any.
+
+        Returns
+        -------
+        :py:class:`collections.namedtuple` or None
+            As returned by :py:meth:`build_tick_pyramid`, or ``None`` if no
+            pyramid has been built.
+
+        """
+        if self.tick_pyramid is None:
+            return None
+        return self.tick_pyramid.info()
+
+    def clear_tick_pyramid(self):
+        """Discard the tick pyramid."""
+        self.tick_pyramid = None
+
+    def _compute_tick_values(self, vmin, vmax):
+        vmin, vmax = mtransforms.nonsingular(vmin, vmax, expander=1e-7, tiny=1e-13)
+        if self.tick_pyramid is not None and self.date_unit == _TIME_UNITS:
+            ticks = self._pyramid_tick_values(vmin, vmax)
+            if ticks is not None:
+                return ticks
+        fields = None
+        if self.date_unit == _TIME_UNITS:
+            fields = _calendar.num2fields(np.array([vmin, vmax]), self.calendar)
+        if fields is None:
+            lower = _calendar.num2date(vmin, self.date_unit, calendar=self.calendar)
+            upper = _calendar.num2date(vmax, self.date_unit, calendar=self.calendar)
+        else:
+            lower, upper = (
+                _calendar.DateFields(*date)
+                for date in zip(*(field.tolist() for field in fields), strict=True)
+            )
+
+        resolution, n = self.compute_resolution(vmin, vmax, lower, upper)
+
+        ticks = None
+        if fields is not None:
+            ticks = self._tick_days(resolution, n, vmin, vmax, lower, upper)
+        if ticks is None:
+            if fields is not None:
+                lower = cftime.datetime(*lower, calendar=self.calendar)
+                upper = cftime.datetime(*upper, calendar=self.calendar)
+            ticks = self._tick_dates(resolution, n, vmin, vmax, lower, upper)
+        return ticks
+
+    def _pyramid_tick_values(self, vmin, vmax):
+        # Locate the ticks with the calendar arithmetic looked up in the
+        # pyramid, or return None if the view is outside it.
+        pyramid = self.tick_pyramid
+        bounds = (
+            None if pyramid is None else pyramid.date_fields(np.array([vmin, vmax]))
+        )
+        if bounds is None:
+            return None
+        lower, upper = bounds
+        resolution, n = self.compute_resolution(vmin, vmax, lower, upper)
+        return self._tick_days(resolution, n, vmin, vmax, lower, upper, pyramid=pyramid)
+
+    def _tick_days(self, resolution, n, vmin, vmax, lower, upper, pyramid=None):  # noqa: PLR0913, PLR0917
+        # Locate the ticks directly in days since 2000-01-01, with the same
+        # result as _tick_dates, or return None if they cannot be.  The
+        # calendar arithmetic is looked up in the pyramid, if given.
+        calendar = self.calendar
+        real_world = calendar in self.real_world_calendars
+        if pyramid is None:
+
+            def first_days(year, month):
+                return _calendar.fields_to_days(
+                    calendar, year, month, np.ones_like(year)
+                )
+
+            def decode_microseconds(times, unit_us):
+                return _calendar.decode_microseconds(times, unit_us, calendar)
+
+        else:
+            first_days = pyramid.first_days
+            decode_microseconds = pyramid.decode_microseconds
+        if resolution in ("YEARLY", "MONTHLY"):
+            if resolution == "YEARLY":
+                years = self._max_n_locator.tick_values(lower.year, upper.year)
+                year = years.astype(np.int64)
+                month = np.ones_like(year)
+            else:
+                months = lower.month + self._max_n_locator.tick_values(0, n)
+                year = (lower.year + np.floor(months / 12)).astype(np.int64)
+                month = (months % 12).astype(np.int64) + 1
+            if real_world:
+                # Some calendars do not allow a year 0.
+                month = month[year != 0]
+                year = year[year != 0]
+            if not year.size:
+                return None
+
+            def convert(mask):
+                days = first_days(year[mask], month[mask])
+                return None if days is None else (days,)
+
+            converted = self._convert_ticks(
+                "MONTHS", _calendar.month_numbers(year, month), convert
+            )
+            return None if converted is None else converted[0]
+        if resolution not in _RESOLUTION_MICROSECONDS:
+            return None
+        unit_us = _RESOLUTION_MICROSECONDS[resolution]
+        if resolution == "DAILY":
+            ticks = self._max_n_locator_days.tick_values(vmin, vmax)
+        else:
+            # Locate whole units since 2000-01-01 between the bounds, taken
+            # to the microsecond as dates, in the units.
+            bounds_us, _ = decode_microseconds(
+                np.array([vmin, vmax]), _RESOLUTION_MICROSECONDS["DAILY"]
+            )
+            lower_units, upper_units = (
+                us // unit_us if us % unit_us == 0 else us / unit_us
+                for us in bounds_us.tolist()
+            )
+            ticks = self._max_n_locator.tick_values(lower_units, upper_units)
+        decoded = self._convert_ticks(
+            resolution, ticks, lambda mask: decode_microseconds(ticks[mask], unit_us)
+        )
+        if decoded is None:
+            return None
+        total_us, year = decoded
+        if real_world:
+            total_us = total_us[year != 0]
+        if not total_us.size:
+            return None
+        return _calendar.microseconds_to_num(total_us)
+
+    def _convert_ticks(self, kind, keys, convert):
+        # Convert the ticks of the unit values *keys*, with *convert* of a
+        # mask of the keys returning a tuple of int64 arrays or None.  In
+        # incremental mode, the conversions of the keys also located for the
+        # previous view of the same kind are reused.
+        if not self.incremental or not len(keys):
+            return convert(np.ones(len(keys), dtype=bool))
+        previous = self._previous_conversion
+        known = (
+            previous.values if previous is not None and previous.kind == kind else {}
+        )
+        keys = keys.tolist()
+        entered = np.array([key not in known for key in keys])
+        conversions: dict[float, tuple[int, ...]] = {}
+        if np.any(entered):
+            converted = convert(entered)
+            if converted is None:
+                return None
+            entered_keys = (key for key in keys if key not in known)
+            conversions.update(
+                zip(
+                    entered_keys,
+                    zip(*(values.tolist() for values in converted), strict=True),
+                    strict=True,
+                )
+            )
+        conversions.update((key, known[key]) for key in keys if key in known)
+        self._previous_conversion = _TickConversion(kind, conversions)
+        return tuple(
+            np.array(values, dtype=np.int64)
+            for values in zip(*(conversions[key] for key in keys), strict=True)
+        )
+
+    def _tick_dates(self, resolution, n, vmin, vmax, lower, upper):  # noqa: PLR0913, PLR0917
+        # Locate the ticks as cftime.datetime objects.
+        def has_year_zero(year):
+            result = dict()
+            if self.calendar in self.real_world_calendars and not bool(year):
+                result = dict(has_year_zero=True)
+            return result
+
+        if resolution == "YEARLY":
+            # TODO START AT THE BEGINNING OF A DECADE/CENTURY/MILLENNIUM as
+            # appropriate.
+
+            years = self._max_n_locator.tick_values(lower.year, upper.year)
+            ticks = [
+                cftime.datetime(
+                    int(year),
+                    1,
+                    1,
+                    calendar=self.calendar,
+                    **has_year_zero(year),
+                )
+                for year in years
+            ]
+        elif resolution == "MONTHLY":
+            # TODO START AT THE BEGINNING OF A DECADE/CENTURY/MILLENNIUM as
+            # appropriate.
+            months_offset = self._max_n_locator.tick_values(0, n)
+            ticks = []
+            for offset in months_offset:
+                year = lower.year + np.floor((lower.month + offset) / 12)
+                month = ((lower.month + offset) % 12) + 1
+                dt = cftime.datetime(
+                    int(year),
+                    int(month),
+                    1,
+                    calendar=self.calendar,
+                    **has_year_zero(year),
+                )
+                ticks.append(dt)
+        elif resolution == "DAILY":
+            # TODO: It would be great if this favoured multiples of 7.
+            days = self._max_n_locator_days.tick_values(vmin, vmax)
+            ticks = _calendar.num2date(days, self.date_unit, calendar=self.calendar)
+        elif resolution == "HOURLY":
+            hour_unit = "hours since 2000-01-01"
+            in_hours = cftime.date2num(
+                [lower, upper], hour_unit, calendar=self.calendar
+            )
+            hours = self._max_n_locator.tick_values(in_hours[0], in_hours[1])
+            ticks = [
+                cftime.num2date(dt, hour_unit, calendar=self.calendar) for dt in hours
+            ]
+        elif resolution == "MINUTELY":
+            minute_unit = "minutes since 2000-01-01"
+            in_minutes = cftime.date2num(
+                [lower, upper], minute_unit, calendar=self.calendar
+            )
+            minutes = self._max_n_locator.tick_values(in_minutes[0], in_minutes[1])
+            ticks = [
+                cftime.num2date(dt, minute_unit, calendar=self.calendar)
+                for dt in minutes
+            ]
+        elif resolution == "SECONDLY":
+            second_unit = "seconds since 2000-01-01"
+            in_seconds = cftime.date2num(
+                [lower, upper], second_unit, calendar=self.calendar
+            )
+            seconds = self._max_n_locator.tick_values(in_seconds[0], in_seconds[1])
+            ticks = [
+                cftime.num2date(dt, second_unit, calendar=self.calendar)
+                for dt in seconds
+            ]
+        else:
+            emsg = f"Resolution {resolution} not implemented yet."
+            raise ValueError(emsg)
+        # Some calendars do not allow a year 0.
+        # Remove ticks to avoid raising an error.
+        if self.calendar in [
+            "proleptic_gregorian",
+            "gregorian",
+            "julian",
+            "standard",
+        ]:
+            ticks = [t for t in ticks if t.year != 0]
+        return _calendar.date2num(ticks, self.date_unit, calendar=self.calendar)
+
+
+# The lengths of the minor ticks, in months or microseconds, which may
+# subdivide major ticks a few units of each resolution apart.
+_FINER_STEPS = {
+    "YEARLY": (1, 3, 6),
+    "DAILY": tuple(hours * 3_600_000_000 for hours in (1, 2, 3, 6, 12)),
+    "HOURLY": tuple(minutes * 60_000_000 for minutes in (1, 2, 5, 10, 15, 30)),
+    "MINUTELY": tuple(seconds * 1_000_000 for seconds in (1, 2, 5, 10, 15, 30)),
+    "SECONDLY": (100_000, 200_000, 500_000),
+}
+
+# Major ticks fewer than this many units of their resolution apart are
+# subdivided in units of the next finer resolution.
+_MIN_MINOR_DIVISIONS = 4
+
+# The greatest number of parts into which major ticks are subdivided, where
+# possible.
+_MAX_MINOR_DIVISIONS = 12
+
+
+def _minor_step(step):
+    # The length, in units, of the minor ticks subdividing major ticks *step*
+    # units apart.
+    if step <= _MAX_MINOR_DIVISIONS:
+        return 1
+    for divisions in (5, 4, 3, 2):
+        if step % divisions == 0:
+            return step // divisions
+    return 1
+
+
+def _finer_step(length, steps):
+    # The shortest of *steps* subdividing *length* into at most
+    # _MAX_MINOR_DIVISIONS parts.
+    for step in steps:
+        if length <= step * _MAX_MINOR_DIVISIONS:
+            return step
+    return steps[-1]
+
+
+def _aligned_range(first, lower, upper, step):
+    # The integers from lower to upper, inclusive, *step* apart and in phase
+    # with *first*.
+    start = first + -((first - lower) // step) * step
+    return np.arange(start, upper + 1, step, dtype=np.int64)
+
+
+class CFTimeMinorLocator(mticker.Locator):
+    """Minor tick locator subdividing the major ticks of a cftime axis.
+
+    The minor ticks follow the resolution of the major
+    :py:class:`NetCDFTimeDateLocator`:
+
+    * Major ticks fewer than four units apart are subdivided into at most
+      twelve parts of the next finer resolution, e.g. every month or quarter
+      between yearly ticks, or every two or six hours between daily ticks.
+      Consecutive months are subdivided at every day.
+    * Major ticks further apart are subdivided at every unit, if there are at
+      most twelve, and otherwise into five, four, three or two equal parts.
+
+    The ticks are computed with array arithmetic on day numbers, so that
+    thousands of minor ticks cost no more than a handful.
+
+    Parameters
+    ----------
+    major : NetCDFTimeDateLocator, optional
+        The locator of the major ticks.  By default, the major locator of the
+        axis, for example::
+
+            ax.xaxis.set_minor_locator(nc_time_axis.CFTimeMinorLocator())
+
+    """
+
+    #: The number of ticks beyond which :py:meth:`tick_values` warns.
+    MAXTICKS = 10_000
+
+    def __init__(self, major=None):
+        self.major = major
+
+    def __call__(self):
+        if self.axis is None:
+            emsg = "An axis is needed to locate minor ticks in its view."
+            raise ValueError(emsg)
+        vmin, vmax = self.axis.get_view_interval()
+        return self.tick_values(vmin, vmax)
+
+    def _major_locator(self):
+        if self.major is not None:
+            return self.major
+        get_major_locator = getattr(self.axis, "get_major_locator", None)
+        if get_major_locator is None:
+            emsg = "A major locator is needed to locate minor ticks without an axis."
+            raise ValueError(emsg)
+        return get_major_locator()
+
+    @_instrument.instrumented("CFTimeMinorLocator.tick_values", "result")
+    def tick_values(self, vmin, vmax):
+        """Return the minor tick values between *vmin* and *vmax*.
+
+        No minor ticks are given for a major locator other than a
+        :py:class:`NetCDFTimeDateLocator`, or for a calendar or range of
+        dates which cannot be handled with array arithmetic.
+
+        """
+        if vmax < vmin:
+            vmin, vmax = vmax, vmin
+        major = self._major_locator()
+        if (
+            not isinstance(major, NetCDFTimeDateLocator)
+            or major.date_unit != _TIME_UNITS
+        ):
+            return np.array([])
+        resolution, majors = major._tick_values_unchanged(vmin, vmax)  # noqa: SLF001
+        ticks = None
+        if len(majors):
+            if resolution in ("YEARLY", "MONTHLY"):
+                ticks = self._month_ticks(
+                    major.calendar, resolution, majors, vmin, vmax
+                )
+            else:
+                ticks = self._uniform_ticks(
+                    major.calendar, resolution, majors, vmin, vmax
+                )
+        if ticks is None:
+            return np.array([])
+        return self.raise_if_exceeds(ticks)
+
+    @staticmethod
+    def _month_ticks(calendar, resolution, majors, vmin, vmax):
+        fields = _calendar.num2fields(np.concatenate([[vmin, vmax], majors]), calendar)
+        if fields is None:
+            return None
+        months = _calendar.month_numbers(*fields[:2])
+        lower, upper, *major_months = months.tolist()
+        gaps = np.diff(major_months)
+        step = int(gaps[gaps > 0].min()) if np.any(gaps > 0) else 1
+        if resolution == "YEARLY":
+            years = max(step // 12, 1)
+            if years < _MIN_MINOR_DIVISIONS:
+                step = _finer_step(12 * years, _FINER_STEPS["YEARLY"])
+            else:
+                step = 12 * _minor_step(years)
+        elif step == 1:
+            # Every day, which are uniform in day numbers in every calendar.
+            return np.arange(np.ceil(vmin), np.floor(vmax) + 1, dtype=np.int64)
+        else:
+            step = _minor_step(step)
+        months = _aligned_range(major_months[0], lower, upper, step)
+        days = _calendar.month_number_days(calendar, months)
+        if days is None:
+            return None
+        return days[(days >= vmin) & (days <= vmax)]
+
+    @staticmethod
+    def _uniform_ticks(calendar, resolution, majors, vmin, vmax):
+        unit_us = _RESOLUTION_MICROSECONDS[resolution]
+        decoded = _calendar.decode_microseconds(
+            np.concatenate([[vmin, vmax], majors]),
+            _RESOLUTION_MICROSECONDS["DAILY"],
+            calendar,
+        )
+        if decoded is None:
+            return None
+        lower, upper, *major_us = decoded[0].tolist()
+        gaps = np.diff(major_us)
+        step = round(gaps[gaps > 0].min() / unit_us) if np.any(gaps > 0) else 1
+        if step < _MIN_MINOR_DIVISIONS:
+            step_us = _finer_step(max(step, 1) * unit_us, _FINER_STEPS[resolution])
+        else:
+            step_us = _minor_step(step) * unit_us
+        ticks = _aligned_range(major_us[0], lower, upper, step_us)
+        return _calendar.microseconds_to_num(ticks)
+
+
+#: The strategies for checking that a sequence of dates shares one calendar,
+#: see :py:attr:`NetCDFTimeConverter.calendar_check`.
+CALENDAR_CHECKS = ("full", "sample", "type", "none")
+
+# The number of dates inspected by the "sample" calendar check.
+_CALENDAR_CHECK_SAMPLES = 100
+
+
+# The number of elements of an object array sampled for its key in the
+# conversion cache.
+_CONVERSION_CACHE_SAMPLES = 64
+
+# Converted object arrays, see NetCDFTimeConverter.conversion_cache_size.
+_conversion_cache = LRUCache(0)
+
+
+def _conversion_cache_key(array, calendar):
+    # A cheap fingerprint of an object array.  Sampling the identities of its
+    # dates, rather than of the array itself, also matches copies of the
+    # array, such as those matplotlib takes of plotted data.
+    flat = array.reshape(-1)
+    indices = np.unique(
+        np.linspace(
+            0, flat.size - 1, min(flat.size, _CONVERSION_CACHE_SAMPLES), dtype=int
+        )
+    )
+    return array.shape, calendar, tuple(map(id, flat[indices]))
+
+
+def _date_ids(array):
+    # The identities of all the dates of an object array.  The dates of a
+    # cached conversion are kept alive by its source array, so an array with
+    # the same identities holds the very same, immutable, dates.
+    flat = array.reshape(-1)
+    return np.fromiter(map(id, flat), dtype=np.uintp, count=flat.size)
+
+
+def _forget_conversion(key, ref):
+    # Drop a cached conversion once its source array has been collected.
+    entry = _conversion_cache.peek(key)
+    if entry is not None and entry[0] is ref:
+        _conversion_cache.pop(key)
+
+
+def _index_calendar(index):
+    """Return the calendar of a CFTimeIndex-like index of dates, or None.
+
+    An index of cftime dates, such as :py:class:`xarray.CFTimeIndex`, holds a
+    single type of date and exposes its ``calendar`` and ``date_type``, so
+    neither needs to be found by inspecting the dates.
+
+    """
+    calendar = getattr(index, "calendar", None)
+    if isinstance(calendar, str) and hasattr(index, "date_type"):
+        return calendar
+    return None
+
+
+def _is_index(value):
+    # pandas and xarray indexes, which unpack to a numpy array of dates.
+    return not isinstance(value, np.ndarray) and hasattr(value, "to_numpy")
+
+
+class _AxisState(NamedTuple):
+    # The state shared by the axes of one calendar and date type.
+    tick_cache: LRUCache
+    default_limits: tuple[object, object]
+    locators: weakref.WeakSet[NetCDFTimeDateLocator]
+
+
+# The _AxisState of each (calendar, date type), see NetCDFTimeConverter.axisinfo.
+_axis_states: dict[tuple[str, type], _AxisState] = {}
+
+
+def _axis_state(calendar, date_type):
+    key = (calendar, date_type)
+    state = _axis_states.get(key)
+    if state is None:
+        if date_type is CalendarDateTime:
+            datemin = CalendarDateTime(cftime.datetime(2000, 1, 1), calendar=calendar)
+            datemax = CalendarDateTime(cftime.datetime(2010, 1, 1), calendar=calendar)
+        elif date_type is CFTimeArray:
+            datemin = cftime.datetime(2000, 1, 1, calendar=calendar)
+            datemax = cftime.datetime(2010, 1, 1, calendar=calendar)
+        else:
+            datemin = date_type(2000, 1, 1)
+            datemax = date_type(2010, 1, 1)
+        state = _AxisState(
+            LRUCache(NetCDFTimeDateLocator.tick_cache_size),
+            (datemin, datemax),
+            weakref.WeakSet(),
+        )
+        state = _axis_states.setdefault(key, state)
+    return state
+
+
+def _validate_calendar_check(check):
+    if check not in CALENDAR_CHECKS:
+        emsg = (
+            f"Unknown calendar check {check!r}, expected one of "
+            f"{', '.join(CALENDAR_CHECKS)}."
+        )
+        raise ValueError(emsg)
+
+
+class NetCDFTimeConverter(mdates.DateConverter):
+    """Converter for :py:class:`cftime.datetime` data."""
+
+    standard_unit = "days since 2000-01-01"
+
+    #: How :py:meth:`default_units` checks that a sequence of dates shares
+    #: one calendar, one of :py:data:`CALENDAR_CHECKS`:
+    #:
+    #: * ``"full"`` compares the calendar of every date.
+    #: * ``"sample"`` compares the calendars of an evenly spaced sample of
+    #:   the dates, including the first and last.
+    #: * ``"type"`` accepts the dates without comparing their calendars if
+    #:   they are all of the same calendar-specific subclass of
+    #:   :py:class:`cftime.datetime`, e.g. :py:class:`cftime.Datetime360Day`,
+    #:   and otherwise compares the calendar of every date.  It still visits
+    #:   every date, to find its type, so is cheaper than ``"full"`` but
+    #:   remains proportional to the number of dates.
+    #: * ``"none"`` trusts the dates and uses the calendar of the first.
+    #:
+    #: Only ``"sample"`` and ``"none"`` avoid visiting every date of a list or
+    #: object array.  The calendar of a :py:class:`CFTimeArray` or of an index
+    #: such as :py:class:`xarray.CFTimeIndex` is always taken from its
+    #: metadata, without visiting its dates.
+    #:
+    #: See also :py:func:`calendar_check`.
+    calendar_check = "full"
+
+    #: The maximum number of converted object arrays remembered by
+    #: :py:meth:`convert`, which is useful when the same array of dates is
+    #: plotted many times, e.g. once per ensemble member.  Arrays are
+    #: recognised by their shape, calendar and the identity of every one of
+    #: their dates, so a copy of an array sharing its dates is recognised,
+    #: but an array with any other date is converted again.  Conversions are
+    #: forgotten when their array is garbage collected.  The default of zero
+    #: disables the cache.
+    conversion_cache_size = 0
+
+    #: The number of threads converting the chunks of a chunked array, such as
+    #: a :py:class:`dask.array.Array`.  The default of ``None`` uses the
+    #: default of :py:class:`concurrent.futures.ThreadPoolExecutor`.
+    conversion_workers = None
+
+    #: The number of dates from which an object array is converted in a pool
+    #: of :py:attr:`process_workers` processes, writing into shared memory,
+    #: rather than in the calling thread.  The processes are started with the
+    #: default start method of the platform, and each is given its slice of
+    #: the dates.  This only pays for very large arrays, of tens of millions
+    #: of dates, where the start method is ``"fork"``, as otherwise the dates
+    #: are pickled to the processes.  The chunks of a chunked array are never
+    #: converted in processes.  The default of ``None`` disables the process
+    #: pool.
+    process_threshold = None
+
+    #: The number of processes converting an array of at least
+    #: :py:attr:`process_threshold` dates.  The default of ``None`` uses one
+    #: process per CPU.
+    process_workers = None
+
+    @staticmethod
+    @_instrument.instrumented("NetCDFTimeConverter.axisinfo")
+    def axisinfo(unit, axis):
+        """Returns the :class:`~matplotlib.units.AxisInfo` for *unit*.
+
+        *unit* is the ``(calendar, units, date type)`` given by
+        :py:meth:`default_units`.  The locators handed out for each calendar
+        and date type share one cache of ticks, so new subplots start with
+        the ticks of those already drawn.  If *axis* already has the locator
+        and formatter of a previous call for the same calendar and date type,
+        e.g. when its units are set again, they are handed out again rather
+        than replaced.
+        """
+        calendar, _, date_type = unit
+        state = _axis_state(calendar, date_type)
+        state.tick_cache.maxsize = NetCDFTimeDateLocator.tick_cache_size
+        majloc = majfmt = None
+        if axis is not None:
+            majloc = axis.get_major_locator()
+            majfmt = axis.get_major_formatter()
+        if (
+            majloc not in state.locators
+            or not isinstance(majfmt, AutoCFTimeFormatter)
+            or majfmt.locator is not majloc
+        ):
+            majloc = NetCDFTimeDateLocator(
+                4, calendar=calendar, tick_cache=state.tick_cache
+            )
+            majfmt = AutoCFTimeFormatter(majloc, calendar=calendar)
+            state.locators.add(majloc)
+        return munits.AxisInfo(
+            majloc=majloc,
+            majfmt=majfmt,
+            label="",
+            default_limits=state.default_limits,
+        )
+
+    @classmethod
+    @_instrument.instrumented("NetCDFTimeConverter.default_units", "value")
+    def default_units(cls, sample_point, axis):
+        """Computes some units for the given data point.
+
+        How thoroughly a sequence of dates is checked for a single calendar
+        depends on :py:attr:`calendar_check`.  The calendar of a
+        :py:class:`CFTimeArray`, or of a CFTimeIndex-like index such as
+        :py:class:`xarray.CFTimeIndex`, is taken from its metadata.  Only the
+        first chunk of a chunked array, such as a :py:class:`dask.array.Array`,
+        is checked, to avoid computing the whole array.
+
+        """
+        index_calendar = (
+            _index_calendar(sample_point) if _is_index(sample_point) else None
+        )
+        if isinstance(sample_point, CFTimeArray):
+            calendar = sample_point.calendar
+            date_type = CFTimeArray
+        elif index_calendar is not None:
+            calendar = index_calendar
+            date_type = sample_point.date_type
+        elif hasattr(sample_point, "__iter__"):
+            if _is_index(sample_point):
+                sample_point = sample_point.to_numpy()
+            elif _parallel.is_chunked(sample_point):
+                sample_point = _parallel.first_chunk(sample_point)
+            # Deal with n-D `sample_point` arrays.
+            if isinstance(sample_point, np.ndarray):
+                sample_point = sample_point.reshape(-1)
+            calendar = cls._check_calendars(sample_point)
+            date_type = type(sample_point[0])
+        else:
+            # Deal with a single `sample_point` value.
+            if not hasattr(sample_point, "calendar"):
+                msg = 'Expecting cftimes with an extra "calendar" attribute.'
+                raise ValueError(msg)
+            calendar = sample_point.calendar
+            date_type = type(sample_point)
+        if calendar == "":
+            raise ValueError(
+                "A calendar must be defined to plot dates using a cftime axis."
+            )
+        return calendar, _TIME_UNITS, date_type
+
+    @classmethod
+    def _check_calendars(cls, points):
+        """Return the calendar shared by a sequence of dates."""
+        check = cls.calendar_check
+        _validate_calendar_check(check)
+        calendar = points[0].calendar
+        if check == "none":
+            return calendar
+        if check == "sample":
+            count = len(points)
+            indices = np.unique(
+                np.linspace(
+                    0, count - 1, min(count, _CALENDAR_CHECK_SAMPLES), dtype=int
+                )
+            )
+            points = [points[index] for index in indices]
+        elif check == "type":
+            date_types = set(map(type, points))
+            date_type = date_types.pop()
+            if (
+                not date_types
+                and issubclass(date_type, cftime.datetime)
+                and date_type is not cftime.datetime
+            ):
+                return calendar
+        if set(map(attrgetter("calendar"), points)) != {calendar}:
+            raise ValueError("Calendar units are not all equal.")
+        return calendar
+
+    @classmethod
+    @_instrument.instrumented("NetCDFTimeConverter.convert", "value")
+    def convert(cls, value, unit, axis):
+        """Converts value, if it is not already a number or sequence of numbers,
+        with :py:func:`cftime.date2num`.
+
+        Sequences of dates in the calendars supported by cftime are converted
+        in bulk with array arithmetic on their date fields, which gives the
+        same result as :py:func:`cftime.date2num` without its per-object cost.
+        The values of a :py:class:`CFTimeArray` are rebased to the units of the
+        axis without creating any dates, as are those of a list of them, such
+        as :py:meth:`~matplotlib.axes.Axes.axvline` makes of an element of a
+        :py:class:`CFTimeArray`.  Indexes of dates, such as
+        :py:class:`xarray.CFTimeIndex`, are converted as the array of their
+        dates.  Chunked arrays, such as :py:class:`dask.array.Array`, are
+        converted chunk by chunk on a thread pool of
+        :py:attr:`conversion_workers` threads.
+
+        """
+        if isinstance(value, CFTimeArray):
+            return value.to_axis_units()
+        if isinstance(value, (list, tuple)) and isinstance(
+            next(iter(value), None), CFTimeArray
+        ):
+            return np.array([item.to_axis_units() for item in value])
+        if _parallel.is_chunked(value):
+            # Processes are not started from the threads converting the
+            # chunks, which would fork a multithreaded process.
+            return _parallel.convert_chunks(
+                value,
+                functools.partial(cls._convert_dates, in_processes=False),
+                cls.conversion_workers,
+            )
+        if _is_index(value):
+            value = value.to_numpy()
+        return cls._convert_dates(value)
+
+    @classmethod
+    def _convert_dates(cls, value, *, in_processes=True):
+        shape = None
+        source = None
+        if isinstance(value, np.ndarray):
+            # Don't do anything with numeric types.
+            if value.dtype != object:
+                return value
+            source = value
+            shape = value.shape
+            value = value.reshape(-1)
+            first_value = value[0]
+        else:
+            # Not an array but a list of non-numerical types (thus assuming datetime types)
+            if isinstance(value, (list, tuple)):
+                first_value = value[0]
+            else:
+                # Neither numerical, list or ndarray : must be a datetime scalar.
+                first_value = value
+
+        if not isinstance(first_value, (CalendarDateTime, cftime.datetime)):
+            raise ValueError(
+                "The values must be numbers or instances of "
+                '"nc_time_axis.CalendarDateTime" or '
+                '"cftime.datetime".'
+            )
+
+        if isinstance(first_value, CalendarDateTime):
+            if not isinstance(first_value.datetime, cftime.datetime):
+                raise ValueError(
+                    "The datetime attribute of the "
+                    "CalendarDateTime object must be of type "
+                    "`cftime.datetime`."
+                )
+
+        cache_key = None
+        if source is not None and cls.conversion_cache_size > 0:
+            cache_key = _conversion_cache_key(source, first_value.calendar)
+            date_ids = _date_ids(source)
+            cached = _conversion_cache.get(
+                cache_key,
+                valid=lambda entry: (
+                    entry[0]() is not None and np.array_equal(entry[1], date_ids)
+                ),
+            )
+            if cached is not None:
+                return cached[2].copy()
+
+        if isinstance(first_value, CalendarDateTime):
+            if isinstance(value, (np.ndarray, list, tuple)):
+                value = [v.datetime for v in value]
+            else:
+                value = value.datetime
+
+        threshold = cls.process_threshold
+        if (
+            in_processes
+            and threshold is not None
+            and isinstance(value, np.ndarray)
+            and len(value) >= threshold
+        ):
+            result = _parallel.convert_in_processes(
+                value, first_value.calendar, cls.process_workers
+            )
+        else:
+            result = _calendar.date2num(
+                value, _TIME_UNITS, calendar=first_value.calendar
+            )
+
+        if shape is not None:
+            result = result.reshape(shape)
+
+        if cache_key is not None:
+            _conversion_cache.maxsize = cls.conversion_cache_size
+            ref = weakref.ref(source, functools.partial(_forget_conversion, cache_key))
+            _conversion_cache.put(cache_key, (ref, date_ids, result.copy()))
+
+        return result
+
+    @staticmethod
+    def conversion_cache_info():
+        """Return the hit and miss statistics of the conversion cache.
+
+        Returns
+        -------
+        :py:class:`collections.namedtuple`
+            The ``hits``, ``misses``, ``maxsize`` and ``currsize`` of the
+            cache, as for :py:func:`functools.lru_cache`.
+
+        """
+        return _conversion_cache.info()
+
+    @staticmethod
+    def conversion_cache_clear():
+        """Discard the cached conversions and reset their statistics."""
+        _conversion_cache.clear()
+
+
+class DecimatedLine(mlines.Line2D):
+    """A line which only draws the points resolvable in the current view.
+
+    The full series is held once, and on each draw it is reduced to the
+    points holding the minimum and maximum value of each pixel column of the
+    view, see :py:func:`plot_decimated`.  This draws the same envelope as the
+    full series, at a cost bounded by the width of the axes rather than the
+    length of the series, and zooming in refines the line automatically.
+
+    Parameters
+    ----------
+    xdata : array-like
+        The sorted, numeric x values, e.g. converted cftime dates.
+    ydata : array-like
+        The numeric y values.
+
+    Notes
+    -----
+    :py:meth:`get_data` returns the reduced series last drawn, while
+    :py:meth:`set_data` replaces the full series.
+
+    """
+
+    #: The number of bins used to reduce the series before it is drawn.
+    initial_bins = 2048
+
+    def __init__(self, xdata, ydata, **kwargs):
+        self._full_x: np.ndarray | None = None
+        self._full_y: np.ndarray | None = None
+        self._view: tuple[float, float, int] | None = None
+        super().__init__(xdata, ydata, **kwargs)
+
+    def set_data(self, *args):
+        """Set the full x and y series of the line."""
+        xdata, ydata = args[0] if len(args) == 1 else args
+        x = np.asarray(xdata, dtype=float).reshape(-1)
+        y: np.ndarray = np.ma.filled(np.ma.asarray(ydata, dtype=float), np.nan)
+        y = y.reshape(-1)
+        if x.shape != y.shape:
+            msg = f"x and y must have the same length, got {x.size} and {y.size}."
+            raise ValueError(msg)
+        if np.any(np.diff(x) < 0):
+            order = np.argsort(x, kind="stable")
+            x, y = x[order], y[order]
+        self._full_x, self._full_y = x, y
+        self._view = None
+        # The reduction keeps the extremes of the series, so the data limits
+        # of the axes are those of the full series.
+        if len(x):
+            x, y = _decimate.minmax(x, y, x[0], x[-1], self.initial_bins)
+        super().set_data(x, y)
+
+    def _decimate(self, axes):
+        full_x, full_y = self._full_x, self._full_y
+        if full_x is None or full_y is None or not len(full_x):
+            return
+        lower, upper = sorted(axes.get_xlim())
+        bins = max(round(axes.bbox.width), 1)
+        view = (lower, upper, bins)
+        if view != self._view:
+            self._view = view
+            x, y = _decimate.minmax(full_x, full_y, lower, upper, bins)
+            super().set_data(x, y)
+
+    def draw(self, renderer):
+        """Draw the line, reduced to the resolution of the current view."""
+        if self.axes is not None:
+            self._decimate(self.axes)
+        super().draw(renderer)
+
+
+def plot_decimated(ax, x, y, **kwargs):
+    """Plot a long series as a :py:class:`DecimatedLine`.
+
+    The x values, e.g. :py:class:`cftime.datetime` objects or a
+    :py:class:`CFTimeArray`, are converted to numbers once, with the converter
+    of the x axis of *ax*.  Each draw then only renders the minimum and
+    maximum of the series within each pixel column of the view, e.g.::
+
+        line = nc_time_axis.plot_decimated(ax, times, values, color="k")
+
+    Parameters
+    ----------
+    ax : :py:class:`matplotlib.axes.Axes`
+        The axes to plot in.
+    x : array-like
+        The sorted times of the series.
+    y : array-like
+        The values of the series.
+    **kwargs
+        Properties of the :py:class:`matplotlib.lines.Line2D`.
+
+    Returns
+    -------
+    :py:class:`DecimatedLine`
+        The line added to *ax*.
+
+    """
+    ax.xaxis.update_units(x)
+    ax.yaxis.update_units(y)
+    line = DecimatedLine(ax.xaxis.convert_units(x), ax.yaxis.convert_units(y), **kwargs)
+    ax.add_line(line)
+    ax.autoscale_view()
+    return line
+
+
+class WindowedLine(mlines.Line2D):
+    """A line through sorted dates which only converts the dates in view.
+
+    The dates are indexed once, and on each draw the slice of them covering
+    the view, plus a :py:attr:`margin`, is found by binary search.  Only the
+    dates of that slice which have not been drawn before are converted, and
+    the slice is drawn at the resolution of the view, as for a
+    :py:class:`DecimatedLine`.  See :py:func:`plot_windowed`.
+
+    Parameters
+    ----------
+    dates : sequence of :py:class:`cftime.datetime`
+        The dates of the series, which must share one calendar.
+    ydata : array-like
+        The numeric y values.
+    assume_sorted : bool, default=False
+        Whether the dates are known to be in ascending order.  Otherwise their
+        order is checked, and unsorted dates are sorted.
+
+    Notes
+    -----
+    Until the line is first drawn, :py:meth:`get_data` returns only the
+    corners of the bounding box of the series.
+
+    """
+
+    #: The fraction of the view interval converted either side of the view, so
+    #: that panning by less than it converts no dates.
+    margin = 0.5
+
+    def __init__(self, dates, ydata, *, assume_sorted=False, **kwargs):
+        self._index = _window.DateIndex(dates, assume_sorted=assume_sorted)
+        y: np.ndarray = np.ma.filled(np.ma.asarray(ydata, dtype=float), np.nan)
+        y = y.reshape(-1)
+        if len(y) != len(self._index):
+            msg = (
+                "dates and ydata must have the same length, got "
+                f"{len(self._index)} and {len(y)}."
+            )
+            raise ValueError(msg)
+        if self._index.order is not None:
+            y = y[self._index.order]
+        self._full_y = y
+        self._view = None
+        # Start with the bounding box of the series, for the data limits.
+        first, last = self._index.bounds()
+        super().__init__([first, last], [np.nanmin(y), np.nanmax(y)], **kwargs)
+
+    def converted_count(self):
+        """Return the number of dates converted so far."""
+        return self._index.converted_count()
+
+    def draw(self, renderer):
+        """Draw the part of the line in view, at the resolution of the view."""
+        if self.axes is not None:
+            lower, upper = sorted(self.axes.get_xlim())
+            bins = max(round(self.axes.bbox.width), 1)
+            view = (lower, upper, bins)
+            if view != self._view:
+                self._view = view
+                start, stop = self._index.window(lower, upper, self.margin)
+                x, y = _decimate.minmax(
+                    self._index.days(start, stop),
+                    self._full_y[start:stop],
+                    lower,
+                    upper,
+                    bins,
+                )
+                self.set_data(x, y)
+        super().draw(renderer)
+
+
+def plot_windowed(ax, dates, y, *, assume_sorted=False, **kwargs):
+    """Plot a long series of sorted dates as a :py:class:`WindowedLine`.
+
+    Only the dates within, or near, the view are ever converted, which keeps
+    zooming into long, e.g. century-long hourly, records responsive::
+
+        line = nc_time_axis.plot_windowed(ax, times, values, assume_sorted=True)
+
+    Parameters
+    ----------
+    ax : :py:class:`matplotlib.axes.Axes`
+        The axes to plot in.
+    dates : sequence of :py:class:`cftime.datetime`
+        The dates of the series.
+    y : array-like
+        The values of the series.
+    assume_sorted : bool, default=False
+        Whether the dates are known to be in ascending order.
+    **kwargs
+        Properties of the :py:class:`matplotlib.lines.Line2D`.
+
+    Returns
+    -------
+    :py:class:`WindowedLine`
+        The line added to *ax*.
+
+    """
+    dates = np.asarray(dates, dtype=object).reshape(-1)
+    ax.xaxis.update_units(dates)
+    ax.yaxis.update_units(y)
+    line = WindowedLine(
+        dates, ax.yaxis.convert_units(y), assume_sorted=assume_sorted, **kwargs
+    )
+    ax.add_line(line)
+    ax.autoscale_view()
+    return line
+
+
+class StreamingLine(mlines.Line2D):
+    """A line through dates which are appended to while it is plotted.
+
+    The dates are converted as they are appended, and their numeric time
+    values are kept in a growable buffer, so each update converts only its
+    new dates rather than the whole history of the series.  See
+    :py:func:`plot_streaming`.
+
+    Parameters
+    ----------
+    dates : sequence of :py:class:`cftime.datetime`
+        The dates of the series so far, which must share one calendar.  This
+        may be empty if *calendar* is given.
+    ydata : array-like
+        The numeric y values.
+    calendar : str, optional
+        The calendar of the dates, by default that of the first date.
+
+    Notes
+    -----
+    matplotlib still copies the numeric x and y values of the line on each
+    update, but that costs far less than converting the dates again.
+
+    """
+
+    def __init__(self, dates, ydata, *, calendar=None, **kwargs):
+        self.calendar = calendar
+        self._days = _stream.GrowableArray()
+        self._full_y = _stream.GrowableArray()
+        super().__init__([], [], **kwargs)
+        self.append(dates, ydata)
+
+    def converted_count(self):
+        """Return the number of dates converted so far."""
+        return len(self._days)
+
+    def append(self, dates, ydata):
+        """Append dates, and their y values, to the line.
+
+        Parameters
+        ----------
+        dates : :py:class:`cftime.datetime` or sequence of them
+            The new dates, in the calendar of the line.
+        ydata : float or array-like
+            The new numeric y values.
+
+        """
+        dates = np.asarray(dates, dtype=object).reshape(-1)
+        y: np.ndarray = np.ma.filled(np.ma.asarray(ydata, dtype=float), np.nan)
+        y = y.reshape(-1)
+        if len(y) != len(dates):
+            msg = (
+                "dates and ydata must have the same length, got "
+                f"{len(dates)} and {len(y)}."
+            )
+            raise ValueError(msg)
+        if len(dates):
+            calendar, units, _ = NetCDFTimeConverter.default_units(dates, None)
+            if self.calendar is None:
+                self.calendar = calendar
+            elif calendar != self.calendar:
+                msg = (
+                    f"Cannot append dates of the {calendar!r} calendar to a line "
+                    f"of the {self.calendar!r} calendar."
+                )
+                raise ValueError(msg)
+            self._days.append(NetCDFTimeConverter.convert(dates, units, None))
+            self._full_y.append(y)
+        self.set_data(self._days.values, self._full_y.values)
+
+
+def plot_streaming(ax, dates, y, **kwargs):
+    """Plot a series which will be appended to as a :py:class:`StreamingLine`.
+
+    New dates are converted as they are appended with
+    :py:meth:`StreamingLine.append`, which suits live plots updated by a
+    :py:class:`matplotlib.animation.FuncAnimation`, e.g.::
+
+        line = nc_time_axis.plot_streaming(ax, times, values)
+
+        def update(frame):
+            line.append(*read_new_timesteps())
+            ax.relim()
+            ax.autoscale_view()
+            return (line,)
+
+        animation = FuncAnimation(fig, update, interval=5000, cache_frame_data=False)
+
+    Parameters
+    ----------
+    ax : :py:class:`matplotlib.axes.Axes`
+        The axes to plot in.
+    dates : sequence of :py:class:`cftime.datetime`
+        The dates of the series so far, of which there must be at least one
+        to set the units of the x axis.
+    y : array-like
+        The values of the series so far.
+    **kwargs
+        Properties of the :py:class:`matplotlib.lines.Line2D`.
+
+    Returns
+    -------
+    :py:class:`StreamingLine`
+        The line added to *ax*.
+
+    """
+    dates = np.asarray(dates, dtype=object).reshape(-1)
+    ax.xaxis.update_units(dates)
+    ax.yaxis.update_units(y)
+    line = StreamingLine(dates, ax.yaxis.convert_units(y), **kwargs)
+    ax.add_line(line)
+    ax.autoscale_view()
+    return line
+
+
+@contextlib.contextmanager
+def calendar_check(check):
+    """Temporarily set how the calendars of plotted dates are checked.
+
+    Within the context, :py:attr:`NetCDFTimeConverter.calendar_check` is set
+    to *check*, e.g. to skip the check for trusted data::
+
+        with nc_time_axis.calendar_check("none"):
+            plt.plot(times, data)
+
+    Parameters
+    ----------
+    check : str
+        One of :py:data:`CALENDAR_CHECKS`.
+
+    """
+    _validate_calendar_check(check)
+    previous = NetCDFTimeConverter.calendar_check
+    NetCDFTimeConverter.calendar_check = check
+    try:
+        yield
+    finally:
+        NetCDFTimeConverter.calendar_check = previous
+
+
+# Automatically register NetCDFTimeConverter with matplotlib.unit's converter
+# dictionary.  All types share the converter of the cftime types, which is
+# registered as soon as matplotlib is imported.
+CFTIME_TYPES = [getattr(cftime, name) for name in _lazy.CFTIME_TYPE_NAMES]
+for date_type in (CalendarDateTime, CFTimeArray, *CFTIME_TYPES):
+    if date_type not in munits.registry:
+        munits.registry[date_type] = _lazy.CONVERTER
@@ -0,0 +1,71 @@
+"""Reduction of long, sorted series to the points visible at screen resolution.
+
+:py:func:`minmax` keeps the points holding the minimum and the maximum of
+each pixel column of a view, which draws the same envelope as the full
+series while its size is bounded by the width of the view, not the length of
+the series.
+
+"""
+
+import numpy as np
+
+
+def _first_in_segments(matches, segments):
+    # Index of the first match within each segment, for the segment of each
+    # point given by the non-decreasing *segments*.
+    index = np.flatnonzero(matches)
+    _, first = np.unique(segments[index], return_index=True)
+    return index[first]
+
+
+def minmax(x, y, xmin, xmax, bins):
+    """Reduce a series to the minimum and maximum within each bin of a view.
+
+    Parameters
+    ----------
+    x : :py:class:`numpy.ndarray`
+        The sorted, one-dimensional x values of the series.
+    y : :py:class:`numpy.ndarray`
+        The float y values of the series, with NaN for missing values.
+    xmin, xmax : float
+        The x range of the view.
+    bins : int
+        The number of bins across the view, typically its width in pixels.
+
+    Returns
+    -------
+    tuple of :py:class:`numpy.ndarray`
+        The x and y values of the reduced series, in the order of *x*.  The
+        points either side of the view are kept, so that the line continues
+        to its edges.
+
+    """
+    start = max(np.searchsorted(x, xmin, side="left") - 1, 0)
+    stop = min(np.searchsorted(x, xmax, side="right") + 1, len(x))
+    # Two points per bin, plus the points either side of the view.
+    if stop - start <= 2 * bins + 2 or xmax <= xmin:
+        return x[start:stop], y[start:stop]
+    xs = x[start:stop]
+    ys = y[start:stop]
+    edges = np.linspace(xmin, xmax, bins + 1)
+    # The points either side of the view join the first and last bins.
+    starts = np.unique(np.searchsorted(xs, edges[1:-1], side="left"))
+    starts = np.concatenate([[0], starts[(starts > 0) & (starts < len(xs))]])
+    segments = np.zeros(len(xs), dtype=np.intp)
+    segments[starts[1:]] = 1
+    segments = np.cumsum(segments)
+    counts = np.diff(np.append(starts, len(xs)))
+    # fmin and fmax ignore missing values, unless all of a bin is missing, in
+    # which case its first missing value is kept to break the line.
+    lows = np.repeat(np.fmin.reduceat(ys, starts), counts)
+    highs = np.repeat(np.fmax.reduceat(ys, starts), counts)
+    missing = np.isnan(ys) & np.isnan(lows)
+    index = np.concatenate(
+        [
+            _first_in_segments((ys == lows) | missing, segments),
+            _first_in_segments((ys == highs) | missing, segments),
+            [0, len(xs) - 1],
+        ]
+    )
+    index = np.unique(index)
+    return xs[index], ys[index]
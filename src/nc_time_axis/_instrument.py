@@ -0,0 +1,130 @@
+"""Optional call counts and timings of the hot paths of nc-time-axis.
+
+The functions decorated with :py:func:`instrumented` record their number of
+calls, the number of elements they processed and their cumulative wall time,
+but only while instrumentation is enabled with :py:func:`instrument`.
+Otherwise the cost of the decorator is a single check of a flag.
+
+"""
+
+import contextlib
+import functools
+import threading
+import time
+from typing import NamedTuple
+
+
+class CallStats(NamedTuple):
+    """Statistics of the calls to an instrumented function."""
+
+    calls: int
+    elements: int
+    seconds: float
+
+
+_depth = 0
+_lock = threading.Lock()
+_stats: dict[str, CallStats] = {}
+
+
+def count(value):
+    """Return the number of elements of *value*, without copying it."""
+    size = getattr(value, "size", None)
+    if isinstance(size, int):
+        return size
+    try:
+        return len(value)
+    except TypeError:
+        return 1
+
+
+def _record(name, elements, seconds):
+    with _lock:
+        calls, total, elapsed = _stats.get(name, (0, 0, 0.0))
+        _stats[name] = CallStats(calls + 1, total + elements, elapsed + seconds)
+
+
+def instrumented(name, elements=None):
+    """Decorate a function to record its calls while instrumentation is enabled.
+
+    Parameters
+    ----------
+    name : str
+        The name of the statistics of the function.
+    elements : {None, "value", "result"}, default=None
+        What the elements processed by a call are: the first argument after
+        ``self`` or ``cls``, the result, or, by default, the call itself.
+
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _depth:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            result = func(*args, **kwargs)
+            seconds = time.perf_counter() - start
+            if elements == "value":
+                size = count(args[1])
+            elif elements == "result":
+                size = count(result)
+            else:
+                size = 1
+            _record(name, size, seconds)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+@contextlib.contextmanager
+def instrument(*, reset=True):
+    """Record the calls to the hot paths of nc-time-axis within the context.
+
+    The calls, the number of elements processed and the cumulative wall time
+    of the converter, locator and formatter methods are available from
+    :py:func:`stats`, e.g.::
+
+        with nc_time_axis.instrument():
+            fig.savefig("plot.png")
+        print(nc_time_axis.stats())
+
+    Parameters
+    ----------
+    reset : bool, default=True
+        Whether to discard the statistics recorded before the context.
+
+    """
+    global _depth  # noqa: PLW0603
+    if reset:
+        reset_stats()
+    with _lock:
+        _depth += 1
+    try:
+        yield
+    finally:
+        with _lock:
+            _depth -= 1
+
+
+def stats():
+    """Return the statistics recorded by :py:func:`instrument`.
+
+    Returns
+    -------
+    dict
+        The :py:class:`CallStats` ``calls``, ``elements`` and ``seconds`` of
+        each instrumented method that has been called, by its qualified name,
+        e.g. ``"NetCDFTimeConverter.convert"``.
+
+    """
+    with _lock:
+        return dict(_stats)
+
+
+def reset_stats():
+    """Discard the statistics recorded by :py:func:`instrument`."""
+    with _lock:
+        _stats.clear()
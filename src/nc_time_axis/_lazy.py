@@ -0,0 +1,115 @@
+"""Deferred registration of the cftime converter with matplotlib.
+
+Importing nc-time-axis does not import matplotlib or cftime.  Instead, a
+:py:class:`DeferredConverter` is registered for the cftime date types as soon
+as :py:mod:`matplotlib.units` is imported, whether before or after
+nc-time-axis, and the implementation in :py:mod:`nc_time_axis._core` is only
+imported once matplotlib first uses the converter.
+
+"""
+
+import functools
+import importlib
+import importlib.abc
+import importlib.util
+import sys
+
+#: The name of the matplotlib module holding the converter registry.
+UNITS_MODULE = "matplotlib.units"
+
+#: The names of the :py:mod:`cftime` date types plotted with nc-time-axis.
+CFTIME_TYPE_NAMES = (
+    "datetime",
+    "DatetimeNoLeap",
+    "DatetimeAllLeap",
+    "DatetimeProlepticGregorian",
+    "DatetimeGregorian",
+    "Datetime360Day",
+    "DatetimeJulian",
+)
+
+
+@functools.cache
+def _converter():
+    core = importlib.import_module(f"{__package__}._core")
+    return core.NetCDFTimeConverter()
+
+
+class DeferredConverter:
+    """Stands in for a :py:class:`NetCDFTimeConverter` until it is first used."""
+
+    def __getattr__(self, name):
+        return getattr(_converter(), name)
+
+    def __repr__(self):
+        return f"<{type(self).__name__} for NetCDFTimeConverter>"
+
+
+#: The converter registered with matplotlib for every cftime date type.
+CONVERTER = DeferredConverter()
+
+
+def register(units):
+    """Register :py:data:`CONVERTER` for the cftime date types.
+
+    Parameters
+    ----------
+    units : module
+        The :py:mod:`matplotlib.units` module.
+
+    """
+    import cftime  # noqa: PLC0415
+
+    for name in CFTIME_TYPE_NAMES:
+        date_type = getattr(cftime, name)
+        if date_type not in units.registry:
+            units.registry[date_type] = CONVERTER
+
+
+class _RegisteringLoader(importlib.abc.Loader):
+    # Wraps the loader of matplotlib.units to register once it has loaded.
+
+    def __init__(self, loader):
+        self._loader = loader
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        self._loader.exec_module(module)
+        register(module)
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+
+class _UnitsFinder:
+    # Finds matplotlib.units with the other finders, but with its loader
+    # wrapped by _RegisteringLoader.
+
+    def find_spec(self, fullname, path=None, target=None):
+        if fullname != UNITS_MODULE:
+            return None
+        uninstall()
+        spec = importlib.util.find_spec(fullname)
+        if spec is not None and spec.loader is not None:
+            spec.loader = _RegisteringLoader(spec.loader)
+        return spec
+
+
+_FINDER = _UnitsFinder()
+
+
+def install():
+    """Register the converter now, or once matplotlib has been imported."""
+    units = sys.modules.get(UNITS_MODULE)
+    if units is not None:
+        register(units)
+    elif _FINDER not in sys.meta_path:
+        sys.meta_path.insert(0, _FINDER)
+
+
+def uninstall():
+    """Stop waiting for matplotlib to be imported."""
+    if _FINDER in sys.meta_path:
+        sys.meta_path.remove(_FINDER)
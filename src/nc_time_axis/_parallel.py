@@ -0,0 +1,240 @@
+"""Parallel conversion of large arrays of dates.
+
+Chunked arrays, such as :py:class:`dask.array.Array`, are converted chunk by
+chunk on a thread pool, with each chunk materialised only while it is being
+converted, and the results written straight into the final float array.
+Very large arrays of dates can instead be converted in a pool of processes,
+which unlike threads are not serialised by the GIL while handling each date.
+
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import ctypes
+import itertools
+import multiprocessing
+from multiprocessing import shared_memory
+import os
+import weakref
+
+import numpy as np
+
+from . import _calendar
+
+
+def is_chunked(value):
+    """Return whether *value* is a chunked array, such as a dask array."""
+    return (
+        not isinstance(value, np.ndarray)
+        and hasattr(value, "chunks")
+        and hasattr(value, "map_blocks")
+    )
+
+
+def chunk_slices(chunks):
+    """Return the index of each chunk of an array.
+
+    Parameters
+    ----------
+    chunks : tuple of tuple of int
+        The sizes of the chunks along each dimension, as for
+        :py:attr:`dask.array.Array.chunks`.
+
+    Returns
+    -------
+    list of tuple of slice
+        The slices selecting each chunk, in C order of the chunks.
+
+    """
+    bounds = [np.cumsum((0, *sizes)).tolist() for sizes in chunks]
+    return [
+        tuple(
+            slice(edges[i], edges[i + 1])
+            for edges, i in zip(bounds, index, strict=True)
+        )
+        for index in itertools.product(*(range(len(sizes)) for sizes in chunks))
+    ]
+
+
+def first_chunk(array):
+    """Return the first chunk of a chunked array, as a :py:class:`numpy.ndarray`."""
+    return np.asarray(array[tuple(slice(0, sizes[0]) for sizes in array.chunks)])
+
+
+def convert_chunks(array, convert, workers=None):
+    """Convert a chunked array of dates chunk by chunk on a thread pool.
+
+    Parameters
+    ----------
+    array : chunked array
+        The dates, e.g. a :py:class:`dask.array.Array` of
+        :py:class:`cftime.datetime` objects.
+    convert : callable
+        Converts a :py:class:`numpy.ndarray` chunk of dates to numbers.
+    workers : int, optional
+        The number of threads, by default that of
+        :py:class:`concurrent.futures.ThreadPoolExecutor`.
+
+    Returns
+    -------
+    :py:class:`numpy.ndarray`
+        The time values, of the shape of *array*.  As for an unchunked array,
+        they are int64 if the values of every chunk are integers, and
+        otherwise float64.
+
+    """
+    result = np.empty(array.shape, dtype=np.float64)
+    integral = []
+
+    def convert_chunk(index):
+        values = np.asarray(convert(np.asarray(array[index])))
+        integral.append(values.dtype.kind in "iu")
+        result[index] = values
+
+    slices = chunk_slices(array.chunks)
+    if len(slices) == 1:
+        convert_chunk(slices[0])
+    else:
+        with ThreadPoolExecutor(workers) as pool:
+            # Consume the results to raise any error.
+            for _ in pool.map(convert_chunk, slices):
+                pass
+    if all(integral):
+        return result.astype(np.int64)
+    return result
+
+
+def _convert_slice(connection, buffer, window, calendar, dates):
+    # Convert the dates of the (start, stop) window into the (name, size)
+    # shared float64 buffer, and report the outcome on the connection.
+    name, size = buffer
+    start, stop = window
+    error = None
+    try:
+        shm = shared_memory.SharedMemory(name=name)
+        try:
+            result = np.ndarray((size,), dtype=np.float64, buffer=shm.buf)
+            result[start:stop] = _calendar.date2num(
+                dates, _calendar.TIME_UNITS, calendar=calendar
+            )
+            del result
+        finally:
+            shm.close()
+    except Exception as exception:  # noqa: BLE001
+        error = exception
+    try:
+        connection.send(error)
+    except Exception:  # noqa: BLE001
+        # The error cannot be pickled.
+        connection.send(RuntimeError(repr(error)))
+    finally:
+        connection.close()
+
+
+class _SharedArray:
+    # The base of an array in shared memory, which closes the memory once the
+    # array, and every view of it, has been garbage collected.
+
+    def __init__(self, shm, shape):
+        # A ctypes view of the memory gives numpy its address.
+        data = (ctypes.c_char * shm.size).from_buffer(shm.buf)
+        self.__array_interface__ = {
+            "shape": shape,
+            "typestr": np.dtype(np.float64).str,
+            "data": (ctypes.addressof(data), False),
+            "version": 3,
+        }
+        weakref.finalize(self, _close, [shm, data])
+
+
+def _close(resources):
+    # Release the ctypes view of the memory before closing it.
+    shm = resources.pop(0)
+    resources.clear()
+    shm.close()
+
+
+def convert_in_processes(dates, calendar, workers=None):
+    """Convert a large one-dimensional array of dates in a pool of processes.
+
+    The dates are split into one slice per worker process, which is given its
+    slice as an argument and writes its time values into a
+    :py:mod:`multiprocessing.shared_memory` buffer which becomes the returned
+    array, without a copy.  The processes are started with the default start
+    method of the platform: where that is ``"fork"``, the workers inherit
+    their slice, and otherwise it is pickled to them, which costs more than
+    converting the dates in the calling process.
+
+    The processes should only be started from the main thread, not from the
+    threads converting the chunks of a chunked array.
+
+    Parameters
+    ----------
+    dates : :py:class:`numpy.ndarray`
+        The one-dimensional object array of :py:class:`cftime.datetime`.
+    calendar : str
+        The calendar of the dates.
+    workers : int, optional
+        The number of processes, by default the number of CPUs.
+
+    Returns
+    -------
+    :py:class:`numpy.ndarray`
+        The float64 time values, backed by shared memory which is released
+        when the array is garbage collected.
+
+    Raises
+    ------
+    Exception
+        The error raised by a worker, or :py:class:`RuntimeError` if a worker
+        exited without reporting its outcome.
+
+    """
+    workers = workers or os.cpu_count() or 1
+    size = len(dates)
+    shm = shared_memory.SharedMemory(create=True, size=max(size, 1) * 8)
+    result = np.asarray(_SharedArray(shm, (size,)))
+    bounds = np.linspace(0, size, workers + 1).astype(int).tolist()
+    context = multiprocessing.get_context()
+    processes = []
+    errors = []
+    try:
+        for start, stop in itertools.pairwise(bounds):
+            if stop == start:
+                continue
+            receiver, sender = context.Pipe(duplex=False)
+            process = context.Process(
+                target=_convert_slice,
+                args=(
+                    sender,
+                    (shm.name, size),
+                    (start, stop),
+                    calendar,
+                    dates[start:stop],
+                ),
+                daemon=True,
+            )
+            process.start()
+            # Only the worker writes to its end of the pipe.
+            sender.close()
+            processes.append((process, receiver))
+        for process, receiver in processes:
+            try:
+                errors.append(receiver.recv())
+            except EOFError:
+                process.join()
+                errors.append(
+                    RuntimeError(
+                        f"A conversion process exited with code {process.exitcode}."
+                    )
+                )
+            finally:
+                receiver.close()
+    finally:
+        for process, _ in processes:
+            process.join()
+        # The memory stays mapped, for the result, until it is closed.
+        shm.unlink()
+    for error in errors:
+        if error is not None:
+            raise error
+    return result
@@ -0,0 +1,254 @@
+"""A precomputed index of the tick positions over the data range of an axis.
+
+A :py:class:`TickPyramid` holds the candidate tick positions of a cftime axis
+at each level of detail, over the range of its data, so that the ticks of any
+view within that range are found by lookup instead of calendar arithmetic:
+
+* the first day of every year, for yearly ticks at any step, which are
+  strided views of it,
+* the first day of every month, for monthly ticks, and
+* for daily and finer ticks, which are evenly spaced in day numbers and so
+  need no storage, the years in which they fall.
+
+Unlike the calendar tables of :py:mod:`nc_time_axis._calendar`, the pyramid
+covers the years of the data wherever they are, such as the hundreds of
+millennia of a palaeoclimate run, and its size is bounded.
+
+"""
+
+import math
+import time
+from typing import NamedTuple
+
+import numpy as np
+
+from . import _calendar
+
+#: The default greatest number of tick positions held by a pyramid.
+MAX_POSITIONS = 2_000_000
+
+_MONTHS_PER_YEAR = 12
+_US_PER_DAY = 86_400_000_000
+# Keep the microsecond arithmetic well inside the int64 range.
+_MAX_YEAR_OFFSET = 200_000
+_REAL_WORLD_YEAR_LENGTHS = (365.2425, 365.25)
+
+
+class PyramidInfo(NamedTuple):
+    """The extent, size and build time of a :py:class:`TickPyramid`."""
+
+    years: tuple[int, int]
+    levels: dict[str, int]
+    positions: int
+    nbytes: int
+    seconds: float
+
+
+class YearMonth(NamedTuple):
+    """The year and month of a date, enough to pick the resolution of ticks."""
+
+    year: int
+    month: int
+
+
+class TickPyramid:
+    """The tick positions of a calendar over a range of days since 2000-01-01.
+
+    The pyramid covers the years of the range, padded by half the range on
+    either side for ticks beyond the data and views that pan past it, as far
+    as *max_positions* allows.
+
+    Parameters
+    ----------
+    calendar : str
+        The calendar of the axis.
+    vmin, vmax : float
+        The range of the data, in days since 2000-01-01.
+    max_positions : int, optional
+        The greatest number of tick positions to hold, which bounds both the
+        memory and the build time of the pyramid.
+
+    Raises
+    ------
+    ValueError
+        If the calendar is not supported, or the range spans more years than
+        *max_positions* allows.
+
+    """
+
+    def __init__(self, calendar, vmin, vmax, max_positions=MAX_POSITIONS):
+        start_time = time.perf_counter()
+        if calendar == "gregorian":
+            calendar = "standard"
+        if (
+            calendar not in _calendar.FIXED_MONTH_LENGTHS
+            and calendar not in _calendar.REAL_WORLD_CALENDARS
+        ):
+            emsg = f"A tick pyramid cannot be built for the {calendar!r} calendar."
+            raise ValueError(emsg)
+        vmin, vmax = sorted((float(vmin), float(vmax)))
+        year_lengths: tuple[float, ...]
+        if calendar in _calendar.FIXED_MONTH_LENGTHS:
+            year_lengths = (int(_calendar.FIXED_MONTH_LENGTHS[calendar].sum()),)
+        else:
+            # The mean lengths of the Gregorian and Julian years, within a
+            # couple of years of the dates of any real-world calendar.
+            year_lengths = _REAL_WORLD_YEAR_LENGTHS
+        first = 2000 + math.floor(min(vmin / length for length in year_lengths)) - 2
+        last = 2000 + math.ceil(max(vmax / length for length in year_lengths)) + 2
+        years = last - first
+        max_years = (max_positions - 1) // _MONTHS_PER_YEAR
+        if years > max_years:
+            emsg = (
+                f"A tick pyramid of the {years} years from {first} to {last} would "
+                f"hold more than {max_positions} positions."
+            )
+            raise ValueError(emsg)
+        padding = min(years // 2 + 1, (max_years - years) // 2)
+        first = max(first - padding, 2000 - _MAX_YEAR_OFFSET)
+        last = min(last + padding, 2000 + _MAX_YEAR_OFFSET)
+        if first >= last:
+            emsg = "A tick pyramid cannot cover dates this far from 2000-01-01."
+            raise ValueError(emsg)
+        self.calendar = calendar
+        #: The ``(start, stop)`` range of astronomical years covered.
+        self.years = (first, last)
+        if calendar in _calendar.FIXED_MONTH_LENGTHS:
+            self.has_year_zero = True
+            lengths = _calendar.FIXED_MONTH_LENGTHS[calendar]
+            year_starts = (np.arange(first, last + 1) - 2000) * lengths.sum()
+            month_offsets = np.concatenate([[0], np.cumsum(lengths)[:-1]])
+            month_starts = (year_starts[:-1, np.newaxis] + month_offsets).ravel()
+            stop_day = year_starts[-1]
+        else:
+            table = _calendar.CalendarTable(calendar, self.years)
+            self.has_year_zero = table.has_year_zero
+            month_starts = table.month_starts
+            stop_day = table.stop_day
+        #: The day number of the first of each month, and lastly of the year
+        #: after the pyramid, where month ``m`` of astronomical year ``y`` is
+        #: at ``12 * (y - start) + m - 1``.
+        self.month_starts = np.append(month_starts, stop_day).astype(np.int64)
+        #: The day number of the first of each year, a view of the months.
+        self.year_starts = self.month_starts[::_MONTHS_PER_YEAR]
+        self._seconds = time.perf_counter() - start_time
+
+    def info(self):
+        """Return the extent, size and build time of the pyramid.
+
+        Returns
+        -------
+        :py:class:`PyramidInfo`
+            The ``years`` covered, the number of positions of each of the
+            ``levels``, their total ``positions`` and ``nbytes``, and the
+            ``seconds`` taken to build them.
+
+        """
+        levels = {
+            "YEARLY": len(self.year_starts),
+            "MONTHLY": len(self.month_starts),
+        }
+        return PyramidInfo(
+            self.years,
+            levels,
+            len(self.month_starts),
+            self.month_starts.nbytes,
+            self._seconds,
+        )
+
+    def _calendar_years(self, year):
+        # Convert astronomical years to the numbering of the calendar.
+        if self.has_year_zero:
+            return year
+        return np.where(year <= 0, year - 1, year)
+
+    def _astronomical_years(self, year):
+        if self.has_year_zero:
+            return year
+        return np.where(year < 0, year + 1, year)
+
+    def decode_microseconds(self, times, unit_us):
+        """Decode numeric times in units since 2000-01-01 to whole microseconds.
+
+        The equivalent of :py:func:`nc_time_axis._calendar.decode_microseconds`
+        within the pyramid.
+
+        Parameters
+        ----------
+        times : :py:class:`numpy.ndarray`
+            The numeric time values.
+        unit_us : int
+            The length of the units of *times*, in microseconds.
+
+        Returns
+        -------
+        tuple of :py:class:`numpy.ndarray` or None
+            The int64 microseconds since 2000-01-01 and the year of each time,
+            or ``None`` if any of the times is outside the pyramid.
+
+        """
+        times = np.asarray(times)
+        if times.dtype.kind not in "iuf":
+            return None
+        days = times * (unit_us / _US_PER_DAY)
+        if not np.all((days >= self.month_starts[0]) & (days < self.month_starts[-1])):
+            return None
+        total_us = _calendar.to_microseconds(times, unit_us)
+        days = total_us // _US_PER_DAY
+        if np.any(days >= self.month_starts[-1]):
+            return None
+        index = np.searchsorted(self.year_starts, days, side="right") - 1
+        return total_us, self._calendar_years(index + self.years[0])
+
+    def date_fields(self, nums):
+        """Return the year and month of days since 2000-01-01.
+
+        Parameters
+        ----------
+        nums : :py:class:`numpy.ndarray`
+            The numeric time values.
+
+        Returns
+        -------
+        list of :py:class:`YearMonth` or None
+            The year and month of each value, as decoded by
+            :py:func:`cftime.num2date`, or ``None`` if any of the values is
+            outside the pyramid.
+
+        """
+        decoded = self.decode_microseconds(nums, _US_PER_DAY)
+        if decoded is None:
+            return None
+        days = decoded[0] // _US_PER_DAY
+        index = np.searchsorted(self.month_starts, days, side="right") - 1
+        year, month = np.divmod(index, _MONTHS_PER_YEAR)
+        year = self._calendar_years(year + self.years[0])
+        return [
+            YearMonth(*fields)
+            for fields in zip(year.tolist(), (month + 1).tolist(), strict=True)
+        ]
+
+    def first_days(self, year, month):
+        """Look up the first day of months.
+
+        Parameters
+        ----------
+        year, month : :py:class:`numpy.ndarray`
+            Integer arrays of the years, in the numbering of the calendar, and
+            months.
+
+        Returns
+        -------
+        :py:class:`numpy.ndarray` or None
+            The int64 day numbers of the first of each month, or ``None`` if
+            any of the months is outside the pyramid or in a missing year
+            zero.
+
+        """
+        if not self.has_year_zero and np.any(year == 0):
+            return None
+        year = self._astronomical_years(year)
+        index = _MONTHS_PER_YEAR * (year - self.years[0]) + month - 1
+        if np.any((index < 0) | (index >= len(self.month_starts) - 1)):
+            return None
+        return self.month_starts[index]
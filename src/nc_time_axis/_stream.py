@@ -0,0 +1,57 @@
+"""Growable arrays for series that are appended to while they are plotted.
+
+A :py:class:`GrowableArray` keeps its values in a buffer with room to spare,
+doubling it whenever it fills, so that appending values costs in proportion
+to their number rather than to the length of the series so far.
+
+"""
+
+import numpy as np
+
+
+class GrowableArray:
+    """A one-dimensional array which can be appended to in amortised O(1).
+
+    Parameters
+    ----------
+    dtype : data-type, default=float
+        The type of the values.
+    capacity : int, default=1024
+        The initial number of values with room in the buffer.
+
+    """
+
+    def __init__(self, dtype=float, capacity=1024):
+        self._buffer = np.empty(max(capacity, 1), dtype=dtype)
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def capacity(self):
+        """The number of values with room in the buffer."""
+        return len(self._buffer)
+
+    @property
+    def values(self):
+        """A view of the values appended so far.
+
+        The view is only valid until the next append, which may move the
+        values to a larger buffer.
+        """
+        return self._buffer[: self._size]
+
+    def append(self, values):
+        """Append one-dimensional *values*."""
+        values = np.asarray(values, dtype=self._buffer.dtype).reshape(-1)
+        size = self._size + len(values)
+        if size > len(self._buffer):
+            capacity = len(self._buffer)
+            while capacity < size:
+                capacity *= 2
+            buffer = np.empty(capacity, dtype=self._buffer.dtype)
+            buffer[: self._size] = self.values
+            self._buffer = buffer
+        self._buffer[self._size : size] = values
+        self._size = size
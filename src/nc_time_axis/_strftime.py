@@ -0,0 +1,233 @@
+"""Date formatting from the vectorised date fields of numeric time values.
+
+:py:func:`compile_format` turns a format string into a reusable renderer,
+which formats whole arrays of date fields without creating a
+:py:class:`cftime.datetime` object per date.  The labels are identical to
+those of :py:meth:`cftime.datetime.strftime`, including its four digit,
+sign-padded years, e.g. ``"-0001"`` and ``"12345"``.  Format strings with
+directives that depend on the locale or the day of the week are not compiled
+and :py:func:`strftime` formats them with :py:mod:`cftime` instead.
+
+The label of a value never changes for the same units, calendar and format,
+so :py:func:`cached_strftime` remembers the labels in a bounded cache shared
+by all the formatters, which may be used from several threads at once.
+
+"""
+
+import functools
+import re
+
+import numpy as np
+
+from . import _calendar
+from ._cache import LRUCache
+
+#: The default maximum number of labels remembered by :py:func:`cached_strftime`.
+LABEL_CACHE_SIZE = 4096
+
+# The labels of numeric time values, by value, units, calendar and format.
+_label_cache = LRUCache(LABEL_CACHE_SIZE)
+
+# Directive characters rendered straight from a date field, mapped to the
+# index of the field in ``_calendar.FIELDS`` and its format specification.
+_FIELD_DIRECTIVES = {
+    "m": (1, "02d"),
+    "d": (2, "02d"),
+    "H": (3, "02d"),
+    "M": (4, "02d"),
+    "S": (5, "02d"),
+}
+
+_DIRECTIVE = re.compile(r"%(.?)")
+
+# cftime only allows microseconds at the end of the format, as ".%f".
+_MICROSECONDS = ".%f"
+
+
+def _years(fields):
+    # As cftime, pad years to four digits with the sign of negative years
+    # taking the place of a digit.
+    return [f"{year:05d}" if year < 0 else f"{year:04d}" for year in fields[0].tolist()]
+
+
+def _two_digit_years(fields):
+    return [year[-2:] if year[0] != "-" else "-" + year[-2:] for year in _years(fields)]
+
+
+_YEAR_DIRECTIVES = {"Y": _years, "y": _two_digit_years}
+
+
+class CompiledFormat:
+    """A format string compiled to render arrays of date fields.
+
+    Instances are created by :py:func:`compile_format`, and called with the
+    one-dimensional date field arrays in :py:data:`_calendar.FIELDS` order to
+    return the list of formatted labels.
+
+    """
+
+    def __init__(self, template, columns):
+        self._template = template
+        self._columns = columns
+
+    def __call__(self, *fields):
+        if not self._columns:
+            return [self._template] * len(fields[0])
+        values = [column(fields) for column in self._columns]
+        return list(map(self._template.format, *values))
+
+
+def _field_column(index):
+    def column(fields):
+        return fields[index].tolist()
+
+    return column
+
+
+@functools.lru_cache(maxsize=64)
+def compile_format(format_string):
+    """Compile a :py:meth:`cftime.datetime.strftime` format string.
+
+    Parameters
+    ----------
+    format_string : str
+        The format string, e.g. ``"%Y-%m-%d %H:%M"``.
+
+    Returns
+    -------
+    :py:class:`CompiledFormat` or None
+        The compiled format, or ``None`` if the format string uses directives
+        that cannot be rendered from the date fields alone.
+
+    """
+    has_microseconds = format_string.endswith(_MICROSECONDS)
+    if has_microseconds:
+        format_string = format_string[: -len(_MICROSECONDS)]
+    parts = []
+    columns = []
+    years = 0
+    position = 0
+    for match in _DIRECTIVE.finditer(format_string):
+        literal = format_string[position : match.start()]
+        parts.append(literal.replace("{", "{{").replace("}", "}}"))
+        position = match.end()
+        directive = match.group(1)
+        if directive == "%":
+            parts.append("%")
+        elif directive in _YEAR_DIRECTIVES:
+            # cftime substitutes years into the formatted text by position,
+            # which garbles a second year with other than four digits.
+            years += 1
+            if years > 1:
+                return None
+            parts.append("{}")
+            columns.append(_YEAR_DIRECTIVES[directive])
+        elif directive in _FIELD_DIRECTIVES:
+            index, spec = _FIELD_DIRECTIVES[directive]
+            parts.append(f"{{:{spec}}}")
+            columns.append(_field_column(index))
+        else:
+            return None
+    literal = format_string[position:]
+    parts.append(literal.replace("{", "{{").replace("}", "}}"))
+    if has_microseconds:
+        parts.append(".{:06d}")
+        columns.append(_field_column(6))
+    template = "".join(parts)
+    if not columns:
+        template = template.format()
+    return CompiledFormat(template, columns)
+
+
+def strftime(times, units, calendar, format_string):
+    """Format numeric time values as date strings.
+
+    Parameters
+    ----------
+    times : number or array-like
+        The numeric time values.
+    units : str
+        The time units of the values.
+    calendar : str
+        The calendar of the dates.
+    format_string : str
+        The :py:meth:`cftime.datetime.strftime` format string.
+
+    Returns
+    -------
+    str or list of str
+        The label for a scalar *times*, otherwise the list of labels of the
+        flattened *times*.
+
+    """
+    render = compile_format(format_string)
+    fields = None
+    if render is not None and units == _calendar.TIME_UNITS:
+        fields = _calendar.num2fields(times, calendar)
+    if fields is None:
+        dates = _calendar.num2date(times, units, calendar=calendar)
+        if np.ndim(times) == 0:
+            return dates.strftime(format_string)
+        return [date.strftime(format_string) for date in np.ravel(dates)]
+    labels = render(*(field.ravel() for field in fields))
+    return labels[0] if np.ndim(times) == 0 else labels
+
+
+def cached_strftime(times, units, calendar, format_string):
+    """Format numeric time values as date strings, reusing remembered labels.
+
+    The equivalent of :py:func:`strftime`, which only formats the values
+    whose labels are not in the shared label cache.
+
+    """
+    if _label_cache.maxsize <= 0:
+        return strftime(times, units, calendar, format_string)
+    values = np.ravel(times).tolist()
+    keys = [(value, units, calendar, format_string) for value in values]
+    labels = [_label_cache.get(key) for key in keys]
+    missing = [index for index, label in enumerate(labels) if label is None]
+    if missing:
+        formatted = strftime(
+            np.array([values[index] for index in missing]),
+            units,
+            calendar,
+            format_string,
+        )
+        for index, label in zip(missing, formatted, strict=True):
+            labels[index] = label
+            _label_cache.put(keys[index], label)
+    return labels[0] if np.ndim(times) == 0 else labels
+
+
+def label_cache_info():
+    """Return the hit and miss statistics of the label cache of the formatters.
+
+    Returns
+    -------
+    :py:class:`collections.namedtuple`
+        The ``hits``, ``misses``, ``maxsize`` and ``currsize`` of the cache,
+        as for :py:func:`functools.lru_cache`.
+
+    """
+    return _label_cache.info()
+
+
+def label_cache_clear():
+    """Discard the labels remembered by the formatters and reset their statistics."""
+    _label_cache.clear()
+
+
+def set_label_cache_size(maxsize):
+    """Set the maximum number of labels remembered by the formatters.
+
+    The labels of tick values are shared by the :py:class:`AutoCFTimeFormatter`
+    and :py:class:`CFTimeFormatter` of every axis, keyed by value, units,
+    calendar and format.  By default, 4096 labels are remembered.
+
+    Parameters
+    ----------
+    maxsize : int
+        The maximum number of labels.  A size of zero disables the cache.
+
+    """
+    _label_cache.resize(maxsize)
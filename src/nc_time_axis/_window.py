@@ -0,0 +1,101 @@
+"""Conversion of the dates of a sorted series within a window of interest.
+
+A :py:class:`DateIndex` holds a sorted series of :py:class:`cftime.datetime`
+objects and converts them to numeric time values only as windows of the
+series are requested.  Windows are found by binary search over the dates,
+and each date is converted at most once.
+
+"""
+
+import numpy as np
+
+from . import _calendar
+
+
+class DateIndex:
+    """A sorted series of dates, converted to numbers on demand.
+
+    Parameters
+    ----------
+    dates : sequence of :py:class:`cftime.datetime`
+        The dates, which must share one calendar.
+    assume_sorted : bool, default=False
+        Whether the dates are known to be in ascending order.  Otherwise their
+        order is checked, and unsorted dates are sorted.
+
+    Attributes
+    ----------
+    order : :py:class:`numpy.ndarray` or None
+        The indices that sort the given dates, or ``None`` if already sorted.
+
+    """
+
+    def __init__(self, dates, *, assume_sorted=False):
+        dates = np.asarray(dates, dtype=object).reshape(-1)
+        if not len(dates):
+            raise ValueError("At least one date is required.")
+        self.order = None
+        if not assume_sorted and np.any(dates[1:] < dates[:-1]):
+            self.order = np.argsort(dates, kind="stable")
+            dates = dates[self.order]
+        self.dates = dates
+        self.calendar = dates[0].calendar
+        self._days = np.full(len(dates), np.nan)
+        self._converted = np.zeros(len(dates), dtype=bool)
+
+    def __len__(self):
+        return len(self.dates)
+
+    def bounds(self):
+        """Return the numeric time values of the first and last dates."""
+        return self.days(0, 1)[0], self.days(len(self) - 1, len(self))[0]
+
+    def converted_count(self):
+        """Return the number of dates converted so far."""
+        return int(np.count_nonzero(self._converted))
+
+    def window(self, lower, upper, margin=0.0):
+        """Return the slice of the dates covering a range of time values.
+
+        Parameters
+        ----------
+        lower, upper : float
+            The range of time values, in :py:data:`_calendar.TIME_UNITS`.
+        margin : float, default=0.0
+            The fraction of the range added to either side of it.
+
+        Returns
+        -------
+        tuple of int
+            The start and stop of the slice, which includes the dates either
+            side of the range so that a line drawn through them continues to
+            its edges.
+
+        """
+        first, last = self.bounds()
+        pad = (upper - lower) * margin
+        lower = min(max(lower - pad, first), last)
+        upper = max(min(upper + pad, last), first)
+        keys = _calendar.num2date(
+            np.array([lower, upper], dtype=float),
+            _calendar.TIME_UNITS,
+            calendar=self.calendar,
+        )
+        start = np.searchsorted(self.dates, keys[0], side="left")
+        stop = np.searchsorted(self.dates, keys[1], side="right")
+        return max(start - 1, 0), min(stop + 1, len(self))
+
+    def days(self, start, stop):
+        """Return the numeric time values of a slice of the dates.
+
+        Only the dates of the slice that have not been converted before are
+        converted.
+
+        """
+        todo = np.flatnonzero(~self._converted[start:stop]) + start
+        if len(todo):
+            self._days[todo] = _calendar.date2num(
+                self.dates[todo], _calendar.TIME_UNITS, calendar=self.calendar
+            )
+            self._converted[todo] = True
+        return self._days[start:stop]
@@ -0,0 +1,250 @@
+"""Batch rendering of timeseries figures on cftime axes.
+
+Renders one PNG, or any other format matplotlib can write, per series of a
+manifest, across a pool of worker processes on the headless Agg backend.  The
+workers are reused from figure to figure, so their calendar tables and label
+format caches stay warm.  From the command line::
+
+    python -m nc_time_axis.render manifest.json --workers 8
+
+The manifest is a JSON list of series, or a JSON Lines file of one series per
+line.  Each series is a mapping of:
+
+``output``
+    The path of the figure to write.
+``times``
+    The numeric times of the series, or the path of a ``.npy`` file of them.
+``units``
+    The CF units of the times, e.g. ``"days since 1850-01-01"``.
+``calendar``
+    The calendar of the times, by default ``"standard"``.
+``values``
+    The values of the series, or the path of a ``.npy`` file of them.  Two
+    dimensional values, e.g. of ensemble members, are drawn as one line per
+    row.
+``title``, ``ylabel``
+    Optional labels of the figure.
+
+Relative paths in a manifest file are relative to the directory of the
+manifest.
+
+"""
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import json
+import os
+from pathlib import Path
+import sys
+import time
+from typing import TYPE_CHECKING, NamedTuple, cast
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike
+
+#: The default size of the figures, in inches.
+FIGSIZE = (8.0, 4.0)
+
+#: The default resolution of the figures, in dots per inch.
+DPI = 100
+
+_PATH_KEYS = ("output", "times", "values")
+
+
+class RenderResult(NamedTuple):
+    """The outcome of rendering the figure of one series."""
+
+    output: str
+    seconds: float
+    error: str | None
+
+
+def load_manifest(path):
+    """Load the series of a manifest file.
+
+    Parameters
+    ----------
+    path : str or :py:class:`os.PathLike`
+        The JSON, or JSON Lines if its suffix is ``.jsonl``, manifest.
+
+    Returns
+    -------
+    list of dict
+        The series, with relative paths made relative to the directory of the
+        manifest.
+
+    """
+    path = Path(path)
+    text = path.read_text()
+    if path.suffix == ".jsonl":
+        series = [json.loads(line) for line in text.splitlines() if line.strip()]
+    else:
+        series = json.loads(text)
+    for spec in series:
+        for key in _PATH_KEYS:
+            if isinstance(spec.get(key), str):
+                spec[key] = str(path.parent / spec[key])
+    return series
+
+
+def _array(value):
+    if isinstance(value, (str, os.PathLike)):
+        return np.load(value)
+    return np.asarray(value)
+
+
+def _init_worker():
+    # Prepare a worker for headless rendering, importing the implementation
+    # once rather than with its first figure.
+    import matplotlib  # noqa: PLC0415
+
+    matplotlib.use("agg")
+    from . import _core  # noqa: F401, PLC0415
+
+
+def render_series(spec, figsize=FIGSIZE, dpi=DPI):
+    """Render the figure of one series of a manifest.
+
+    Parameters
+    ----------
+    spec : dict
+        The series, as described for the manifest.
+    figsize : tuple of float, optional
+        The size of the figure, in inches.
+    dpi : float, optional
+        The resolution of the figure, in dots per inch.
+
+    Returns
+    -------
+    :py:class:`RenderResult`
+        The output path and render time, or the error that stopped the
+        figure from being rendered.
+
+    """
+    from matplotlib.figure import Figure  # noqa: PLC0415
+
+    from ._core import CFTimeArray  # noqa: PLC0415
+
+    output = str(spec.get("output"))
+    start = time.perf_counter()
+    try:
+        times = CFTimeArray(
+            _array(spec["times"]), spec["units"], spec.get("calendar", "standard")
+        )
+        values = _array(spec["values"])
+        fig = Figure(figsize=figsize)
+        ax = fig.add_subplot()
+        # The registered converter handles the times; the stubs of plot only
+        # know of array-likes.
+        ax.plot(cast("ArrayLike", times), values.T)
+        if "title" in spec:
+            ax.set_title(spec["title"])
+        if "ylabel" in spec:
+            ax.set_ylabel(spec["ylabel"])
+        fig.savefig(output, dpi=dpi)
+    except Exception as error:  # noqa: BLE001
+        return RenderResult(output, time.perf_counter() - start, repr(error))
+    return RenderResult(output, time.perf_counter() - start, None)
+
+
+def render(series, workers=None, figsize=FIGSIZE, dpi=DPI):
+    """Render the figure of each series across a pool of processes.
+
+    Parameters
+    ----------
+    series : iterable of dict
+        The series, as described for the manifest.
+    workers : int, optional
+        The number of worker processes, by default one per CPU.  With zero
+        workers, the figures are rendered in the calling process, without
+        changing its matplotlib backend.
+    figsize : tuple of float, optional
+        The size of the figures, in inches.
+    dpi : float, optional
+        The resolution of the figures, in dots per inch.
+
+    Returns
+    -------
+    list of :py:class:`RenderResult`
+        The result of each series, in order.
+
+    """
+    series = list(series)
+    if workers == 0:
+        return [render_series(spec, figsize, dpi) for spec in series]
+    workers = min(workers or os.cpu_count() or 1, max(len(series), 1))
+    with ProcessPoolExecutor(workers, initializer=_init_worker) as pool:
+        return list(
+            pool.map(
+                render_series,
+                series,
+                [figsize] * len(series),
+                [dpi] * len(series),
+                chunksize=max(len(series) // (4 * workers), 1),
+            )
+        )
+
+
+def report(results, elapsed=None, file=None):
+    """Write the render time of each figure, and a summary, to *file*.
+
+    Parameters
+    ----------
+    results : list of :py:class:`RenderResult`
+        The results of :py:func:`render`.
+    elapsed : float, optional
+        The wall time of the whole render, in seconds.
+    file : file-like, optional
+        Where to write the report, by default :py:data:`sys.stdout`.
+
+    """
+    file = sys.stdout if file is None else file
+    for result in results:
+        status = "ok" if result.error is None else f"FAILED: {result.error}"
+        print(f"{result.seconds:9.3f} s  {result.output}  {status}", file=file)
+    failed = sum(result.error is not None for result in results)
+    total = sum(result.seconds for result in results)
+    print(
+        f"Rendered {len(results) - failed} of {len(results)} figures "
+        f"in {total:.3f} s of worker time.",
+        file=file,
+    )
+    if elapsed is not None:
+        print(f"Elapsed {elapsed:.3f} s.", file=file)
+
+
+def main(argv=None):
+    """Render the figures of a manifest from the command line."""
+    parser = argparse.ArgumentParser(
+        prog="python -m nc_time_axis.render",
+        description="Render timeseries figures on cftime axes.",
+    )
+    parser.add_argument("manifest", help="JSON or JSON Lines manifest of series")
+    parser.add_argument("-w", "--workers", type=int, help="number of worker processes")
+    parser.add_argument(
+        "--dpi", type=float, default=DPI, help="resolution of the figures"
+    )
+    parser.add_argument(
+        "--figsize",
+        type=float,
+        nargs=2,
+        default=FIGSIZE,
+        metavar=("WIDTH", "HEIGHT"),
+        help="size of the figures, in inches",
+    )
+    args = parser.parse_args(argv)
+    start = time.perf_counter()
+    results = render(
+        load_manifest(args.manifest),
+        workers=args.workers,
+        figsize=tuple(args.figsize),
+        dpi=args.dpi,
+    )
+    report(results, elapsed=time.perf_counter() - start)
+    return int(any(result.error is not None for result in results))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
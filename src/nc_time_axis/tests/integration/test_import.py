@@ -0,0 +1,85 @@
+"""Integration tests for the cost and side effects of importing nc-time-axis."""
+
+import subprocess
+import sys
+import textwrap
+import unittest
+
+# The cumulative import time budget of nc_time_axis, in microseconds.  Importing
+# matplotlib and cftime alone takes several times longer.
+IMPORT_BUDGET = 100_000
+
+HEAVY_MODULES = ("cftime", "matplotlib", "numpy")
+
+
+def run(code, *options):
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, *options, "-c", textwrap.dedent(code)],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return result.stdout, result.stderr
+
+
+def import_times():
+    """Return the cumulative import time of each module imported by nc_time_axis."""
+    _, stderr = run("import nc_time_axis", "-X", "importtime")
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+class Test_import(unittest.TestCase):
+    def test_budget(self):
+        times = import_times()
+        self.assertLess(times["nc_time_axis"], IMPORT_BUDGET)
+
+    def test_no_heavy_imports(self):
+        imported = {name.split(".")[0] for name in import_times()}
+        self.assertEqual(imported.intersection(HEAVY_MODULES), set())
+
+    def test_attribute_access(self):
+        stdout, _ = run(
+            """
+            import sys
+            import nc_time_axis
+            print(nc_time_axis.NetCDFTimeConverter.__name__)
+            print("matplotlib" in sys.modules)
+            """
+        )
+        self.assertEqual(stdout.split(), ["NetCDFTimeConverter", "True"])
+
+
+class Test_registration(unittest.TestCase):
+    code = """
+        {import_first}
+        import cftime
+        import matplotlib
+        matplotlib.use("agg")
+        import matplotlib.pyplot as plt
+        {import_before}
+        times = [cftime.Datetime360Day(2000, 1, day) for day in range(1, 30)]
+        fig, ax = plt.subplots()
+        ax.plot(times, range(29))
+        fig.canvas.draw()
+        print(ax.get_xticklabels()[1].get_text())
+        """
+
+    def test_matplotlib_imported_after(self):
+        code = self.code.format(import_first="import nc_time_axis", import_before="")
+        stdout, _ = run(code)
+        self.assertEqual(stdout.strip(), "2000-01-01")
+
+    def test_matplotlib_imported_before(self):
+        code = self.code.format(import_first="", import_before="import nc_time_axis")
+        stdout, _ = run(code)
+        self.assertEqual(stdout.strip(), "2000-01-01")
+
+
+if __name__ == "__main__":
+    unittest.main()
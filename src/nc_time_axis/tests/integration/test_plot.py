@@ -1,5 +1,6 @@
 """Integration test for plotting data with non-gregorian calendar."""
 
+import pickle
 import unittest
 import warnings
 
@@ -53,6 +54,35 @@ class Test(unittest.TestCase):
         result_ydata = line1.get_ydata()
         np.testing.assert_array_equal(result_ydata, datetimes)
 
+    def test_360_day_calendar_CFTimeArray(self):
+        times = nc_time_axis.CFTimeArray(
+            [29, 59, 89, 119], "days since 1986-01-01", "360_day"
+        )
+        (line1,) = plt.plot(times, range(4))
+        expected = cftime.date2num(
+            [cftime.Datetime360Day(1986, month, 30) for month in range(1, 5)],
+            "days since 2000-01-01",
+        )
+        np.testing.assert_array_equal(np.asarray(line1.get_xydata())[:, 0], expected)
+        plt.gcf().canvas.draw()
+        labels = [label.get_text() for label in plt.gca().get_xticklabels()]
+        self.assertTrue(labels)
+        self.assertTrue(all(label.startswith("1986-") for label in labels))
+
+    def test_axvline_CFTimeArray(self):
+        times = nc_time_axis.CFTimeArray(
+            [29, 59, 89, 119], "days since 1986-01-01", "360_day"
+        )
+        plt.plot(times, range(4))
+        line = plt.axvline(times[2])
+        plt.gcf().canvas.draw()
+        expected = cftime.date2num(
+            cftime.Datetime360Day(1986, 3, 30), "days since 2000-01-01"
+        )
+        np.testing.assert_array_equal(
+            np.asarray(line.get_xydata())[:, 0], [expected, expected]
+        )
+
     def test_no_calendar_raw_universal_dates(self):
         datetimes = [
             cftime.datetime(1986, month, 30, calendar=None) for month in range(1, 6)
@@ -72,6 +102,19 @@ class Test(unittest.TestCase):
 
         plt.fill_between(cdt, temperatures, 0)
 
+    def test_pickle(self):
+        datetimes = [cftime.Datetime360Day(2000, month, 1) for month in range(1, 13)]
+        plt.plot(datetimes, range(12))
+        fig = plt.gcf()
+        fig.canvas.draw()
+        labels = [label.get_text() for label in plt.gca().get_xticklabels()]
+        # The tick cache of the locator is pickled empty.
+        unpickled = pickle.loads(pickle.dumps(fig))  # noqa: S301
+        unpickled.canvas.draw()
+        (ax,) = unpickled.axes
+        self.assertEqual([label.get_text() for label in ax.get_xticklabels()], labels)
+        plt.close(unpickled)
+
 
 def setup_function(function):
     plt.close()
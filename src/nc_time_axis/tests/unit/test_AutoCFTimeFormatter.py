@@ -5,7 +5,13 @@ from unittest import mock
 
 import pytest
 
-from nc_time_axis import AutoCFTimeFormatter, NetCDFTimeDateFormatter
+from nc_time_axis import (
+    AutoCFTimeFormatter,
+    NetCDFTimeDateFormatter,
+    NetCDFTimeDateLocator,
+    _strftime,
+    label_cache_clear,
+)
 
 
 class Test_pick_format(unittest.TestCase):
@@ -23,6 +29,59 @@ class Test_pick_format(unittest.TestCase):
         self.assertEqual(self.check("YEARLY"), "%Y")
 
 
+class Test_format_ticks(unittest.TestCase):
+    def test_matches_call(self):
+        values = [-1000.25, 0, 3661 / 86400, 59.5, 1e5]
+        for calendar in ("360_day", "standard", "julian"):
+            for resolution in ("SECONDLY", "HOURLY", "YEARLY"):
+                locator = mock.MagicMock(resolution=resolution)
+                formatter = AutoCFTimeFormatter(locator, calendar)
+                result = formatter.format_ticks(values)
+                self.assertEqual(result, [formatter(value) for value in values])
+
+    def test_empty(self):
+        formatter = AutoCFTimeFormatter(mock.MagicMock(resolution="DAILY"), "noleap")
+        self.assertEqual(formatter.format_ticks([]), [])
+
+
+class Test_format_ticks_incremental(unittest.TestCase):
+    def setUp(self):
+        self.locator = NetCDFTimeDateLocator(4, "noleap")
+        self.locator.incremental = True
+        self.locator.resolution = "DAILY"
+        self.formatter = AutoCFTimeFormatter(self.locator, "noleap")
+        label_cache_clear()
+
+    def format_ticks(self, values):
+        with mock.patch(
+            "nc_time_axis._core._strftime.strftime", wraps=_strftime.strftime
+        ) as strftime:
+            result = self.formatter.format_ticks(values)
+        formatted = [len(call.args[0]) for call in strftime.call_args_list]
+        return result, formatted
+
+    def test_reuses_labels(self):
+        self.format_ticks([0, 7, 14, 21])
+        result, formatted = self.format_ticks([7, 14, 21, 28])
+        self.assertEqual(
+            result, ["2000-01-08", "2000-01-15", "2000-01-22", "2000-01-29"]
+        )
+        self.assertEqual(formatted, [1])
+
+    def test_unchanged(self):
+        expected, _ = self.format_ticks([0, 7])
+        result, formatted = self.format_ticks([0, 7])
+        self.assertEqual(result, expected)
+        self.assertEqual(formatted, [])
+
+    def test_new_format(self):
+        self.format_ticks([0, 31])
+        self.locator.resolution = "MONTHLY"
+        result, formatted = self.format_ticks([0, 31])
+        self.assertEqual(result, ["2000-01", "2000-02"])
+        self.assertEqual(formatted, [2])
+
+
 def test_NetCDFTimeDateFormatter_warning():
     locator = mock.MagicMock()
     with pytest.warns(FutureWarning, match="AutoCFTimeFormatter"):
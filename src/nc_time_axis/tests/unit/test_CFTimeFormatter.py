@@ -1,8 +1,10 @@
 """Unit tests for the `nc_time_axis.CFTimeFormatter` class."""
 
+import cftime
+import numpy as np
 import pytest
 
-from nc_time_axis import CFTimeFormatter
+from nc_time_axis import _TIME_UNITS, CFTimeFormatter
 
 FORMATS = {
     "%H:%M:%S": "01:01:01",
@@ -21,3 +23,37 @@ def test_CFTimeFormatter(format, expected):  # noqa: A002
     formatter = CFTimeFormatter(format, calendar)
     result = formatter(days)
     assert result == expected
+
+
+@pytest.mark.parametrize(
+    "calendar", ["360_day", "365_day", "noleap", "366_day", "all_leap"]
+)
+def test_CFTimeFormatter_fixed_length_calendars(calendar):
+    format_string = "%Y-%m-%d %H:%M:%S"
+    formatter = CFTimeFormatter(format_string, calendar)
+    for days in np.linspace(-1e6, 1e6, 101):
+        expected = cftime.num2date(days, _TIME_UNITS, calendar=calendar)
+        assert formatter(days) == expected.strftime(format_string)
+
+
+def test_CFTimeFormatter_format_ticks():
+    values = [-1000.25, 0, 3661 / 86400, 59.5, 1e5]
+    formatter = CFTimeFormatter("%Y-%m-%d %H:%M:%S", "noleap")
+    result = formatter.format_ticks(values)
+    assert result == [formatter(value) for value in values]
+
+
+@pytest.mark.parametrize(
+    "format_string",
+    ["%Y-%m-%d", "%y/%m/%d %H:%M", "{%Y} 100%%", "%Y%m%d%H%M%S.%f", "%a %b %Y"],
+)
+@pytest.mark.filterwarnings("ignore::cftime.CFWarning")
+def test_CFTimeFormatter_years(format_string):
+    # Includes negative years and years beyond 9999.
+    values = [-1e6, -730490.5, -730120.25, 0, 1e6, 3e6 + 1 / 3]
+    for calendar in ("standard", "360_day"):
+        formatter = CFTimeFormatter(format_string, calendar)
+        dates = cftime.num2date(values, _TIME_UNITS, calendar=calendar)
+        expected = [date.strftime(format_string) for date in dates]
+        assert formatter.format_ticks(values) == expected
+        assert [formatter(value) for value in values] == expected
@@ -0,0 +1,180 @@
+"""Unit tests for the `nc-time-axis.CFTimeMinorLocator` class."""
+
+import unittest
+from unittest import mock
+
+import cftime
+import matplotlib.pyplot as plt
+import matplotlib.ticker as mticker
+import numpy as np
+
+from nc_time_axis import (
+    _TIME_UNITS,
+    CFTimeMinorLocator,
+    NetCDFTimeDateLocator,
+)
+
+
+def dates(values, calendar):
+    return [
+        date.strftime("%Y-%m-%d %H:%M:%S")
+        for date in cftime.num2date(values, _TIME_UNITS, calendar=calendar)
+    ]
+
+
+class Test_tick_values(unittest.TestCase):
+    def check(self, max_n_ticks, vmin, vmax, calendar="noleap"):
+        self.major = NetCDFTimeDateLocator(max_n_ticks, calendar)
+        # Locate the major ticks first, as when drawing an axis.
+        self.major.tick_values(vmin, vmax)
+        locator = CFTimeMinorLocator(self.major)
+        return locator.tick_values(vmin, vmax)
+
+    def test_quarters_under_two_years(self):
+        result = self.check(2, 0, 3 * 365)
+        self.assertEqual(self.major.resolution, "YEARLY")
+        self.assertEqual(len(result), 13)
+        self.assertEqual(
+            dates(result[:3], "noleap"),
+            ["2000-01-01 00:00:00", "2000-04-01 00:00:00", "2000-07-01 00:00:00"],
+        )
+
+    def test_years_under_ten_years(self):
+        result = self.check(4, 0, 40 * 365)
+        self.assertEqual(self.major.resolution, "YEARLY")
+        np.testing.assert_array_equal(result, np.arange(41) * 365)
+
+    def test_years_under_centuries(self):
+        result = self.check(4, 0, 365 * 400, "standard")
+        self.assertEqual(
+            dates(result[:3], "standard"),
+            ["2000-01-01 00:00:00", "2020-01-01 00:00:00", "2040-01-01 00:00:00"],
+        )
+        self.assertEqual(len(result), 20)
+
+    def test_no_year_zero(self):
+        # The quarters of the years either side of the missing year zero.
+        result = self.check(4, -730_500, -729_000, "julian")
+        years = [date.year for date in cftime.num2date(result, _TIME_UNITS, "julian")]
+        self.assertEqual(years, [-1] * 4 + [1] * 4 + [2] * 4 + [3] * 4 + [4])
+
+    def test_centuries_across_year_zero(self):
+        # The majors skip the missing year zero, and so do the minors.
+        for calendar in ("standard", "julian"):
+            vmin, vmax = cftime.date2num(
+                [
+                    cftime.datetime(-931, 1, 1, calendar=calendar),
+                    cftime.datetime(4937, 1, 1, calendar=calendar),
+                ],
+                _TIME_UNITS,
+                calendar=calendar,
+            )
+            result = self.check(5, vmin, vmax, calendar)
+            located = cftime.num2date(result, _TIME_UNITS, calendar=calendar)
+            years = [date.year for date in located]
+            self.assertEqual(years[:5], [-900, -600, -300, 300, 600])
+            self.assertEqual(sorted({year % 300 for year in years}), [0])
+            majors = self.major.tick_values(vmin, vmax)
+            in_view = majors[(majors >= vmin) & (majors <= vmax)]
+            self.assertTrue(np.isin(in_view, result).all())
+
+    def test_months_under_months(self):
+        result = self.check(100, 0, 100 * 31)
+        self.assertEqual(self.major.resolution, "MONTHLY")
+        self.assertEqual(len(result), 102)
+        self.assertEqual(
+            dates(result[:2], "noleap"),
+            ["2000-01-01 00:00:00", "2000-02-01 00:00:00"],
+        )
+
+    def test_days_under_one_month(self):
+        # Thousands of minor ticks, without a warning.
+        major = NetCDFTimeDateLocator(4, "360_day")
+        major.resolution = "MONTHLY"
+        majors = np.arange(0, 3601, 30)
+        with (
+            mock.patch.object(major, "tick_values", return_value=majors),
+            self.assertNoLogs("matplotlib.ticker"),
+        ):
+            result = CFTimeMinorLocator(major).tick_values(0, 3600)
+        np.testing.assert_array_equal(result, np.arange(3601))
+
+    def test_days_under_days(self):
+        result = self.check(4, 0, 30)
+        self.assertEqual(self.major.resolution, "DAILY")
+        np.testing.assert_array_equal(result, np.arange(31))
+
+    def test_hours_under_one_day(self):
+        result = self.check(4, 0, 1)
+        self.assertEqual(self.major.resolution, "HOURLY")
+        np.testing.assert_array_equal(result, np.arange(25) / 24)
+
+    def test_quarter_hours_under_hours(self):
+        result = self.check(4, 0, 0.5)
+        self.assertEqual(self.major.resolution, "HOURLY")
+        np.testing.assert_array_equal(result, np.arange(49) / 96)
+
+    def test_minutes(self):
+        result = self.check(4, 0.5, 0.52)
+        self.assertEqual(self.major.resolution, "MINUTELY")
+        self.assertEqual(
+            dates(result[:2], "noleap"),
+            ["2000-01-01 12:00:00", "2000-01-01 12:01:00"],
+        )
+
+    def test_tenths_of_seconds_under_seconds(self):
+        result = self.check(4, 0, 4 / 86400)
+        self.assertEqual(self.major.resolution, "SECONDLY")
+        self.assertEqual(len(result), 41)
+        self.assertAlmostEqual(result[1] * 86400, 0.1)
+
+    def test_reversed(self):
+        np.testing.assert_array_equal(self.check(4, 30, 0), self.check(4, 0, 30))
+
+    def test_unsupported_major(self):
+        locator = CFTimeMinorLocator(mticker.MaxNLocator())
+        self.assertEqual(len(locator.tick_values(0, 365)), 0)
+
+    def test_no_major(self):
+        with self.assertRaisesRegex(ValueError, "major locator"):
+            CFTimeMinorLocator().tick_values(0, 365)
+
+    def test_no_axis(self):
+        with self.assertRaisesRegex(ValueError, "An axis is needed"):
+            CFTimeMinorLocator(NetCDFTimeDateLocator(4, "noleap"))()
+
+    def test_major_unchanged(self):
+        major = NetCDFTimeDateLocator(4, "noleap")
+        major.incremental = True
+        major.tick_values(0, 3600)
+        resolution, changes = major.resolution, major.tick_changes
+        result = CFTimeMinorLocator(major).tick_values(0, 30)
+        self.assertGreater(len(result), 0)
+        self.assertEqual(major.resolution, resolution)
+        self.assertIs(major.tick_changes, changes)
+        # The next view of the major locator is compared with its own last.
+        major.tick_values(0, 3600)
+        self.assertEqual(len(major.tick_changes.entered), 0)
+        self.assertEqual(len(major.tick_changes.left), 0)
+
+
+class Test_axis(unittest.TestCase):
+    def tearDown(self):
+        plt.close("all")
+
+    def test_major_locator_of_axis(self):
+        times = cftime.num2date(np.arange(0, 3 * 360, 10), _TIME_UNITS, "360_day")
+        _, ax = plt.subplots()
+        ax.plot(times, np.arange(len(times)))
+        ax.xaxis.set_minor_locator(CFTimeMinorLocator())
+        major = ax.xaxis.get_majorticklocs()
+        minor = ax.xaxis.get_minorticklocs()
+        self.assertGreater(len(minor), len(major))
+        # Minor ticks coinciding with major ticks are left out by matplotlib.
+        self.assertEqual(len(np.intersect1d(major, minor)), 0)
+        days = [date.day for date in cftime.num2date(minor, _TIME_UNITS, "360_day")]
+        self.assertEqual(set(days), {1})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+"""Unit tests for the `nc-time-axis.DecimatedLine` class."""
+
+import unittest
+
+import matplotlib
+
+matplotlib.use("agg")
+
+import cftime
+import matplotlib.pyplot as plt
+import numpy as np
+
+from nc_time_axis import _TIME_UNITS, CFTimeArray, DecimatedLine, plot_decimated
+
+
+class Test_set_data(unittest.TestCase):
+    def test_extremes_kept(self):
+        y = np.random.default_rng(0).normal(size=100_000)
+        line = DecimatedLine(np.arange(100_000), y)
+        x, result = line.get_data()
+        self.assertLessEqual(len(result), 2 * DecimatedLine.initial_bins + 2)
+        self.assertEqual((x[0], x[-1]), (0, 99_999))
+        self.assertEqual((result.min(), result.max()), (y.min(), y.max()))
+
+    def test_short_series_unchanged(self):
+        line = DecimatedLine(np.arange(10), np.arange(10) ** 2)
+        np.testing.assert_array_equal(line.get_ydata(), np.arange(10) ** 2)
+
+    def test_unsorted(self):
+        line = DecimatedLine([2, 0, 1], [20, 0, 10])
+        np.testing.assert_array_equal(line.get_xdata(), [0, 1, 2])
+        np.testing.assert_array_equal(line.get_ydata(), [0, 10, 20])
+
+    def test_masked(self):
+        y = np.ma.masked_array([1.0, 2.0, 3.0], mask=[False, True, False])
+        line = DecimatedLine(np.arange(3), y)
+        np.testing.assert_array_equal(line.get_ydata(), [1, np.nan, 3])
+
+    def test_mismatched_lengths(self):
+        with self.assertRaisesRegex(ValueError, "same length"):
+            DecimatedLine(np.arange(3), np.arange(4))
+
+
+class Test_draw(unittest.TestCase):
+    def setUp(self):
+        plt.close("all")
+        self.fig, self.ax = plt.subplots()
+        self.y = np.random.default_rng(0).normal(size=1_000_000)
+        times = CFTimeArray(np.arange(1_000_000), _TIME_UNITS, "360_day")
+        self.line = plot_decimated(self.ax, times, self.y)
+
+    def tearDown(self):
+        plt.close("all")
+
+    def test_pixel_resolution(self):
+        self.fig.canvas.draw()
+        width = round(self.ax.bbox.width)
+        self.assertLessEqual(len(self.line.get_xdata()), 2 * width + 2)
+        ydata = self.line.get_ydata()
+        self.assertEqual((ydata.min(), ydata.max()), (self.y.min(), self.y.max()))
+
+    def test_zoom_refines(self):
+        self.ax.set_xlim(1000, 1100)
+        self.fig.canvas.draw()
+        x, y = self.line.get_data()
+        np.testing.assert_array_equal(x, np.arange(999, 1102))
+        np.testing.assert_array_equal(y, self.y[999:1102])
+
+    def test_cftime_axis(self):
+        self.fig.canvas.draw()
+        labels = [label.get_text() for label in self.ax.get_xticklabels()]
+        self.assertTrue(labels)
+        self.assertTrue(all(label.isdigit() for label in labels))
+
+    def test_dates(self):
+        dates = cftime.num2date(np.arange(100), _TIME_UNITS, calendar="noleap")
+        _, ax = plt.subplots()
+        line = plot_decimated(ax, dates, np.arange(100))
+        np.testing.assert_array_equal(line.get_xdata(), np.arange(100))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,12 +1,24 @@
 """Unit tests for the `nc-time-axis.NetCDFTimeConverter` class."""
 
+from concurrent.futures import ThreadPoolExecutor
+import datetime
+import gc
 import unittest
+from unittest import mock
 
 import cftime
+from matplotlib.figure import Figure
 import numpy as np
 import pytest
 
-from nc_time_axis import CalendarDateTime, NetCDFTimeConverter
+from nc_time_axis import (
+    _TIME_UNITS,
+    CalendarDateTime,
+    CFTimeArray,
+    NetCDFTimeConverter,
+    _parallel,
+    calendar_check,
+)
 
 
 @pytest.mark.filterwarnings("ignore::DeprecationWarning")
@@ -25,6 +37,62 @@ class Test_axisinfo(unittest.TestCase):
         )
 
 
+class Test_axisinfo_pool(unittest.TestCase):
+    def setUp(self):
+        self.unit = ("noleap", _TIME_UNITS, cftime.DatetimeNoLeap)
+        self.figure = Figure()
+
+    def test_shared_tick_cache(self):
+        first = NetCDFTimeConverter.axisinfo(self.unit, None).majloc
+        second = NetCDFTimeConverter.axisinfo(self.unit, None).majloc
+        self.assertIsNot(first, second)
+        first.tick_cache_clear()
+        expected = first.tick_values(0, 365)
+        np.testing.assert_array_equal(second.tick_values(0, 365), expected)
+        self.assertEqual(second.tick_cache_info().hits, 1)
+
+    def test_calendars_not_shared(self):
+        first = NetCDFTimeConverter.axisinfo(self.unit, None).majloc
+        unit = ("360_day", _TIME_UNITS, cftime.Datetime360Day)
+        second = NetCDFTimeConverter.axisinfo(unit, None).majloc
+        first.tick_cache_clear()
+        second.tick_cache_clear()
+        first.tick_values(0, 365)
+        self.assertEqual(second.tick_cache_info().currsize, 0)
+
+    def test_default_limits_reused(self):
+        first = NetCDFTimeConverter.axisinfo(self.unit, None)
+        second = NetCDFTimeConverter.axisinfo(self.unit, None)
+        self.assertIs(first.default_limits, second.default_limits)
+
+    def test_axis_pair_reused(self):
+        axis = self.figure.add_subplot().xaxis
+        info = NetCDFTimeConverter.axisinfo(self.unit, axis)
+        axis.set_major_locator(info.majloc)
+        axis.set_major_formatter(info.majfmt)
+        result = NetCDFTimeConverter.axisinfo(self.unit, axis)
+        self.assertIs(result.majloc, info.majloc)
+        self.assertIs(result.majfmt, info.majfmt)
+
+    def test_axis_other_calendar(self):
+        axis = self.figure.add_subplot().xaxis
+        info = NetCDFTimeConverter.axisinfo(self.unit, axis)
+        axis.set_major_locator(info.majloc)
+        axis.set_major_formatter(info.majfmt)
+        unit = ("360_day", _TIME_UNITS, cftime.Datetime360Day)
+        result = NetCDFTimeConverter.axisinfo(unit, axis)
+        self.assertIsNot(result.majloc, info.majloc)
+        self.assertEqual(result.majloc.calendar, "360_day")
+
+    def test_axis_other_formatter(self):
+        axis = self.figure.add_subplot().xaxis
+        info = NetCDFTimeConverter.axisinfo(self.unit, axis)
+        axis.set_major_locator(info.majloc)
+        result = NetCDFTimeConverter.axisinfo(self.unit, axis)
+        self.assertIsNot(result.majloc, info.majloc)
+        self.assertIs(result.majfmt.locator, result.majloc)
+
+
 class Test_default_units(unittest.TestCase):
     @pytest.mark.filterwarnings("ignore::DeprecationWarning")
     def test_360_day_calendar_point_CalendarDateTime(self):
@@ -129,6 +197,51 @@ class Test_default_units(unittest.TestCase):
             NetCDFTimeConverter().default_units(val, None)
 
 
+class Test_default_units_calendar_check(unittest.TestCase):
+    def setUp(self):
+        self.mixed = [cftime.datetime(2014, 8, 12, calendar="360_day")] * 1000 + [
+            cftime.datetime(2014, 8, 12, calendar="noleap")
+        ]
+        self.typed = [cftime.Datetime360Day(2014, 8, day) for day in range(1, 31)]
+
+    def test_default_is_full(self):
+        self.assertEqual(NetCDFTimeConverter.calendar_check, "full")
+        with self.assertRaisesRegex(ValueError, "not all equal"):
+            NetCDFTimeConverter().default_units(self.mixed, None)
+
+    def test_sample(self):
+        # The last date is always part of the sample.
+        with calendar_check("sample"):
+            with self.assertRaisesRegex(ValueError, "not all equal"):
+                NetCDFTimeConverter().default_units(self.mixed, None)
+            mixed = self.mixed[::-1]
+            mixed[1], mixed[0] = mixed[0], mixed[1]
+            result = NetCDFTimeConverter().default_units(mixed, None)
+        self.assertEqual(result[0], "360_day")
+
+    def test_type(self):
+        with calendar_check("type"):
+            result = NetCDFTimeConverter().default_units(self.typed, None)
+            self.assertEqual(result, ("360_day", _TIME_UNITS, cftime.Datetime360Day))
+            # Universal datetimes do not imply a calendar from their type.
+            with self.assertRaisesRegex(ValueError, "not all equal"):
+                NetCDFTimeConverter().default_units(self.mixed, None)
+
+    def test_none(self):
+        with calendar_check("none"):
+            result = NetCDFTimeConverter().default_units(self.mixed, None)
+        self.assertEqual(result, ("360_day", _TIME_UNITS, cftime.datetime))
+
+    def test_context_restores(self):
+        with self.assertRaises(RuntimeError), calendar_check("none"):
+            raise RuntimeError
+        self.assertEqual(NetCDFTimeConverter.calendar_check, "full")
+
+    def test_unknown(self):
+        with self.assertRaisesRegex(ValueError, "Unknown calendar check"):
+            calendar_check("some").__enter__()
+
+
 class Test_convert(unittest.TestCase):
     def test_numpy_array(self):
         val = np.array([7])
@@ -231,5 +344,348 @@ class Test_convert(unittest.TestCase):
             _ = NetCDFTimeConverter().convert(val, None, None)
 
 
+class Test_convert_date_fields(unittest.TestCase):
+    calendars = (
+        "standard",
+        "gregorian",
+        "proleptic_gregorian",
+        "julian",
+        "noleap",
+        "365_day",
+        "360_day",
+        "all_leap",
+        "366_day",
+    )
+
+    def check(self, nums, calendar):
+        dates = cftime.num2date(nums, _TIME_UNITS, calendar=calendar)
+        result = NetCDFTimeConverter().convert(dates, None, None)
+        expected = cftime.date2num(dates, _TIME_UNITS, calendar=calendar)
+        self.assertEqual(result.dtype, expected.dtype)
+        np.testing.assert_array_equal(result, expected)
+
+    def test_whole_days(self):
+        nums = np.arange(-800_000, 800_000, 997)
+        for calendar in self.calendars:
+            self.check(nums, calendar)
+
+    def test_sub_daily(self):
+        nums = np.linspace(-3e6, 3e6, 2001)
+        for calendar in self.calendars:
+            self.check(nums, calendar)
+
+    def test_gregorian_switch(self):
+        start = cftime.date2num(
+            cftime.datetime(1582, 10, 15, calendar="standard"), _TIME_UNITS
+        )
+        nums = np.arange(start - 400, start + 400) + 0.5
+        for calendar in ("standard", "gregorian"):
+            self.check(nums, calendar)
+
+    def test_outside_table_years(self):
+        nums = np.array([-1e7, 0, 1e7])
+        for calendar in ("standard", "proleptic_gregorian", "julian"):
+            self.check(nums, calendar)
+
+    def test_nd_array(self):
+        nums = np.arange(12).reshape(3, 4) / 7
+        dates = cftime.num2date(nums, _TIME_UNITS, calendar="360_day")
+        result = NetCDFTimeConverter().convert(dates, None, None)
+        np.testing.assert_array_equal(
+            result, cftime.date2num(dates, _TIME_UNITS, calendar="360_day")
+        )
+        self.assertEqual(result.shape, (3, 4))
+
+    def test_invalid_date_for_calendar(self):
+        val = [
+            cftime.datetime(2001, 1, 1, calendar="noleap"),
+            cftime.datetime(2000, 2, 29, calendar="standard"),
+        ]
+        with self.assertRaisesRegex(ValueError, "invalid day number"):
+            NetCDFTimeConverter().convert(val, None, None)
+
+
+class Test_convert_cache(unittest.TestCase):
+    def setUp(self):
+        NetCDFTimeConverter.conversion_cache_size = 4
+        NetCDFTimeConverter.conversion_cache_clear()
+        self.dates = cftime.num2date(np.arange(1000), _TIME_UNITS, calendar="noleap")
+
+    def tearDown(self):
+        NetCDFTimeConverter.conversion_cache_size = 0
+        NetCDFTimeConverter.conversion_cache_clear()
+
+    def test_hit(self):
+        expected = NetCDFTimeConverter().convert(self.dates, None, None)
+        # A copy shares the same dates.
+        result = NetCDFTimeConverter().convert(self.dates.copy(), None, None)
+        np.testing.assert_array_equal(result, expected)
+        info = NetCDFTimeConverter.conversion_cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (1, 1, 1))
+
+    def test_different_dates(self):
+        NetCDFTimeConverter().convert(self.dates, None, None)
+        dates = cftime.num2date(np.arange(1000) + 1, _TIME_UNITS, calendar="noleap")
+        result = NetCDFTimeConverter().convert(dates, None, None)
+        np.testing.assert_array_equal(result, np.arange(1000) + 1)
+        self.assertEqual(NetCDFTimeConverter.conversion_cache_info().hits, 0)
+
+    def test_different_sampled_dates(self):
+        NetCDFTimeConverter().convert(self.dates, None, None)
+        # Only the unsampled second date differs.
+        dates = self.dates.copy()
+        dates[1] = cftime.DatetimeNoLeap(1900, 1, 1)
+        result = NetCDFTimeConverter().convert(dates, None, None)
+        self.assertEqual(result[1], -36500)
+        info = NetCDFTimeConverter.conversion_cache_info()
+        self.assertEqual((info.hits, info.misses), (0, 2))
+
+    def test_changed_in_place(self):
+        NetCDFTimeConverter().convert(self.dates, None, None)
+        self.dates[1] = cftime.DatetimeNoLeap(1900, 1, 1)
+        result = NetCDFTimeConverter().convert(self.dates, None, None)
+        self.assertEqual(result[1], -36500)
+        self.assertEqual(NetCDFTimeConverter.conversion_cache_info().hits, 0)
+
+    def test_forgotten_when_collected(self):
+        NetCDFTimeConverter().convert(self.dates, None, None)
+        self.assertEqual(NetCDFTimeConverter.conversion_cache_info().currsize, 1)
+        del self.dates
+        self.assertEqual(NetCDFTimeConverter.conversion_cache_info().currsize, 0)
+
+    def test_disabled(self):
+        NetCDFTimeConverter.conversion_cache_size = 0
+        NetCDFTimeConverter().convert(self.dates, None, None)
+        self.assertEqual(NetCDFTimeConverter.conversion_cache_info().currsize, 0)
+
+
+class Test_CFTimeArray(unittest.TestCase):
+    def test_default_units(self):
+        times = CFTimeArray(np.arange(10), "hours since 1850-01-01", "noleap")
+        result = NetCDFTimeConverter().default_units(times, None)
+        self.assertEqual(result, ("noleap", _TIME_UNITS, CFTimeArray))
+
+    def test_default_units_no_calendar(self):
+        times = CFTimeArray(np.arange(10), "hours since 1850-01-01", "")
+        with self.assertRaisesRegex(ValueError, "defined"):
+            NetCDFTimeConverter().default_units(times, None)
+
+    def test_axisinfo_default_limits(self):
+        unit = ("360_day", _TIME_UNITS, CFTimeArray)
+        result = NetCDFTimeConverter().axisinfo(unit, None)
+        expected = [
+            cftime.datetime(2000, 1, 1, calendar="360_day"),
+            cftime.datetime(2010, 1, 1, calendar="360_day"),
+        ]
+        self.assertEqual(list(result.default_limits), expected)
+
+    def test_convert_axis_units_not_copied(self):
+        data = np.arange(10.0)
+        times = CFTimeArray(data, _TIME_UNITS, "360_day")
+        result = NetCDFTimeConverter().convert(times, None, None)
+        self.assertIs(result, data)
+
+    def test_convert(self):
+        for units in (
+            "hours since 1850-01-01",
+            "seconds since 1970-01-01 12:00:00",
+            "days since 1-01-01",
+            "minutes since 2100-06-15",
+        ):
+            for calendar in ("360_day", "noleap", "julian", "standard"):
+                data = np.arange(-1000, 1000, 7).reshape(2, -1)
+                times = CFTimeArray(data, units, calendar)
+                result = NetCDFTimeConverter().convert(times, None, None)
+                expected = cftime.date2num(
+                    cftime.num2date(data, units, calendar=calendar),
+                    _TIME_UNITS,
+                    calendar=calendar,
+                )
+                np.testing.assert_allclose(result, expected, rtol=0, atol=1e-9)
+
+    def test_convert_months(self):
+        times = CFTimeArray([0, 1, 13], "months since 2000-01-01", "360_day")
+        result = NetCDFTimeConverter().convert(times, None, None)
+        np.testing.assert_array_equal(result, [0, 30, 390])
+
+    def test_convert_sequence(self):
+        # As passed by Axes.axvline for an element of an array.
+        times = CFTimeArray([0, 1, 13], "months since 2000-01-01", "360_day")
+        result = NetCDFTimeConverter().convert([times[2], times[2]], None, None)
+        np.testing.assert_array_equal(result, [390, 390])
+
+    def test_default_units_sequence(self):
+        times = CFTimeArray(np.arange(10), "hours since 1850-01-01", "noleap")
+        result = NetCDFTimeConverter().default_units([times[2], times[3]], None)
+        self.assertEqual(result, ("noleap", _TIME_UNITS, CFTimeArray))
+
+    def test_getitem(self):
+        times = CFTimeArray(np.arange(10), "hours since 1850-01-01", "noleap")
+        result = times[2]
+        self.assertIsInstance(result, CFTimeArray)
+        self.assertEqual(result.data, 2)
+        self.assertEqual((result.units, result.calendar), (times.units, "noleap"))
+
+    def test_not_numeric(self):
+        dates = cftime.num2date([0, 1], _TIME_UNITS, calendar="noleap")
+        with self.assertRaisesRegex(ValueError, "numeric"):
+            CFTimeArray(dates, _TIME_UNITS, "noleap")
+
+
+class _Index:
+    """A minimal stand-in for :py:class:`pandas.Index`."""
+
+    def __init__(self, dates):
+        self._data = np.asarray(dates)
+
+    def __iter__(self):
+        raise AssertionError("The dates should not be iterated over.")
+
+    def __getitem__(self, key):
+        raise AssertionError("The dates should not be indexed.")
+
+    def to_numpy(self):
+        return self._data
+
+
+class _CFTimeIndex(_Index):
+    """A minimal stand-in for :py:class:`xarray.CFTimeIndex`."""
+
+    def __init__(self, dates):
+        super().__init__(dates)
+        self.date_type = type(self._data[0])
+        self.calendar = self._data[0].calendar
+
+
+class Test_index(unittest.TestCase):
+    def setUp(self):
+        self.dates = cftime.num2date(np.arange(100), _TIME_UNITS, calendar="noleap")
+
+    def test_default_units(self):
+        result = NetCDFTimeConverter().default_units(_CFTimeIndex(self.dates), None)
+        self.assertEqual(result, ("noleap", _TIME_UNITS, cftime.DatetimeNoLeap))
+
+    def test_default_units_no_calendar_metadata(self):
+        result = NetCDFTimeConverter().default_units(_Index(self.dates), None)
+        self.assertEqual(result, ("noleap", _TIME_UNITS, cftime.DatetimeNoLeap))
+
+    def test_convert(self):
+        for index in (_Index(self.dates), _CFTimeIndex(self.dates)):
+            result = NetCDFTimeConverter().convert(index, None, None)
+            np.testing.assert_array_equal(result, np.arange(100))
+
+
+class _ChunkedArray:
+    """A minimal stand-in for :py:class:`dask.array.Array`."""
+
+    def __init__(self, dates, chunks):
+        self._data = np.asarray(dates)
+        self.shape = self._data.shape
+        self.chunks = chunks
+
+    def __iter__(self):
+        raise AssertionError("The array should not be iterated over.")
+
+    def __getitem__(self, key):
+        return _ChunkedArray(self._data[key], None)
+
+    def __array__(self, dtype=None, copy=None):
+        return self._data
+
+    def map_blocks(self, func):
+        raise NotImplementedError
+
+
+class Test_chunked(unittest.TestCase):
+    def setUp(self):
+        self.dates = cftime.num2date(
+            np.arange(120).reshape(12, 10), "hours since 2000-01-01", calendar="noleap"
+        )
+        self.array = _ChunkedArray(self.dates, ((5, 5, 2), (4, 6)))
+
+    def test_convert(self):
+        result = NetCDFTimeConverter().convert(self.array, None, None)
+        self.assertEqual(result.dtype, np.float64)
+        np.testing.assert_array_equal(result, np.arange(120).reshape(12, 10) / 24)
+
+    def test_convert_whole_days(self):
+        dates = cftime.num2date(np.arange(12), _TIME_UNITS, calendar="noleap")
+        array = _ChunkedArray(dates, ((5, 5, 2),))
+        result = NetCDFTimeConverter().convert(array, None, None)
+        expected = NetCDFTimeConverter().convert(dates, None, None)
+        self.assertEqual(result.dtype, expected.dtype)
+        np.testing.assert_array_equal(result, np.arange(12))
+
+    def test_convert_single_worker(self):
+        NetCDFTimeConverter.conversion_workers = 1
+        try:
+            result = NetCDFTimeConverter().convert(self.array, None, None)
+        finally:
+            NetCDFTimeConverter.conversion_workers = None
+        np.testing.assert_array_equal(result, np.arange(120).reshape(12, 10) / 24)
+
+    def test_convert_invalid(self):
+        array = _ChunkedArray(np.array([[1.5, "a"]], dtype=object), ((1,), (2,)))
+        with self.assertRaisesRegex(ValueError, "must be numbers"):
+            NetCDFTimeConverter().convert(array, None, None)
+
+    def test_default_units(self):
+        result = NetCDFTimeConverter().default_units(self.array, None)
+        self.assertEqual(result, ("noleap", _TIME_UNITS, cftime.DatetimeNoLeap))
+
+
+class Test_convert_processes(unittest.TestCase):
+    def setUp(self):
+        NetCDFTimeConverter.process_threshold = 100
+        NetCDFTimeConverter.process_workers = 2
+        self.dates = cftime.num2date(
+            np.arange(1000).reshape(10, 100),
+            "hours since 2000-01-01",
+            calendar="360_day",
+        )
+
+    def tearDown(self):
+        NetCDFTimeConverter.process_threshold = None
+        NetCDFTimeConverter.process_workers = None
+
+    def test_convert(self):
+        result = NetCDFTimeConverter().convert(self.dates, None, None)
+        self.assertEqual(result.dtype, np.float64)
+        np.testing.assert_array_equal(result, np.arange(1000).reshape(10, 100) / 24)
+
+    def test_below_threshold(self):
+        result = NetCDFTimeConverter().convert(self.dates[0], None, None)
+        np.testing.assert_array_equal(result, np.arange(100) / 24)
+
+    def test_view_outlives_result(self):
+        view = NetCDFTimeConverter().convert(self.dates, None, None)[::2, :5]
+        gc.collect()
+        np.testing.assert_array_equal(view[-1], np.arange(800, 805) / 24)
+
+    def test_concurrent_calls(self):
+        arrays = [self.dates + offset for offset in map(datetime.timedelta, range(4))]
+
+        def convert(dates):
+            return NetCDFTimeConverter().convert(dates, None, None)
+
+        with ThreadPoolExecutor(4) as pool:
+            results = list(pool.map(convert, arrays))
+        for offset, result in enumerate(results):
+            expected = (np.arange(1000).reshape(10, 100) + 24 * offset) / 24
+            np.testing.assert_array_equal(result, expected)
+
+    def test_chunked(self):
+        array = _ChunkedArray(self.dates, ((5, 5), (100,)))
+        with mock.patch.object(_parallel, "convert_in_processes") as convert:
+            result = NetCDFTimeConverter().convert(array, None, None)
+        convert.assert_not_called()
+        np.testing.assert_array_equal(result, np.arange(1000).reshape(10, 100) / 24)
+
+    def test_worker_error(self):
+        dates = np.array([*self.dates[0, :-1], "a"], dtype=object)
+        with self.assertRaisesRegex(AttributeError, "year"):
+            _parallel.convert_in_processes(dates, "360_day", 2)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,7 @@
 """Unit tests for the `nc-time-axis.NetCDFTimeDateLocator` class."""
 
 import unittest
+from unittest import mock
 
 import cftime
 import matplotlib.dates as mdates
@@ -8,7 +9,7 @@ import matplotlib.style
 import numpy as np
 import pytest
 
-from nc_time_axis import _TIME_UNITS, NetCDFTimeDateLocator
+from nc_time_axis import _TIME_UNITS, NetCDFTimeDateLocator, _calendar
 
 matplotlib.style.use("classic")
 
@@ -127,6 +128,226 @@ class Test_tick_values(unittest.TestCase):
         )
 
 
+@pytest.mark.filterwarnings("ignore::DeprecationWarning")
+class Test_tick_values_in_days(unittest.TestCase):
+    calendars = (
+        "standard",
+        "proleptic_gregorian",
+        "julian",
+        "noleap",
+        "all_leap",
+        "360_day",
+    )
+    # Spans in days of each resolution, from YEARLY to SECONDLY.
+    spans = (5e5, 3000, 100, 2, 0.05, 0.0005)
+    starts = (-730_480.3, -152_390.7, -3.25, 0, 7_305.5, 1_000_000.1)
+
+    def test_matches_dates(self):
+        # The same units, spelled differently, locate the ticks as dates.
+        units = "days since 2000-01-01 00:00:00"
+        for calendar in self.calendars:
+            in_days = NetCDFTimeDateLocator(5, calendar)
+            as_dates = NetCDFTimeDateLocator(5, calendar, date_unit=units)
+            for span in self.spans:
+                for start in self.starts:
+                    expected = as_dates.tick_values(start, start + span)
+                    result = in_days.tick_values(start, start + span)
+                    self.assertEqual(in_days.resolution, as_dates.resolution)
+                    self.assertEqual(result.dtype, expected.dtype)
+                    np.testing.assert_array_equal(result, expected)
+
+    def test_no_dates(self):
+        with (
+            mock.patch("nc_time_axis._core.cftime") as core_cftime,
+            mock.patch("nc_time_axis._calendar.cftime") as calendar_cftime,
+        ):
+            for span in self.spans:
+                NetCDFTimeDateLocator(5, "standard").tick_values(0, span)
+        self.assertEqual(core_cftime.mock_calls, [])
+        self.assertEqual(calendar_cftime.mock_calls, [])
+
+
+class Test_tick_values_cache(unittest.TestCase):
+    def setUp(self):
+        self.locator = NetCDFTimeDateLocator(max_n_ticks=4, calendar="365_day")
+
+    def test_hit(self):
+        expected = self.locator.tick_values(0, 365)
+        self.locator.tick_values(0, 0.0004)
+        self.assertEqual(self.locator.resolution, "SECONDLY")
+        result = self.locator.tick_values(0, 365)
+        np.testing.assert_array_equal(result, expected)
+        self.assertEqual(self.locator.resolution, "MONTHLY")
+        info = self.locator.tick_cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (1, 2, 2))
+
+    def test_result_is_a_copy(self):
+        result = self.locator.tick_values(0, 365)
+        result[:] = 0
+        self.assertNotEqual(self.locator.tick_values(0, 365)[0], 0)
+
+    def test_bounded(self):
+        self.locator.tick_cache_clear()
+        for day in range(self.locator.tick_cache_size + 10):
+            self.locator.tick_values(day, day + 30)
+        info = self.locator.tick_cache_info()
+        self.assertEqual(info.currsize, self.locator.tick_cache_size)
+        self.assertEqual(info.hits, 0)
+
+
+class Test_tick_pyramid(unittest.TestCase):
+    calendars = Test_tick_values_in_days.calendars
+    spans = Test_tick_values_in_days.spans
+    # Beyond the calendar tables, and either side of the missing year zero.
+    starts = (-20_000_000.5, -730_480.3, 0, 7_305_000.1)
+
+    def locators(self, calendar):
+        locator = NetCDFTimeDateLocator(5, calendar)
+        with_pyramid = NetCDFTimeDateLocator(5, calendar)
+        with_pyramid.build_tick_pyramid(-21_000_000, 7_400_000)
+        return locator, with_pyramid
+
+    def test_matches(self):
+        for calendar in self.calendars:
+            locator, with_pyramid = self.locators(calendar)
+            for span in self.spans:
+                for start in self.starts:
+                    expected = locator.tick_values(start, start + span)
+                    result = with_pyramid.tick_values(start, start + span)
+                    self.assertEqual(with_pyramid.resolution, locator.resolution)
+                    self.assertEqual(result.dtype, expected.dtype)
+                    np.testing.assert_array_equal(result, expected)
+
+    def test_no_dates(self):
+        _, with_pyramid = self.locators("standard")
+        with (
+            mock.patch("nc_time_axis._core.cftime") as core_cftime,
+            mock.patch("nc_time_axis._calendar.cftime") as calendar_cftime,
+        ):
+            for span in self.spans:
+                with_pyramid.tick_values(-20_000_000.5, -20_000_000.5 + span)
+        self.assertEqual(core_cftime.mock_calls, [])
+        self.assertEqual(calendar_cftime.mock_calls, [])
+
+    def test_outside(self):
+        locator, with_pyramid = self.locators("noleap")
+        np.testing.assert_array_equal(
+            with_pyramid.tick_values(5e7, 5e7 + 100),
+            locator.tick_values(5e7, 5e7 + 100),
+        )
+
+    def test_info(self):
+        locator = NetCDFTimeDateLocator(5, "360_day")
+        self.assertIsNone(locator.tick_pyramid_info())
+        info = locator.build_tick_pyramid(0, 3600)
+        self.assertEqual(locator.tick_pyramid_info(), info)
+        # Ten years of data, and a margin, padded by half on either side.
+        self.assertEqual(info.years, (1990, 2020))
+        self.assertEqual(info.levels, {"YEARLY": 31, "MONTHLY": 361})
+        self.assertEqual(info.positions, 361)
+        self.assertEqual(info.nbytes, 361 * 8)
+        self.assertGreater(info.seconds, 0)
+        locator.clear_tick_pyramid()
+        self.assertIsNone(locator.tick_pyramid_info())
+
+    def test_bounded(self):
+        locator = NetCDFTimeDateLocator(5, "standard")
+        info = locator.build_tick_pyramid(0, 365 * 100, max_positions=1500)
+        self.assertLessEqual(info.positions, 1500)
+        with self.assertRaisesRegex(ValueError, "more than 1000 positions"):
+            locator.build_tick_pyramid(0, 365 * 100, max_positions=1000)
+
+    def test_data_interval(self):
+        locator = NetCDFTimeDateLocator(5, "noleap")
+        locator.axis = mock.Mock(**{"get_data_interval.return_value": (0, 3650)})
+        self.assertEqual(locator.build_tick_pyramid().years, (1990, 2020))
+
+    def test_no_axis(self):
+        locator = NetCDFTimeDateLocator(5, "noleap")
+        with self.assertRaisesRegex(ValueError, "without an axis"):
+            locator.build_tick_pyramid()
+
+    def test_date_unit(self):
+        with pytest.warns(DeprecationWarning, match="date_unit"):
+            locator = NetCDFTimeDateLocator(5, "noleap", "days since 1970-01-01")
+        with self.assertRaisesRegex(ValueError, "date unit"):
+            locator.build_tick_pyramid(0, 365)
+
+    def test_unsupported_calendar(self):
+        locator = NetCDFTimeDateLocator(5, "none")
+        with self.assertRaisesRegex(ValueError, "'none' calendar"):
+            locator.build_tick_pyramid(0, 365)
+
+
+class Test_incremental(unittest.TestCase):
+    def locator(self, calendar):
+        locator = NetCDFTimeDateLocator(5, calendar)
+        locator.incremental = True
+        return locator
+
+    def test_matches(self):
+        # Scroll a view of each resolution by a fraction of its span.
+        for calendar in Test_tick_values_in_days.calendars:
+            incremental = self.locator(calendar)
+            for span in Test_tick_values_in_days.spans:
+                locator = NetCDFTimeDateLocator(5, calendar)
+                for step in range(20):
+                    start = 7_305.3 + step * span / 7
+                    expected = locator.tick_values(start, start + span)
+                    result = incremental.tick_values(start, start + span)
+                    self.assertEqual(incremental.resolution, locator.resolution)
+                    self.assertEqual(result.dtype, expected.dtype)
+                    np.testing.assert_array_equal(result, expected)
+
+    def test_beyond_tables(self):
+        # The last yearly tick, of the year 10000, is past the calendar
+        # tables, so the ticks are located as dates.
+        locator = NetCDFTimeDateLocator(4, "standard")
+        incremental = NetCDFTimeDateLocator(4, "standard")
+        incremental.incremental = True
+        for vmax in (1_000_000, 2_900_000):
+            expected = locator.tick_values(0, vmax)
+            result = incremental.tick_values(0, vmax)
+            self.assertEqual(incremental.resolution, "YEARLY")
+            np.testing.assert_array_equal(result, expected)
+        self.assertEqual(expected[-1], 2_921_940)
+
+    def test_converts_entered(self):
+        locator = self.locator("360_day")
+        locator.tick_values(0, 3600)
+        with mock.patch(
+            "nc_time_axis._core._calendar.fields_to_days",
+            wraps=_calendar.fields_to_days,
+        ) as fields_to_days:
+            result = locator.tick_values(720, 4320)
+        np.testing.assert_array_equal(result, np.arange(720, 4321, 720))
+        # Only the first of the year 2012 entered the view.
+        ((year, _, _),) = (call.args[1:] for call in fields_to_days.call_args_list)
+        np.testing.assert_array_equal(year, [2012])
+
+    def test_tick_changes(self):
+        locator = self.locator("360_day")
+        self.assertIsNone(locator.tick_changes)
+        locator.tick_values(0, 3600)
+        entered, left = locator.tick_changes
+        np.testing.assert_array_equal(entered, np.arange(0, 3601, 720))
+        np.testing.assert_array_equal(left, [])
+        locator.tick_values(720, 4320)
+        entered, left = locator.tick_changes
+        np.testing.assert_array_equal(entered, [4320])
+        np.testing.assert_array_equal(left, [0])
+        # The ticks of a cached view are compared too.
+        locator.tick_values(720, 4320)
+        entered, left = locator.tick_changes
+        np.testing.assert_array_equal(entered, [])
+        np.testing.assert_array_equal(left, [])
+
+    def test_not_incremental(self):
+        locator = NetCDFTimeDateLocator(5, "360_day")
+        locator.tick_values(0, 3600)
+        self.assertIsNone(locator.tick_changes)
+
+
 class Test_tick_values_yr0(unittest.TestCase):
     def setUp(self):
         self.all_calendars = [
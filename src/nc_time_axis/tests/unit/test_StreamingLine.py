@@ -0,0 +1,100 @@
+"""Unit tests for the `nc-time-axis.StreamingLine` class."""
+
+import unittest
+from unittest import mock
+
+import matplotlib
+
+matplotlib.use("agg")
+
+import cftime
+from matplotlib.animation import FuncAnimation
+import matplotlib.pyplot as plt
+import numpy as np
+
+from nc_time_axis import (
+    _TIME_UNITS,
+    NetCDFTimeConverter,
+    StreamingLine,
+    plot_streaming,
+)
+from nc_time_axis._stream import GrowableArray
+
+
+def dates(start, stop, calendar="360_day"):
+    return cftime.num2date(np.arange(start, stop), _TIME_UNITS, calendar=calendar)
+
+
+class Test_append(unittest.TestCase):
+    def setUp(self):
+        self.line = StreamingLine(dates(0, 10), np.arange(10))
+
+    def test_converts_new_dates(self):
+        with mock.patch.object(
+            NetCDFTimeConverter, "convert", wraps=NetCDFTimeConverter.convert
+        ) as convert:
+            self.line.append(dates(10, 13), [10, 11, 12])
+        self.assertEqual(len(convert.call_args.args[0]), 3)
+        np.testing.assert_array_equal(self.line.get_xdata(), np.arange(13))
+        np.testing.assert_array_equal(self.line.get_ydata(), np.arange(13))
+        self.assertEqual(self.line.converted_count(), 13)
+
+    def test_single_date(self):
+        self.line.append(dates(10, 11)[0], 10)
+        np.testing.assert_array_equal(self.line.get_xdata(), np.arange(11))
+
+    def test_empty(self):
+        line = StreamingLine([], [], calendar="noleap")
+        self.assertEqual(len(line.get_xdata()), 0)
+        line.append(dates(0, 3, "noleap"), [1, 2, 3])
+        np.testing.assert_array_equal(line.get_xdata(), [0, 1, 2])
+
+    def test_calendar(self):
+        self.assertEqual(self.line.calendar, "360_day")
+        with self.assertRaisesRegex(ValueError, "'noleap' calendar"):
+            self.line.append(dates(10, 11, "noleap"), [10])
+
+    def test_mismatched_lengths(self):
+        with self.assertRaisesRegex(ValueError, "same length"):
+            self.line.append(dates(10, 12), [10])
+
+
+class Test_animation(unittest.TestCase):
+    def tearDown(self):
+        plt.close("all")
+
+    def test_func_animation(self):
+        fig, ax = plt.subplots()
+        line = plot_streaming(ax, dates(0, 10), np.arange(10))
+        appended: list[int] = []
+
+        def update(_):
+            start = 10 + 5 * len(appended)
+            line.append(dates(start, start + 5), np.arange(start, start + 5))
+            appended.append(5)
+            ax.relim()
+            ax.autoscale_view()
+            return (line,)
+
+        animation = FuncAnimation(
+            fig, update, frames=4, blit=True, cache_frame_data=False
+        )
+        animation.save("unused.png", writer=mock.MagicMock())
+        count = 10 + sum(appended)
+        self.assertEqual(line.converted_count(), count)
+        np.testing.assert_array_equal(line.get_xdata(), np.arange(count))
+        self.assertEqual(ax.dataLim.x1, count - 1)
+
+
+class Test_GrowableArray(unittest.TestCase):
+    def test_grows(self):
+        array = GrowableArray(capacity=2)
+        for start in range(0, 10, 3):
+            array.append(np.arange(start, start + 3))
+        np.testing.assert_array_equal(array.values, np.arange(12))
+        self.assertEqual(array.capacity, 16)
+        self.assertEqual(len(array), 12)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+"""Unit tests for the `nc-time-axis.WindowedLine` class."""
+
+import unittest
+
+import matplotlib
+
+matplotlib.use("agg")
+
+import cftime
+import matplotlib.pyplot as plt
+import numpy as np
+
+from nc_time_axis import _TIME_UNITS, WindowedLine, plot_windowed
+
+
+class Test___init__(unittest.TestCase):
+    def setUp(self):
+        self.dates = cftime.num2date(np.arange(1000), _TIME_UNITS, calendar="noleap")
+
+    def test_bounding_box(self):
+        line = WindowedLine(self.dates, np.arange(1000) % 7)
+        np.testing.assert_array_equal(line.get_xdata(), [0, 999])
+        np.testing.assert_array_equal(line.get_ydata(), [0, 6])
+        self.assertEqual(line.converted_count(), 2)
+
+    def test_unsorted(self):
+        line = WindowedLine(self.dates[::-1], np.arange(1000))
+        np.testing.assert_array_equal(line.get_xdata(), [0, 999])
+        np.testing.assert_array_equal(line.get_ydata(), [0, 999])
+
+    def test_mismatched_lengths(self):
+        with self.assertRaisesRegex(ValueError, "same length"):
+            WindowedLine(self.dates, np.arange(10))
+
+
+class Test_draw(unittest.TestCase):
+    def setUp(self):
+        plt.close("all")
+        self.fig, self.ax = plt.subplots()
+        units = "hours since 2000-01-01"
+        self.dates = cftime.num2date(np.arange(100_000), units, calendar="360_day")
+        self.y = np.arange(100_000) % 24
+        self.line = plot_windowed(self.ax, self.dates, self.y, assume_sorted=True)
+
+    def tearDown(self):
+        plt.close("all")
+
+    def test_zoom_converts_window(self):
+        self.ax.set_xlim(100, 101)
+        self.fig.canvas.draw()
+        x, y = self.line.get_data()
+        # The first and last dates, and the view with half a day either side
+        # of it and its neighbouring dates.
+        self.assertEqual(self.line.converted_count(), 2 + 24 * 2 + 3)
+        expected = cftime.date2num(
+            self.dates[2399:2426], _TIME_UNITS, calendar="360_day"
+        )
+        # Only the dates in view, and their neighbours, are drawn.
+        np.testing.assert_allclose(x, expected)
+        np.testing.assert_array_equal(y, self.y[2399:2426])
+
+    def test_pan_within_margin(self):
+        self.ax.set_xlim(100, 101)
+        self.fig.canvas.draw()
+        count = self.line.converted_count()
+        self.ax.set_xlim(100.25, 101.25)
+        self.fig.canvas.draw()
+        self.assertLessEqual(self.line.converted_count(), count + 6)
+
+    def test_labels(self):
+        self.ax.set_xlim(100, 101)
+        self.fig.canvas.draw()
+        labels = [label.get_text() for label in self.ax.get_xticklabels()]
+        dates = cftime.num2date(self.ax.get_xticks(), _TIME_UNITS, calendar="360_day")
+        self.assertTrue(labels)
+        self.assertEqual(labels, [date.strftime("%Y-%m-%d %H:%M") for date in dates])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+"""Unit tests for the `nc_time_axis._calendar` module."""
+
+import unittest
+
+import cftime
+import numpy as np
+
+from nc_time_axis import _TIME_UNITS, _calendar
+
+CALENDARS = (
+    "360_day",
+    "365_day",
+    "noleap",
+    "366_day",
+    "all_leap",
+    "gregorian",
+    "julian",
+    "proleptic_gregorian",
+    "standard",
+)
+
+
+class Test_num2date(unittest.TestCase):
+    def test_matches_cftime(self):
+        times = np.array([[-1000.25, 0], [59.5, 1e5]])
+        for calendar in CALENDARS:
+            expected = cftime.num2date(times, _TIME_UNITS, calendar=calendar)
+            result = _calendar.num2date(times, _TIME_UNITS, calendar)
+            self.assertEqual(result.shape, times.shape)
+            for date, expected_date in zip(result.flat, expected.flat, strict=True):
+                self.assertEqual(date, expected_date)
+                self.assertIs(type(date), type(expected_date))
+                self.assertEqual(date.calendar, expected_date.calendar)
+                self.assertEqual(date.has_year_zero, expected_date.has_year_zero)
+
+    def test_scalar(self):
+        result = _calendar.num2date(59, _TIME_UNITS, "360_day")
+        self.assertIsInstance(result, cftime.Datetime360Day)
+        self.assertEqual(result, cftime.Datetime360Day(2000, 2, 30))
+
+
+class Test_to_microseconds(unittest.TestCase):
+    def test_rounding(self):
+        days = np.array([1, 0.5, 1.5 / 86400, -1 / 86400])
+        result = _calendar.to_microseconds(days)
+        expected = [86_400_000_000, 43_200_000_000, 1_500_000, -1_000_000]
+        np.testing.assert_array_equal(result, expected)
+
+    def test_integers(self):
+        result = _calendar.to_microseconds(np.array([2, -1]), unit_us=1_000_000)
+        np.testing.assert_array_equal(result, [2_000_000, -1_000_000])
+
+
+if __name__ == "__main__":
+    unittest.main()
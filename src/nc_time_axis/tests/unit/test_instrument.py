@@ -0,0 +1,78 @@
+"""Unit tests for the `nc-time-axis.instrument` context manager."""
+
+import unittest
+
+import cftime
+import numpy as np
+
+from nc_time_axis import (
+    _TIME_UNITS,
+    CFTimeFormatter,
+    NetCDFTimeConverter,
+    NetCDFTimeDateLocator,
+    instrument,
+    reset_stats,
+    stats,
+)
+
+
+class Test_instrument(unittest.TestCase):
+    def setUp(self):
+        reset_stats()
+        self.dates = cftime.num2date(np.arange(100), _TIME_UNITS, calendar="noleap")
+
+    def tearDown(self):
+        reset_stats()
+
+    def test_disabled(self):
+        NetCDFTimeConverter.convert(self.dates, None, None)
+        self.assertEqual(stats(), {})
+
+    def test_convert(self):
+        with instrument():
+            NetCDFTimeConverter.convert(self.dates, None, None)
+            NetCDFTimeConverter.convert(self.dates[:10], None, None)
+        result = stats()["NetCDFTimeConverter.convert"]
+        self.assertEqual((result.calls, result.elements), (2, 110))
+        self.assertGreater(result.seconds, 0)
+
+    def test_converter(self):
+        with instrument():
+            unit = NetCDFTimeConverter.default_units(self.dates, None)
+            NetCDFTimeConverter.axisinfo(unit, None)
+        result = stats()
+        self.assertEqual(result["NetCDFTimeConverter.default_units"].elements, 100)
+        self.assertEqual(result["NetCDFTimeConverter.axisinfo"].calls, 1)
+
+    def test_locator(self):
+        locator = NetCDFTimeDateLocator(5, "noleap")
+        with instrument():
+            ticks = locator.tick_values(0, 100)
+        result = stats()
+        self.assertEqual(
+            result["NetCDFTimeDateLocator.tick_values"][:2], (1, len(ticks))
+        )
+        self.assertEqual(result["NetCDFTimeDateLocator.compute_resolution"].calls, 1)
+
+    def test_formatter(self):
+        formatter = CFTimeFormatter("%Y", "noleap")
+        with instrument():
+            formatter(0)
+            formatter.format_ticks([0, 365, 730])
+        result = stats()
+        self.assertEqual(result["CFTimeFormatter.__call__"][:2], (1, 1))
+        self.assertEqual(result["CFTimeFormatter.format_ticks"][:2], (1, 3))
+
+    def test_reset(self):
+        with instrument():
+            NetCDFTimeConverter.convert(self.dates, None, None)
+        with instrument(reset=False):
+            NetCDFTimeConverter.convert(self.dates, None, None)
+        self.assertEqual(stats()["NetCDFTimeConverter.convert"].calls, 2)
+        with instrument():
+            pass
+        self.assertEqual(stats(), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+"""Unit tests for the shared label cache of the `nc-time-axis` formatters."""
+
+from concurrent.futures import ThreadPoolExecutor
+import unittest
+from unittest import mock
+
+import cftime
+import numpy as np
+
+from nc_time_axis import (
+    _TIME_UNITS,
+    AutoCFTimeFormatter,
+    CFTimeFormatter,
+    _strftime,
+    label_cache_clear,
+    label_cache_info,
+    set_label_cache_size,
+)
+
+
+class Test_label_cache(unittest.TestCase):
+    def setUp(self):
+        label_cache_clear()
+
+    def tearDown(self):
+        set_label_cache_size(_strftime.LABEL_CACHE_SIZE)
+        label_cache_clear()
+
+    def format_ticks(self, formatter, values):
+        with mock.patch(
+            "nc_time_axis._core._strftime.strftime", wraps=_strftime.strftime
+        ) as strftime:
+            result = formatter.format_ticks(values)
+        formatted = [len(call.args[0]) for call in strftime.call_args_list]
+        return result, formatted
+
+    def test_hits(self):
+        formatter = CFTimeFormatter("%Y-%m-%d", "noleap")
+        self.format_ticks(formatter, [0, 7, 14])
+        result, formatted = self.format_ticks(formatter, [7, 14, 21])
+        self.assertEqual(result, ["2000-01-08", "2000-01-15", "2000-01-22"])
+        self.assertEqual(formatted, [1])
+        info = label_cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (2, 4, 4))
+
+    def test_shared_by_formatters(self):
+        CFTimeFormatter("%Y-%m-%d", "noleap").format_ticks([0, 7])
+        formatter = AutoCFTimeFormatter(mock.MagicMock(resolution="DAILY"), "noleap")
+        self.assertEqual(formatter(7), "2000-01-08")
+        self.assertEqual(label_cache_info().hits, 1)
+
+    def test_keyed_by_format_and_calendar(self):
+        CFTimeFormatter("%Y-%m-%d", "noleap").format_ticks([59])
+        self.assertEqual(CFTimeFormatter("%Y-%m", "noleap")(59), "2000-03")
+        self.assertEqual(CFTimeFormatter("%Y-%m-%d", "360_day")(59), "2000-02-30")
+        info = label_cache_info()
+        self.assertEqual((info.hits, info.currsize), (0, 3))
+
+    def test_matches_cftime(self):
+        values = [-1e6, -730120.25, 0, 3661 / 86400, 1e6]
+        dates = cftime.num2date(values, _TIME_UNITS, calendar="julian")
+        expected = [date.strftime("%Y-%m-%d %H:%M") for date in dates]
+        formatter = CFTimeFormatter("%Y-%m-%d %H:%M", "julian")
+        self.assertEqual(formatter.format_ticks(values), expected)
+        self.assertEqual(formatter.format_ticks(values[::-1]), expected[::-1])
+        self.assertEqual([formatter(value) for value in values], expected)
+
+    def test_bounded(self):
+        set_label_cache_size(3)
+        formatter = CFTimeFormatter("%Y-%m-%d", "noleap")
+        formatter.format_ticks(np.arange(10))
+        self.assertEqual(label_cache_info().currsize, 3)
+        _, formatted = self.format_ticks(formatter, [7, 8, 9])
+        self.assertEqual(formatted, [])
+        set_label_cache_size(1)
+        self.assertEqual(label_cache_info().currsize, 1)
+
+    def test_disabled(self):
+        set_label_cache_size(0)
+        formatter = CFTimeFormatter("%Y-%m-%d", "noleap")
+        formatter.format_ticks([0, 7])
+        result, formatted = self.format_ticks(formatter, [0, 7])
+        self.assertEqual(result, ["2000-01-01", "2000-01-08"])
+        self.assertEqual(formatted, [2])
+        self.assertEqual(label_cache_info().currsize, 0)
+
+    def test_clear(self):
+        CFTimeFormatter("%Y", "noleap").format_ticks([0, 365])
+        label_cache_clear()
+        self.assertEqual(label_cache_info(), (0, 0, _strftime.LABEL_CACHE_SIZE, 0))
+
+    def test_threads(self):
+        set_label_cache_size(50)
+        formatter = CFTimeFormatter("%Y-%m-%d", "360_day")
+        values = np.arange(200) * 30
+        dates = cftime.num2date(values, _TIME_UNITS, calendar="360_day")
+        expected = [date.strftime("%Y-%m-%d") for date in dates]
+
+        def render(start):
+            # Overlapping windows of the values, which evict each other.
+            return [
+                formatter.format_ticks(values[offset : offset + 40])
+                for offset in range(start, 160, 7)
+            ]
+
+        with ThreadPoolExecutor(8) as executor:
+            results = list(executor.map(render, range(8)))
+        for start, labels in enumerate(results):
+            for offset, result in zip(range(start, 160, 7), labels, strict=True):
+                self.assertEqual(result, expected[offset : offset + 40])
+        info = label_cache_info()
+        self.assertLessEqual(info.currsize, 50)
+        self.assertEqual(info.hits + info.misses, 40 * sum(map(len, results)))
+
+
+if __name__ == "__main__":
+    unittest.main()
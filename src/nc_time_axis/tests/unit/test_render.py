@@ -0,0 +1,109 @@
+"""Unit tests for the `nc_time_axis.render` batch rendering pipeline."""
+
+import contextlib
+import io
+import json
+from pathlib import Path
+import tempfile
+import unittest
+
+import numpy as np
+
+from nc_time_axis import render
+
+
+class Test(unittest.TestCase):
+    def setUp(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.tmpdir = Path(tmpdir.name)
+        np.save(self.tmpdir / "times.npy", np.arange(0, 3650, 30))
+        np.save(self.tmpdir / "values.npy", np.ones((2, 122)))
+        self.series: list[dict[str, object]] = [
+            {
+                "output": f"{calendar}.png",
+                "times": "times.npy",
+                "units": "days since 2000-01-01",
+                "calendar": calendar,
+                "values": "values.npy",
+                "title": calendar,
+            }
+            for calendar in ("360_day", "noleap", "standard")
+        ]
+
+    def write_manifest(self, name="manifest.json"):
+        path = self.tmpdir / name
+        if path.suffix == ".jsonl":
+            path.write_text("".join(json.dumps(spec) + "\n" for spec in self.series))
+        else:
+            path.write_text(json.dumps(self.series))
+        return path
+
+
+class Test_load_manifest(Test):
+    def test_json(self):
+        series = render.load_manifest(self.write_manifest())
+        self.assertEqual(len(series), 3)
+        self.assertEqual(series[0]["output"], str(self.tmpdir / "360_day.png"))
+        self.assertEqual(series[0]["times"], str(self.tmpdir / "times.npy"))
+
+    def test_json_lines(self):
+        series = render.load_manifest(self.write_manifest("manifest.jsonl"))
+        self.assertEqual(
+            [spec["calendar"] for spec in series], ["360_day", "noleap", "standard"]
+        )
+
+    def test_inline_arrays(self):
+        self.series[0]["times"] = [0, 1, 2]
+        series = render.load_manifest(self.write_manifest())
+        self.assertEqual(series[0]["times"], [0, 1, 2])
+
+
+class Test_render(Test):
+    def test_in_process(self):
+        series = render.load_manifest(self.write_manifest())
+        results = render.render(series, workers=0)
+        self.assertEqual([result.error for result in results], [None] * 3)
+        for spec, result in zip(series, results, strict=True):
+            self.assertEqual(result.output, spec["output"])
+            self.assertTrue(Path(result.output).stat().st_size)
+
+    def test_pool(self):
+        series = render.load_manifest(self.write_manifest())
+        results = render.render(series, workers=2, figsize=(4, 2), dpi=50)
+        self.assertEqual(
+            [result.output for result in results], [spec["output"] for spec in series]
+        )
+        self.assertEqual([result.error for result in results], [None] * 3)
+
+    def test_error(self):
+        self.series[1]["values"] = [1.0]
+        series = render.load_manifest(self.write_manifest())
+        results = render.render(series, workers=0)
+        self.assertIsNone(results[0].error)
+        self.assertIn("ValueError", results[1].error)
+        self.assertFalse(Path(results[1].output).exists())
+
+
+class Test_main(Test):
+    def test_report(self):
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            status = render.main([str(self.write_manifest()), "--workers", "1"])
+        self.assertEqual(status, 0)
+        lines = stdout.getvalue().splitlines()
+        self.assertEqual(len(lines), 5)
+        self.assertTrue(lines[0].endswith("360_day.png  ok"))
+        self.assertTrue(lines[3].startswith("Rendered 3 of 3 figures"))
+
+    def test_failure(self):
+        self.series[0]["units"] = "parsecs"
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            status = render.main([str(self.write_manifest()), "--workers", "1"])
+        self.assertEqual(status, 1)
+        self.assertIn("Rendered 2 of 3 figures", stdout.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()